@@ -8,8 +8,11 @@ The dialer acts like a SIP softphone - it registers with the PBX,
 then originates calls using SIP INVITE with full RTP media support.
 """
 import asyncio
+import atexit
 import logging
+import logging.handlers
 import os
+import queue
 import signal
 import sys
 from datetime import datetime, time as dt_time, timedelta
@@ -76,10 +79,34 @@ except ImportError:
         ConcurrentCallManager = None
         PendingContact = None
 
+# Import voice agent (inbound AI calls)
+try:
+    from dialer.voice_agent.inbound_handler import shutdown_inbound_handler
+    VOICE_AGENT_AVAILABLE = True
+except ImportError:
+    VOICE_AGENT_AVAILABLE = False
+    shutdown_inbound_handler = None
+
 logging.basicConfig(
     level=getattr(logging, os.getenv("LOG_LEVEL", "INFO")),
     format="%(asctime)s - %(name)s - %(levelname)s - %(message)s"
 )
+
+# Voice agent records go through a queue to a background thread, which
+# writes them with the root handlers, so stream writes don't block the
+# event loop during conversation turns. Messages are still formatted on
+# the emitting thread (QueueHandler.prepare); only the I/O moves.
+_log_queue: queue.SimpleQueue = queue.SimpleQueue()
+_log_listener = logging.handlers.QueueListener(
+    _log_queue, *logging.getLogger().handlers, respect_handler_level=True
+)
+_voice_agent_logger = logging.getLogger("dialer.voice_agent")
+_voice_agent_logger.addHandler(logging.handlers.QueueHandler(_log_queue))
+# The listener already writes to the root handlers
+_voice_agent_logger.propagate = False
+_log_listener.start()
+atexit.register(_log_listener.stop)
+
 logger = logging.getLogger(__name__)
 
 
@@ -267,6 +294,7 @@ class DialerEngine:
 
         # Initialize SIP engine
         self.sip_engine = SIPEngine()
+        transport = settings.sip_transport.value if hasattr(settings.sip_transport, 'value') else str(settings.sip_transport)
 
         try:
             # Initialize PJSIP library
@@ -277,14 +305,16 @@ class DialerEngine:
                 rtp_port_start=settings.rtp_port_start,
                 rtp_port_end=settings.rtp_port_end,
                 codecs=self._map_codecs(settings.codecs),
-                log_level=3 if os.getenv("DEBUG") else 2
+                log_level=3 if os.getenv("DEBUG") else 2,
+                transport=transport
             )
 
-            # Register with UCM
+            # Register with UCM, using the transport the engine actually
+            # created (it falls back to UDP if TCP/TLS can't be set up)
             self.sip_engine.register(
                 username=settings.sip_username,
                 password=settings._decrypted_password,
-                transport=settings.sip_transport.value if hasattr(settings.sip_transport, 'value') else str(settings.sip_transport)
+                transport=self.sip_engine.transport_type
             )
 
             # Wait for registration
@@ -306,15 +336,18 @@ class DialerEngine:
             await self._update_connection_status("FAILED", str(e))
             raise
 
+    # Codec names from SIP settings -> PJSUA2 codec IDs
+    _CODEC_MAP = {
+        "ulaw": "PCMU/8000",
+        "alaw": "PCMA/8000",
+        "g722": "G722/16000",
+        "g729": "G729/8000",
+        "gsm": "GSM/8000",
+    }
+
     def _map_codecs(self, codec_list: list) -> list:
         """Map codec names to PJSUA2 format."""
-        codec_map = {
-            "ulaw": "PCMU/8000",
-            "alaw": "PCMA/8000",
-            "g722": "G722/16000",
-            "g729": "G729/8000",
-            "gsm": "GSM/8000",
-        }
+        codec_map = self._CODEC_MAP
         return [codec_map.get(c, c) for c in codec_list]
 
     async def _wait_for_registration(self, timeout: float = 30):
@@ -1018,10 +1051,7 @@ class DialerEngine:
     ):
         """Wait for call to be answered, then execute IVR."""
         # Wait for call to be answered
-        while call.info.state not in (CallState.CONFIRMED, CallState.DISCONNECTED, CallState.FAILED):
-            await asyncio.sleep(0.1)
-
-        if call.info.state != CallState.CONFIRMED:
+        if not await call.wait_confirmed():
             logger.info(f"Call {call.info.call_id} not answered, skipping IVR")
             return
 
@@ -1092,6 +1122,10 @@ class DialerEngine:
             self.sip_engine.shutdown()
             self.sip_engine = None
 
+        # Release the voice agent's audio thread pool and HTTP clients
+        if VOICE_AGENT_AVAILABLE:
+            await shutdown_inbound_handler()
+
         # Update status
         await self._update_connection_status("DISCONNECTED")
 
@@ -68,7 +68,6 @@ class MediaHandler:
         self._audio_player: Optional[Any] = None
         self._playback_state = PlaybackState.IDLE
         self._dtmf_buffer: List[str] = []
-        self._dtmf_event = asyncio.Event()
         self._playback_completed_event = asyncio.Event()
 
         # Register for DTMF callbacks
@@ -77,7 +76,6 @@ class MediaHandler:
     def _on_dtmf_digit(self, digit: str):
         """Internal callback when DTMF digit received."""
         self._dtmf_buffer.append(digit)
-        self._dtmf_event.set()
         logger.debug(f"DTMF digit received: {digit}")
 
     async def play_file(
@@ -133,7 +131,6 @@ class MediaHandler:
                 # Clear DTMF buffer for interrupt detection
                 if allow_dtmf_interrupt:
                     self._dtmf_buffer.clear()
-                    self._dtmf_event.clear()
 
                 # Wait for playback to complete or be interrupted
                 interrupt_digit = await self._wait_for_playback(
@@ -229,9 +226,9 @@ class MediaHandler:
         """
         logger.debug(f"Collecting DTMF: max={max_digits}, timeout={timeout}s")
 
-        # Clear buffer
-        self._dtmf_buffer.clear()
-        self._dtmf_event.clear()
+        # Only digits pressed from here on count
+        self.clear_dtmf_buffer()
+        self.call.clear_dtmf()
 
         collected_digits = []
         start_time = time.time()
@@ -263,46 +260,37 @@ class MediaHandler:
                     max_reached=False
                 )
 
-            # Wait for digit
-            try:
-                await asyncio.wait_for(
-                    self._dtmf_event.wait(),
-                    timeout=min(remaining_inter, timeout - elapsed)
-                )
-
-                # Process received digits
-                while self._dtmf_buffer:
-                    digit = self._dtmf_buffer.pop(0)
-                    last_digit_time = time.time()
-                    first_digit_received = True
-
-                    # Check for termination digit
-                    if digit in termination_digits:
-                        return DTMFCollectionResult(
-                            digits="".join(collected_digits),
-                            timed_out=False,
-                            max_reached=False,
-                            terminated_by=digit
-                        )
-
-                    collected_digits.append(digit)
-
-                    if len(collected_digits) >= max_digits:
-                        return DTMFCollectionResult(
-                            digits="".join(collected_digits),
-                            timed_out=False,
-                            max_reached=True
-                        )
-
-                self._dtmf_event.clear()
-
-            except asyncio.TimeoutError:
+            # Wait for digits
+            digits = await self.call.drain_dtmf(min(remaining_inter, timeout - elapsed))
+            if not digits:
                 return DTMFCollectionResult(
                     digits="".join(collected_digits),
                     timed_out=True,
                     max_reached=False
                 )
 
+            # Process received digits
+            last_digit_time = time.time()
+            first_digit_received = True
+            for digit in digits:
+                # Check for termination digit
+                if digit in termination_digits:
+                    return DTMFCollectionResult(
+                        digits="".join(collected_digits),
+                        timed_out=False,
+                        max_reached=False,
+                        terminated_by=digit
+                    )
+
+                collected_digits.append(digit)
+
+                if len(collected_digits) >= max_digits:
+                    return DTMFCollectionResult(
+                        digits="".join(collected_digits),
+                        timed_out=False,
+                        max_reached=True
+                    )
+
         return DTMFCollectionResult(
             digits="".join(collected_digits),
             timed_out=False,
@@ -312,7 +300,6 @@ class MediaHandler:
     def clear_dtmf_buffer(self):
         """Clear the DTMF buffer."""
         self._dtmf_buffer.clear()
-        self._dtmf_event.clear()
 
     @property
     def dtmf_buffer(self) -> List[str]:
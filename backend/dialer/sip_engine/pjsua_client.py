@@ -14,13 +14,12 @@ The implementation uses PJSUA2 (Python bindings for PJSIP) which provides:
 
 import asyncio
 import logging
-import threading
+import sys
 import time
 import uuid
 from dataclasses import dataclass, field
 from enum import Enum
-from typing import Optional, Dict, Callable, Any, List
-from queue import Queue
+from typing import Optional, Dict, Callable, Any, List, Tuple
 
 logger = logging.getLogger(__name__)
 
@@ -37,7 +36,18 @@ except ImportError:
     pj = None
 
 
-class CallState(Enum):
+# Snapshot of whether debug logging is enabled, refreshed in SIPEngine.initialize().
+# Checked in per-event callbacks to skip building debug-only log arguments.
+_DEBUG = logger.isEnabledFor(logging.DEBUG)
+
+# URI transport parameters appended to SIP URIs for each transport type
+_URI_TRANSPORT_PARAMS = {"TLS": ";transport=tls", "TCP": ";transport=tcp"}
+
+# Digits kept for drain_dtmf(); the oldest are dropped beyond this
+_DTMF_QUEUE_SIZE = 32
+
+
+class CallState(str, Enum):
     """SIP call states."""
     IDLE = "idle"
     CALLING = "calling"
@@ -47,7 +57,7 @@ class CallState(Enum):
     FAILED = "failed"
 
 
-class RegistrationState(Enum):
+class RegistrationState(str, Enum):
     """SIP registration states."""
     UNREGISTERED = "unregistered"
     REGISTERING = "registering"
@@ -56,7 +66,28 @@ class RegistrationState(Enum):
     FAILED = "failed"
 
 
-@dataclass
+# PJSIP constants resolved once for the per-event callbacks.
+# _CALL_STATE_MAP maps PJSIP invite state -> (call state, log label).
+_CALL_STATE_MAP: Dict[int, tuple] = {}
+_TRANSPORT_MAP: Dict[str, int] = {}
+_MEDIA_TYPE_AUDIO = _MEDIA_STATUS_ACTIVE = None
+if PJSUA2_AVAILABLE:
+    _TRANSPORT_MAP = {
+        "UDP": pj.PJSIP_TRANSPORT_UDP,
+        "TCP": pj.PJSIP_TRANSPORT_TCP,
+        "TLS": pj.PJSIP_TRANSPORT_TLS,
+    }
+    _MEDIA_TYPE_AUDIO = pj.PJMEDIA_TYPE_AUDIO
+    _MEDIA_STATUS_ACTIVE = pj.PJSUA_CALL_MEDIA_ACTIVE
+    _CALL_STATE_MAP = {
+        pj.PJSIP_INV_STATE_CALLING: (CallState.CALLING, "Calling..."),
+        pj.PJSIP_INV_STATE_EARLY: (CallState.RINGING, "Ringing"),
+        pj.PJSIP_INV_STATE_CONFIRMED: (CallState.CONFIRMED, "Answered!"),
+        pj.PJSIP_INV_STATE_DISCONNECTED: (CallState.DISCONNECTED, "Disconnected"),
+    }
+
+
+@dataclass(slots=True)
 class SIPCallInfo:
     """Information about an active SIP call."""
     call_id: str
@@ -78,6 +109,8 @@ class SIPAccount:
     with the Grandstream UCM.
     """
 
+    __slots__ = ("engine", "state", "last_error", "_pj_account")
+
     def __init__(self, engine: 'SIPEngine'):
         self.engine = engine
         self.state = RegistrationState.UNREGISTERED
@@ -92,7 +125,10 @@ class SIPAccount:
         # Create account config
         acc_cfg = pj.AccountConfig()
         acc_cfg.idUri = f"sip:{username}@{server}"
-        acc_cfg.regConfig.registrarUri = f"sip:{server}:{port}"
+        if server == self.engine.sip_server and port == self.engine.sip_port:
+            acc_cfg.regConfig.registrarUri = self.engine._registrar_uri
+        else:
+            acc_cfg.regConfig.registrarUri = f"sip:{server}:{port}"
         acc_cfg.regConfig.timeoutSec = 3600
 
         # Add authentication credentials
@@ -114,21 +150,21 @@ class SIPAccount:
 
         if code == 200:
             self.state = RegistrationState.REGISTERED
-            logger.info(f"SIP registration successful: {reason}")
+            logger.info("SIP registration successful: %s", reason)
         elif code == 401 or code == 407:
             # Authentication challenge - PJSUA2 handles this automatically
             self.state = RegistrationState.REGISTERING
-            logger.debug(f"SIP authentication challenge received")
+            logger.debug("SIP authentication challenge received")
         elif code >= 400:
             self.state = RegistrationState.FAILED
             self.last_error = f"{code} {reason}"
-            logger.error(f"SIP registration failed: {code} {reason}")
+            logger.error("SIP registration failed: %s %s", code, reason)
         else:
-            logger.info(f"SIP registration state: {code} {reason}")
+            logger.info("SIP registration state: %s %s", code, reason)
 
     def unregister(self):
         """Unregister from the SIP server."""
-        if self._pj_account and self.state == RegistrationState.REGISTERED:
+        if self._pj_account and self.state is RegistrationState.REGISTERED:
             self.state = RegistrationState.UNREGISTERING
             self._pj_account.setRegistration(False)
 
@@ -149,6 +185,12 @@ class SIPCall:
     - DTMF reception
     """
 
+    __slots__ = (
+        "account", "info", "_pj_call", "_media_handler", "_dtmf_callback",
+        "_audio_slot_idx", "_cached_audio_media", "_loop", "_answered_future",
+        "_dtmf_queue",
+    )
+
     def __init__(self, account: SIPAccount, call_id: str):
         self.account = account
         self.info = SIPCallInfo(
@@ -160,6 +202,21 @@ class SIPCall:
         self._media_handler: Optional[Any] = None
         self._dtmf_callback: Optional[Callable[[str], None]] = None
 
+        # Active audio media, cached by on_call_media_state()
+        self._audio_slot_idx: Optional[int] = None
+        self._cached_audio_media: Optional[Any] = None
+
+        # Resolved from the PJSIP thread via the engine's event loop once the
+        # call is answered (True) or ends without being answered (False)
+        self._loop: Optional[asyncio.AbstractEventLoop] = account.engine._loop
+        self._answered_future: Optional[asyncio.Future] = (
+            self._loop.create_future() if self._loop else None
+        )
+
+        # DTMF digits handed over from the PJSIP thread. Created by the first
+        # drain_dtmf()/clear_dtmf() call; digits are only queued after that
+        self._dtmf_queue: Optional[asyncio.Queue] = None
+
     @property
     def call_id(self) -> str:
         """Get the call ID."""
@@ -179,9 +236,8 @@ class SIPCall:
         self.info.caller_id = caller_id
         self.info.state = CallState.CALLING
 
-        # Build destination URI
-        server = self.account.engine.sip_server
-        dest_uri = f"sip:{destination}@{server}"
+        # Build destination URI from the suffix cached at engine initialization
+        dest_uri = f"sip:{destination}{self.account.engine._uri_suffix}"
 
         # Create call with callback handler
         self._pj_call = _PJCall(self, self.account._pj_account)
@@ -197,47 +253,148 @@ class SIPCall:
 
     def on_call_state(self, info):
         """Callback when call state changes."""
-        state = info.state
-        reason = info.lastReason
-
-        if state == pj.PJSIP_INV_STATE_CALLING:
-            self.info.state = CallState.CALLING
-            logger.info(f"Call {self.info.call_id}: Calling...")
-        elif state == pj.PJSIP_INV_STATE_EARLY:
-            self.info.state = CallState.RINGING
-            logger.info(f"Call {self.info.call_id}: Ringing")
-        elif state == pj.PJSIP_INV_STATE_CONFIRMED:
-            self.info.state = CallState.CONFIRMED
+        entry = _CALL_STATE_MAP.get(info.state)
+        if entry is None:
+            return
+
+        new_state, label = entry
+        self.info.state = new_state
+
+        if new_state is CallState.CONFIRMED:
             self.info.answered_at = time.time()
-            logger.info(f"Call {self.info.call_id}: Answered!")
-        elif state == pj.PJSIP_INV_STATE_DISCONNECTED:
-            self.info.state = CallState.DISCONNECTED
+            self._resolve_answered(True)
+        elif new_state is CallState.DISCONNECTED:
+            reason = info.lastReason
             self.info.ended_at = time.time()
             self.info.hangup_reason = reason
-            logger.info(f"Call {self.info.call_id}: Disconnected - {reason}")
+            self._audio_slot_idx = None
+            self._cached_audio_media = None
+            self._resolve_answered(False)
+            logger.info("Call %s: %s - %s", self.info.call_id, label, reason)
+            return
+
+        logger.info("Call %s: %s", self.info.call_id, label)
+
+    def _resolve_answered(self, answered: bool):
+        """Hand the answer outcome to the event loop (called from the PJSIP thread)."""
+        if self._answered_future is None:
+            return
+        try:
+            self._loop.call_soon_threadsafe(self._set_answered, answered)
+        except RuntimeError:
+            # Event loop already closed (engine shutting down)
+            pass
+
+    def _set_answered(self, answered: bool):
+        """Set the answer outcome. Runs on the event loop thread."""
+        if not self._answered_future.done():
+            self._answered_future.set_result(answered)
+
+    async def wait_confirmed(self) -> bool:
+        """
+        Wait until the call is answered or ends.
+
+        Returns:
+            True if the call was answered, False if it ended first
+        """
+        if self._answered_future is not None:
+            return await asyncio.shield(self._answered_future)
+
+        # No event loop was captured at engine init - fall back to polling
+        while self.info.state not in (CallState.CONFIRMED, CallState.DISCONNECTED, CallState.FAILED):
+            await asyncio.sleep(0.1)
+        return self.info.state is CallState.CONFIRMED
 
     def on_call_media_state(self, info):
         """Callback when call media state changes."""
         if not self._pj_call:
             return
 
-        # Connect audio media to speaker/mic for monitoring (optional)
-        # For auto-dialer, we primarily play audio files
-        call_info = self._pj_call.getInfo()
-
-        for mi in call_info.media:
-            if mi.type == pj.PJMEDIA_TYPE_AUDIO and mi.status == pj.PJSUA_CALL_MEDIA_ACTIVE:
-                # Audio media is active - can play/record audio
-                logger.debug(f"Call {self.info.call_id}: Audio media active")
+        # Media may have been renegotiated (e.g. hold), so drop the old slot.
+        # `info` is the CallInfo fetched by the PJSUA2 callback, so there is
+        # no need to call getInfo() again here.
+        self._audio_slot_idx = None
+        self._cached_audio_media = None
+
+        # Cache the active audio media so get_audio_media() can return it
+        # without re-reading the call info. Indexing the SWIG media vector
+        # builds a wrapper per access, so stop at the first audio stream.
+        media = info.media
+        for i in range(len(media)):
+            mi = media[i]
+            if mi.type != _MEDIA_TYPE_AUDIO:
+                continue
+            if mi.status == _MEDIA_STATUS_ACTIVE:
+                self._audio_slot_idx = i
+                self._cached_audio_media = self._pj_call.getAudioMedia(i)
+                if _DEBUG:
+                    logger.debug("Call %s: Audio media active", self.info.call_id)
+            break
 
     def on_dtmf_digit(self, digit: str):
         """Callback when DTMF digit is received."""
         self.info.dtmf_buffer.append(digit)
-        logger.debug(f"Call {self.info.call_id}: DTMF digit received: {digit}")
+        if _DEBUG:
+            logger.debug("Call %s: DTMF digit received: %s", self.info.call_id, digit)
+
+        # Hand the digit to the event loop so the PJSIP thread returns
+        # immediately instead of running consumer code inline
+        if self._loop is not None:
+            try:
+                self._loop.call_soon_threadsafe(self._dispatch_dtmf, digit)
+                return
+            except RuntimeError:
+                # Event loop already closed - fall through to the direct call
+                pass
 
         if self._dtmf_callback:
             self._dtmf_callback(digit)
 
+    def _get_dtmf_queue(self) -> asyncio.Queue:
+        """Get the DTMF queue, creating it on first use."""
+        if self._dtmf_queue is None:
+            self._dtmf_queue = asyncio.Queue(maxsize=_DTMF_QUEUE_SIZE)
+        return self._dtmf_queue
+
+    def _dispatch_dtmf(self, digit: str):
+        """Deliver a DTMF digit to consumers. Runs on the event loop thread."""
+        queue = self._dtmf_queue
+        if queue is not None:
+            if queue.full():
+                queue.get_nowait()
+            queue.put_nowait(digit)
+        if self._dtmf_callback:
+            self._dtmf_callback(digit)
+
+    def clear_dtmf(self):
+        """Discard queued DTMF digits (and start queueing for drain_dtmf())."""
+        queue = self._get_dtmf_queue()
+        while not queue.empty():
+            queue.get_nowait()
+
+    async def drain_dtmf(self, timeout: float) -> List[str]:
+        """
+        Wait for DTMF input and return all digits received so far.
+
+        Digits are queued from the first drain_dtmf() or clear_dtmf() call
+        on, and only when the engine was initialized on an event loop.
+
+        Args:
+            timeout: Seconds to wait for the first digit
+
+        Returns:
+            Digits in the order received (empty if the timeout expired)
+        """
+        queue = self._get_dtmf_queue()
+        try:
+            digits = [await asyncio.wait_for(queue.get(), timeout)]
+        except asyncio.TimeoutError:
+            return []
+
+        while not queue.empty():
+            digits.append(queue.get_nowait())
+        return digits
+
     def set_dtmf_callback(self, callback: Callable[[str], None]):
         """Set callback for DTMF digit reception."""
         self._dtmf_callback = callback
@@ -254,15 +411,21 @@ class SIPCall:
             finally:
                 self.info.state = CallState.DISCONNECTED
                 self.info.ended_at = time.time()
+                self._resolve_answered(False)
 
     def get_audio_media(self):
         """Get the audio media for this call."""
         if not self._pj_call:
             return None
 
-        call_info = self._pj_call.getInfo()
-        for i, mi in enumerate(call_info.media):
-            if mi.type == pj.PJMEDIA_TYPE_AUDIO and mi.status == pj.PJSUA_CALL_MEDIA_ACTIVE:
+        if self._cached_audio_media is not None:
+            return self._cached_audio_media
+
+        # Media state callback hasn't fired yet - look it up directly
+        media = self._pj_call.getInfo().media
+        for i in range(len(media)):
+            mi = media[i]
+            if mi.type == _MEDIA_TYPE_AUDIO and mi.status == _MEDIA_STATUS_ACTIVE:
                 return self._pj_call.getAudioMedia(i)
         return None
 
@@ -275,13 +438,18 @@ class SIPEngine:
     account registration and call handling.
     """
 
+    __slots__ = (
+        "_endpoint", "_transport", "_account", "_calls", "_initialized", "_running",
+        "sip_server", "sip_port", "local_port", "rtp_port_start", "rtp_port_end",
+        "codecs", "transport_type", "_loop", "_uri_suffix", "_registrar_uri",
+    )
+
     def __init__(self):
         self._endpoint: Optional[Any] = None
         self._transport: Optional[Any] = None
         self._account: Optional[SIPAccount] = None
         self._calls: Dict[str, SIPCall] = {}
         self._initialized = False
-        self._pjsua_thread: Optional[threading.Thread] = None
         self._running = False
 
         # Configuration
@@ -290,13 +458,23 @@ class SIPEngine:
         self.local_port = 5061
         self.rtp_port_start = 10000
         self.rtp_port_end = 20000
-        self.codecs = ["PCMU/8000", "PCMA/8000", "G722/16000"]
+        self.codecs: Tuple[str, ...] = tuple(
+            sys.intern(c) for c in ("PCMU/8000", "PCMA/8000", "G722/16000")
+        )
+        self.transport_type = "UDP"
+
+        # Event loop that PJSIP callbacks are bridged into, captured in initialize()
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+
+        # URI parts derived from configuration, precomputed in initialize()
+        self._uri_suffix = ""
+        self._registrar_uri = ""
 
     @property
     def is_registered(self) -> bool:
         """Check if currently registered with SIP server."""
         return (self._account is not None and
-                self._account.state == RegistrationState.REGISTERED)
+                self._account.state is RegistrationState.REGISTERED)
 
     @property
     def registration_state(self) -> RegistrationState:
@@ -313,7 +491,8 @@ class SIPEngine:
         rtp_port_start: int = 10000,
         rtp_port_end: int = 20000,
         codecs: Optional[List[str]] = None,
-        log_level: int = 3
+        log_level: int = 3,
+        transport: str = "UDP"
     ):
         """
         Initialize the PJSIP library and endpoint.
@@ -326,6 +505,7 @@ class SIPEngine:
             rtp_port_end: End of RTP port range
             codecs: List of codecs to enable
             log_level: PJSIP log level (0-6)
+            transport: SIP transport to create (UDP, TCP, TLS); falls back to UDP
         """
         if not PJSUA2_AVAILABLE:
             raise RuntimeError(
@@ -337,13 +517,22 @@ class SIPEngine:
             logger.warning("SIP engine already initialized")
             return
 
+        global _DEBUG
+        _DEBUG = logger.isEnabledFor(logging.DEBUG)
+
+        try:
+            self._loop = asyncio.get_running_loop()
+        except RuntimeError:
+            self._loop = None
+
         self.sip_server = sip_server
         self.sip_port = sip_port
         self.local_port = local_port
         self.rtp_port_start = rtp_port_start
         self.rtp_port_end = rtp_port_end
         if codecs:
-            self.codecs = codecs
+            self.codecs = tuple(sys.intern(c) for c in codecs)
+        self.transport_type = transport.upper() if transport.upper() in _TRANSPORT_MAP else "UDP"
 
         logger.info(f"Initializing SIP engine for {sip_server}:{sip_port}")
 
@@ -356,6 +545,12 @@ class SIPEngine:
         ep_cfg.logConfig.level = log_level
         ep_cfg.logConfig.consoleLevel = log_level
 
+        # Let PJSIP's own worker thread poll the ioqueue. It blocks in the
+        # ioqueue until there is network or timer work, so no Python-side
+        # libHandleEvents() pump (and its idle wakeups) is needed.
+        ep_cfg.uaConfig.threadCnt = 1
+        ep_cfg.uaConfig.mainThreadOnly = False
+
         # Media config
         ep_cfg.medConfig.clockRate = 8000
         ep_cfg.medConfig.sndClockRate = 8000
@@ -378,10 +573,23 @@ class SIPEngine:
         except Exception as e:
             logger.warning(f"Could not set null audio device: {e}")
 
-        # Create UDP transport
+        # Create SIP transport, falling back to UDP if the requested one fails
         tp_cfg = pj.TransportConfig()
         tp_cfg.port = local_port
-        self._transport = self._endpoint.transportCreate(pj.PJSIP_TRANSPORT_UDP, tp_cfg)
+        proto = _TRANSPORT_MAP[self.transport_type]
+        try:
+            self._transport = self._endpoint.transportCreate(proto, tp_cfg)
+        except Exception as e:
+            if proto == pj.PJSIP_TRANSPORT_UDP:
+                raise
+            logger.warning(f"Could not create {self.transport_type} transport, using UDP: {e}")
+            self.transport_type = "UDP"
+            self._transport = self._endpoint.transportCreate(pj.PJSIP_TRANSPORT_UDP, tp_cfg)
+
+        # These only depend on configuration, so build them once rather than per call
+        transport_param = _URI_TRANSPORT_PARAMS.get(self.transport_type, "")
+        self._uri_suffix = f"@{sip_server}:{sip_port}{transport_param}"
+        self._registrar_uri = f"sip:{sip_server}:{sip_port}{transport_param}"
 
         # Start the library
         self._endpoint.libStart()
@@ -399,20 +607,32 @@ class SIPEngine:
         if not self._endpoint:
             return
 
-        # Disable all codecs first
+        set_priority = self._endpoint.codecSetPriority
+
+        # Disable unwanted codecs first. PJSIP codec IDs carry a channel
+        # suffix (e.g. "PCMU/8000/1"), so preferred codecs are matched by
+        # prefix. Codecs that are already disabled or about to be re-enabled
+        # are skipped to avoid needless calls into the library.
         codec_infos = self._endpoint.codecEnum2()
         for ci in codec_infos:
-            self._endpoint.codecSetPriority(ci.codecId, 0)
+            if ci.priority and not ci.codecId.startswith(self.codecs):
+                set_priority(ci.codecId, 0)
 
-        # Enable preferred codecs with priority
+        # Enable preferred codecs with priority. The summary list is only
+        # collected when it will actually be logged.
+        enabled_codecs: Optional[List[str]] = [] if logger.isEnabledFor(logging.INFO) else None
         priority = 255
         for codec in self.codecs:
             try:
-                self._endpoint.codecSetPriority(codec, priority)
+                set_priority(codec, priority)
                 priority -= 1
-                logger.debug(f"Enabled codec: {codec}")
+                if enabled_codecs is not None:
+                    enabled_codecs.append(codec)
             except Exception as e:
-                logger.warning(f"Could not enable codec {codec}: {e}")
+                logger.warning("Could not enable codec %s: %s", codec, e)
+
+        if enabled_codecs is not None:
+            logger.info("Enabled codecs: %s", ", ".join(enabled_codecs))
 
     def register(
         self,
@@ -0,0 +1,88 @@
+/*
+ * G.711 u-law codec kernels for the optional _g711_cffi extension.
+ *
+ * Encoding uses a full-range table (one entry per int16 value), so each
+ * sample is a single indexed load. The table is built on first use from
+ * the same segment search as audio_converter.linear_to_ulaw.
+ *
+ * Build with: python -m dialer.voice_agent._g711_build
+ */
+#include <stddef.h>
+#include <stdint.h>
+
+#define ULAW_BIAS 0x84
+#define ULAW_CLIP 32635
+
+void g711_simd_init(const int16_t *table);
+
+static uint8_t ulaw_encode_lut[65536];
+static int16_t ulaw_decode_lut[256];
+static int g711_ready = 0;
+
+static uint8_t linear_to_ulaw(int sample)
+{
+    int sign = 0;
+    int exponent = 7;
+    int exp_mask = 0x4000;
+    int mantissa;
+
+    if (sample < 0) {
+        sign = 0x80;
+        sample = -sample;
+    }
+    if (sample > ULAW_CLIP)
+        sample = ULAW_CLIP;
+    sample += ULAW_BIAS;
+
+    while (exponent > 0 && !(sample & exp_mask)) {
+        exponent--;
+        exp_mask >>= 1;
+    }
+
+    mantissa = (sample >> (exponent + 3)) & 0x0F;
+    return (uint8_t)(~(sign | (exponent << 4) | mantissa) & 0xFF);
+}
+
+static int16_t ulaw_to_linear(uint8_t ulaw)
+{
+    int sample = ~ulaw;
+    int sign = sample & 0x80;
+    int exponent = (sample & 0x70) >> 4;
+    int mantissa = sample & 0x0F;
+    int linear = (((mantissa << 3) + ULAW_BIAS) << exponent) - ULAW_BIAS;
+
+    return (int16_t)(sign ? -linear : linear);
+}
+
+void g711_init(void)
+{
+    int i;
+
+    if (g711_ready)
+        return;
+
+    /* Indexed by the sample's bit pattern as uint16 */
+    for (i = -32768; i < 32768; i++)
+        ulaw_encode_lut[(uint16_t)i] = linear_to_ulaw(i);
+    for (i = 0; i < 256; i++)
+        ulaw_decode_lut[i] = ulaw_to_linear((uint8_t)i);
+    g711_simd_init(ulaw_decode_lut);
+
+    g711_ready = 1;
+}
+
+void ulaw_encode(const int16_t *in, uint8_t *out, size_t n)
+{
+    size_t i;
+
+    for (i = 0; i < n; i++)
+        out[i] = ulaw_encode_lut[(uint16_t)in[i]];
+}
+
+void ulaw_decode(const uint8_t *in, int16_t *out, size_t n)
+{
+    size_t i;
+
+    for (i = 0; i < n; i++)
+        out[i] = ulaw_decode_lut[in[i]];
+}
@@ -0,0 +1,71 @@
+"""
+cffi build script for the optional _g711_cffi extension.
+
+Compiles _g711.c and _g711_simd.c into dialer/voice_agent/_g711_cffi.*.so, which
+audio_converter picks up automatically when present. Run from the
+backend directory (requires cffi and a C compiler):
+
+    python -m dialer.voice_agent._g711_build
+
+The dialer-engine image builds it in its builder stage
+(docker/dialer-engine/Dockerfile).
+"""
+import importlib.util
+import shutil
+import tempfile
+from pathlib import Path
+
+from cffi import FFI
+
+PACKAGE_DIR = Path(__file__).resolve().parent
+
+ffibuilder = FFI()
+
+CDEFS = """
+    void g711_init(void);
+    void ulaw_encode(const int16_t *in, uint8_t *out, size_t n);
+    void ulaw_decode(const uint8_t *in, int16_t *out, size_t n);
+    void ulaw_decode_simd(const uint8_t *in, int16_t *out, size_t n);
+"""
+
+ffibuilder.cdef(CDEFS)
+
+ffibuilder.set_source(
+    "dialer.voice_agent._g711_cffi",
+    CDEFS,
+    sources=[str(PACKAGE_DIR / "_g711.c"), str(PACKAGE_DIR / "_g711_simd.c")],
+    extra_compile_args=["-O3"],
+)
+
+
+def check(path: Path):
+    """
+    Check the built SIMD u-law decoder against the scalar one.
+
+    Covers every byte value at lengths around each kernel's block size,
+    so a broken kernel or tail loop fails the build instead of corrupting
+    audio. Only the kernel picked for the build machine's CPU is run.
+    """
+    spec = importlib.util.spec_from_file_location("dialer.voice_agent._g711_cffi", path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    ffi, lib = module.ffi, module.lib
+    lib.g711_init()
+
+    data = bytes(range(256)) * 3
+    for n in list(range(0, 70)) + [255, 256, 257, len(data)]:
+        expected = ffi.new("int16_t[]", max(n, 1))
+        actual = ffi.new("int16_t[]", max(n, 1))
+        lib.ulaw_decode(data, expected, n)
+        lib.ulaw_decode_simd(data, actual, n)
+        if ffi.buffer(expected)[:n * 2] != ffi.buffer(actual)[:n * 2]:
+            raise SystemExit(f"ulaw_decode_simd differs from ulaw_decode for n={n}")
+
+
+if __name__ == "__main__":
+    with tempfile.TemporaryDirectory() as tmpdir:
+        built = ffibuilder.compile(tmpdir=tmpdir)
+        target = PACKAGE_DIR / Path(built).name
+        shutil.copy(built, target)
+    check(target)
+    print(f"Built {target}")
@@ -0,0 +1,185 @@
+/*
+ * SIMD u-law decode kernels for the optional _g711_cffi extension.
+ *
+ * Each input byte is widened to a 16-bit lane and decoded with the same
+ * arithmetic as the scalar table builder:
+ *
+ *     magnitude = (((mantissa << 3) + BIAS) << exponent) - BIAS
+ *
+ * SSE/AVX2 have no per-lane 16-bit variable shift, so the shift is done as
+ * a multiply by 1 << exponent, with the power of two fetched by pshufb from
+ * an 8-entry in-register table. The sign is applied with psignw.
+ *
+ * On AArch64 the table is instead held in registers: its low and high
+ * bytes form two 256-byte planes, each loaded as four 64-byte vqtbl4q_u8
+ * tables, and the looked-up bytes are zipped back into int16 samples.
+ *
+ * x86 kernels are compiled with per-function target attributes and picked
+ * at runtime, so the extension still loads on CPUs without SSSE3/AVX2.
+ */
+#include <stddef.h>
+#include <stdint.h>
+
+void ulaw_decode(const uint8_t *in, int16_t *out, size_t n);
+
+typedef void (*ulaw_decode_fn)(const uint8_t *in, int16_t *out, size_t n);
+
+static ulaw_decode_fn ulaw_decode_impl = ulaw_decode;
+
+#if (defined(__x86_64__) || defined(__i386__)) && defined(__GNUC__)
+#define G711_HAVE_X86 1
+#include <immintrin.h>
+
+#define ULAW_BIAS 0x84
+
+__attribute__((target("ssse3")))
+static inline __m128i ulaw_decode8_ssse3(__m128i t)
+{
+    /* t holds 8 complemented u-law bytes zero-extended to 16 bits */
+    const __m128i pow2 = _mm_setr_epi8(1, 2, 4, 8, 16, 32, 64, (char)128,
+                                       0, 0, 0, 0, 0, 0, 0, 0);
+    const __m128i low_byte = _mm_set1_epi16(0x00FF);
+    const __m128i bias = _mm_set1_epi16(ULAW_BIAS);
+    __m128i exponent = _mm_and_si128(_mm_srli_epi16(t, 4), _mm_set1_epi16(7));
+    __m128i mantissa = _mm_and_si128(t, _mm_set1_epi16(0x0F));
+    __m128i scale = _mm_and_si128(_mm_shuffle_epi8(pow2, exponent), low_byte);
+    __m128i mag = _mm_sub_epi16(
+        _mm_mullo_epi16(_mm_add_epi16(_mm_slli_epi16(mantissa, 3), bias), scale),
+        bias);
+
+    /* Bit 7 of t (the sign) becomes bit 15, so negative lanes negate mag */
+    return _mm_sign_epi16(mag, _mm_or_si128(_mm_slli_epi16(t, 8),
+                                            _mm_set1_epi16(1)));
+}
+
+__attribute__((target("ssse3")))
+static void ulaw_decode_ssse3(const uint8_t *in, int16_t *out, size_t n)
+{
+    const __m128i zero = _mm_setzero_si128();
+    const __m128i ones = _mm_set1_epi8((char)0xFF);
+    size_t i = 0;
+
+    for (; i + 16 <= n; i += 16) {
+        __m128i t = _mm_xor_si128(_mm_loadu_si128((const __m128i *)(in + i)),
+                                  ones);
+        _mm_storeu_si128((__m128i *)(out + i),
+                         ulaw_decode8_ssse3(_mm_unpacklo_epi8(t, zero)));
+        _mm_storeu_si128((__m128i *)(out + i + 8),
+                         ulaw_decode8_ssse3(_mm_unpackhi_epi8(t, zero)));
+    }
+
+    ulaw_decode(in + i, out + i, n - i);
+}
+
+__attribute__((target("avx2")))
+static void ulaw_decode_avx2(const uint8_t *in, int16_t *out, size_t n)
+{
+    /* pshufb is per 128-bit lane, so the table is repeated in both */
+    const __m256i pow2 = _mm256_setr_epi8(
+        1, 2, 4, 8, 16, 32, 64, (char)128, 0, 0, 0, 0, 0, 0, 0, 0,
+        1, 2, 4, 8, 16, 32, 64, (char)128, 0, 0, 0, 0, 0, 0, 0, 0);
+    const __m256i low_byte = _mm256_set1_epi16(0x00FF);
+    const __m256i seven = _mm256_set1_epi16(7);
+    const __m256i low_nibble = _mm256_set1_epi16(0x0F);
+    const __m256i bias = _mm256_set1_epi16(ULAW_BIAS);
+    const __m256i one = _mm256_set1_epi16(1);
+    const __m256i ones = _mm256_set1_epi16(0x00FF);
+    size_t i = 0;
+
+    for (; i + 16 <= n; i += 16) {
+        __m256i t = _mm256_xor_si256(
+            _mm256_cvtepu8_epi16(_mm_loadu_si128((const __m128i *)(in + i))),
+            ones);
+        __m256i exponent = _mm256_and_si256(_mm256_srli_epi16(t, 4), seven);
+        __m256i mantissa = _mm256_and_si256(t, low_nibble);
+        __m256i scale = _mm256_and_si256(_mm256_shuffle_epi8(pow2, exponent),
+                                         low_byte);
+        __m256i mag = _mm256_sub_epi16(
+            _mm256_mullo_epi16(
+                _mm256_add_epi16(_mm256_slli_epi16(mantissa, 3), bias), scale),
+            bias);
+
+        _mm256_storeu_si256(
+            (__m256i *)(out + i),
+            _mm256_sign_epi16(mag, _mm256_or_si256(_mm256_slli_epi16(t, 8),
+                                                   one)));
+    }
+
+    ulaw_decode(in + i, out + i, n - i);
+}
+
+#elif defined(__aarch64__)
+#define G711_HAVE_NEON 1
+#include <arm_neon.h>
+#ifdef __linux__
+#include <sys/auxv.h>
+#include <asm/hwcap.h>
+#endif
+
+static uint8_t lo_plane[256];
+static uint8_t hi_plane[256];
+static uint8x16x4_t lo_tbl[4];
+static uint8x16x4_t hi_tbl[4];
+
+static void ulaw_decode_neon(const uint8_t *in, int16_t *out, size_t n)
+{
+    const uint8x16_t step = vdupq_n_u8(64);
+    size_t i = 0;
+    int k;
+
+    for (; i + 16 <= n; i += 16) {
+        uint8x16_t idx = vld1q_u8(in + i);
+        uint8x16_t lo = vqtbl4q_u8(lo_tbl[0], idx);
+        uint8x16_t hi = vqtbl4q_u8(hi_tbl[0], idx);
+
+        /* Indices outside 0..63 leave the lane unchanged in vqtbx4q_u8 */
+        for (k = 1; k < 4; k++) {
+            idx = vsubq_u8(idx, step);
+            lo = vqtbx4q_u8(lo, lo_tbl[k], idx);
+            hi = vqtbx4q_u8(hi, hi_tbl[k], idx);
+        }
+
+        vst1q_s16(out + i, vreinterpretq_s16_u8(vzip1q_u8(lo, hi)));
+        vst1q_s16(out + i + 8, vreinterpretq_s16_u8(vzip2q_u8(lo, hi)));
+    }
+
+    ulaw_decode(in + i, out + i, n - i);
+}
+#endif
+
+void g711_simd_init(const int16_t *table)
+{
+#if defined(G711_HAVE_X86)
+    (void)table;
+    __builtin_cpu_init();
+    if (__builtin_cpu_supports("avx2"))
+        ulaw_decode_impl = ulaw_decode_avx2;
+    else if (__builtin_cpu_supports("ssse3"))
+        ulaw_decode_impl = ulaw_decode_ssse3;
+#elif defined(G711_HAVE_NEON)
+    int i, j;
+
+#ifdef __linux__
+    if (!(getauxval(AT_HWCAP) & HWCAP_ASIMD))
+        return;
+#endif
+    for (i = 0; i < 256; i++) {
+        lo_plane[i] = (uint8_t)((uint16_t)table[i] & 0xFF);
+        hi_plane[i] = (uint8_t)((uint16_t)table[i] >> 8);
+    }
+    for (i = 0; i < 4; i++) {
+        for (j = 0; j < 4; j++) {
+            lo_tbl[i].val[j] = vld1q_u8(lo_plane + 64 * i + 16 * j);
+            hi_tbl[i].val[j] = vld1q_u8(hi_plane + 64 * i + 16 * j);
+        }
+    }
+    ulaw_decode_impl = ulaw_decode_neon;
+#else
+    (void)table;
+#endif
+}
+
+void ulaw_decode_simd(const uint8_t *in, int16_t *out, size_t n)
+{
+    ulaw_decode_impl(in, out, n);
+}
@@ -2,6 +2,8 @@
 Audio format conversion utilities.
 """
 import struct
+import warnings
+from array import array
 import wave
 from io import BytesIO
 from typing import Tuple
@@ -9,6 +11,55 @@ import logging
 
 logger = logging.getLogger(__name__)
 
+# audioop provides C implementations of the G.711 codecs. It is deprecated
+# and removed in Python 3.13, where the audioop-lts package provides it.
+try:
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore", DeprecationWarning)
+        import audioop
+    AUDIOOP_AVAILABLE = True
+except ImportError:
+    AUDIOOP_AVAILABLE = False
+    audioop = None
+
+# NumPy is optional; without it conversions fall back to pure Python loops
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+    np = None
+
+# soxr (libsoxr bindings) provides a polyphase resampler; optional
+try:
+    import soxr
+    SOXR_AVAILABLE = True
+except ImportError:
+    SOXR_AVAILABLE = False
+    soxr = None
+
+# PyAV (FFmpeg bindings) decodes compressed TTS output such as Opus; optional
+try:
+    import av
+    AV_AVAILABLE = True
+except ImportError:
+    AV_AVAILABLE = False
+    av = None
+
+# C table-lookup G.711 codec built by _g711_build.py; optional
+try:
+    from dialer.voice_agent._g711_cffi import ffi as _g711_ffi, lib as _g711_lib
+    _g711_lib.g711_init()
+    G711_EXT_AVAILABLE = True
+except ImportError:
+    G711_EXT_AVAILABLE = False
+    _g711_ffi = None
+    _g711_lib = None
+
+# "LQ" is the lowest soxr setting that uses a polyphase filter with 16-bit
+# precision; "QQ" is plain cubic interpolation without anti-alias filtering.
+_SOXR_QUALITY = "LQ"
+
 # G.711 u-law encoding/decoding tables
 ULAW_BIAS = 0x84
 ULAW_CLIP = 32635
@@ -28,6 +79,18 @@ for i in range(256):
     ULAW_TO_LINEAR.append(linear)
 
 
+def _frozen_int16_table(values: list) -> "np.ndarray":
+    """Build a contiguous, read-only int16 array from a decode table."""
+    table = np.ascontiguousarray(values, dtype=np.int16)
+    table.flags.writeable = False
+    return table
+
+
+# int16 copy of the table for vectorized decoding (gather runs in C).
+# The list stays the source of truth and is faster for scalar lookups.
+ULAW_TO_LINEAR_NP = _frozen_int16_table(ULAW_TO_LINEAR) if NUMPY_AVAILABLE else None
+
+
 def ulaw_to_linear(ulaw_byte: int) -> int:
     """Convert single u-law byte to linear 16-bit sample."""
     return ULAW_TO_LINEAR[ulaw_byte]
@@ -73,10 +136,14 @@ def ulaw_to_pcm16(ulaw_bytes: bytes) -> bytes:
     Returns:
         16-bit PCM audio data
     """
-    samples = []
-    for byte in ulaw_bytes:
-        samples.append(ulaw_to_linear(byte))
-    return struct.pack(f'{len(samples)}h', *samples)
+    if G711_EXT_AVAILABLE:
+        return _ulaw_to_pcm16_ext(ulaw_bytes)
+    if AUDIOOP_AVAILABLE:
+        return audioop.ulaw2lin(ulaw_bytes, 2)
+    if NUMPY_AVAILABLE:
+        return ULAW_TO_LINEAR_NP[np.frombuffer(ulaw_bytes, dtype=np.uint8)].tobytes()
+
+    return array('h', [ULAW_TO_LINEAR[b] for b in ulaw_bytes]).tobytes()
 
 
 def pcm16_to_ulaw(pcm_bytes: bytes) -> bytes:
@@ -89,10 +156,57 @@ def pcm16_to_ulaw(pcm_bytes: bytes) -> bytes:
     Returns:
         u-law encoded audio data
     """
-    num_samples = len(pcm_bytes) // 2
-    samples = struct.unpack(f'{num_samples}h', pcm_bytes)
-    ulaw_bytes = bytes([linear_to_ulaw(s) for s in samples])
-    return ulaw_bytes
+    if G711_EXT_AVAILABLE:
+        return _pcm16_to_ulaw_ext(pcm_bytes)
+    if AUDIOOP_AVAILABLE:
+        return audioop.lin2ulaw(pcm_bytes, 2)
+    if NUMPY_AVAILABLE:
+        return _pcm16_to_ulaw_np(pcm_bytes)
+
+    samples = array('h')
+    samples.frombytes(pcm_bytes[:len(pcm_bytes) // 2 * 2])
+    return bytes([linear_to_ulaw(s) for s in samples])
+
+
+def _ulaw_to_pcm16_ext(ulaw_bytes: bytes) -> bytes:
+    """Decode u-law through the _g711_cffi extension."""
+    n = len(ulaw_bytes)
+    out = bytearray(n * 2)
+    _g711_lib.ulaw_decode_simd(
+        _g711_ffi.from_buffer("uint8_t[]", ulaw_bytes),
+        _g711_ffi.from_buffer("int16_t[]", out),
+        n,
+    )
+    return bytes(out)
+
+
+def _pcm16_to_ulaw_ext(pcm_bytes: bytes) -> bytes:
+    """Encode 16-bit PCM through the _g711_cffi extension."""
+    n = len(pcm_bytes) // 2
+    out = bytearray(n)
+    _g711_lib.ulaw_encode(
+        _g711_ffi.from_buffer("int16_t[]", pcm_bytes[:n * 2]),
+        _g711_ffi.from_buffer("uint8_t[]", out),
+        n,
+    )
+    return bytes(out)
+
+
+def _pcm16_to_ulaw_np(pcm_bytes: bytes) -> bytes:
+    """
+    Vectorized equivalent of linear_to_ulaw over a whole buffer.
+
+    The exponent search is replaced by frexp: for the biased magnitude s,
+    frexp gives s = m * 2**e with m in [0.5, 1), so the segment number is
+    e - 8 (the position of the highest set bit above bit 7).
+    """
+    s = np.frombuffer(pcm_bytes, dtype=np.int16).astype(np.int32)
+    sign = np.where(s < 0, 0x80, 0).astype(np.uint8)
+    s = np.minimum(np.abs(s), ULAW_CLIP) + ULAW_BIAS
+    exponent = np.clip(np.frexp(s.astype(np.float32))[1] - 8, 0, 7)
+    mantissa = (s >> (exponent + 3)) & 0x0F
+    ulaw = ~(sign | (exponent << 4).astype(np.uint8) | mantissa.astype(np.uint8))
+    return ulaw.astype(np.uint8).tobytes()
 
 
 def resample(
@@ -102,7 +216,10 @@ def resample(
     sample_width: int = 2
 ) -> bytes:
     """
-    Simple linear interpolation resampling.
+    Resample audio to a new sample rate.
+
+    Uses soxr's polyphase filter for 16-bit audio when available, otherwise
+    linear interpolation.
 
     Args:
         audio_bytes: Input audio data
@@ -116,10 +233,17 @@ def resample(
     if from_rate == to_rate:
         return audio_bytes
 
+    if SOXR_AVAILABLE and sample_width == 2:
+        samples = np.frombuffer(audio_bytes, dtype=np.int16, count=len(audio_bytes) // 2)
+        return soxr.resample(samples, from_rate, to_rate, quality=_SOXR_QUALITY).tobytes()
+    if NUMPY_AVAILABLE:
+        return _resample_np(audio_bytes, from_rate, to_rate, sample_width)
+
     # Unpack samples
     num_samples = len(audio_bytes) // sample_width
     if sample_width == 2:
-        samples = list(struct.unpack(f'{num_samples}h', audio_bytes))
+        samples = array('h')
+        samples.frombytes(audio_bytes[:num_samples * 2])
     elif sample_width == 1:
         samples = list(audio_bytes)
     else:
@@ -129,25 +253,55 @@ def resample(
     ratio = to_rate / from_rate
     new_length = int(len(samples) * ratio)
 
+    # Output buffer is allocated once and filled in place
+    if sample_width == 2:
+        resampled = array('h', bytes(new_length * 2))
+    else:
+        resampled = bytearray(new_length)
+
     # Linear interpolation
-    resampled = []
+    num_samples = len(samples)
     for i in range(new_length):
         src_pos = i / ratio
         src_idx = int(src_pos)
         frac = src_pos - src_idx
 
-        if src_idx + 1 < len(samples):
-            sample = int(samples[src_idx] * (1 - frac) + samples[src_idx + 1] * frac)
-        else:
-            sample = samples[src_idx] if src_idx < len(samples) else 0
+        if src_idx + 1 < num_samples:
+            resampled[i] = int(samples[src_idx] * (1 - frac) + samples[src_idx + 1] * frac)
+        elif src_idx < num_samples:
+            resampled[i] = samples[src_idx]
 
-        resampled.append(sample)
+    return resampled.tobytes() if sample_width == 2 else bytes(resampled)
 
-    # Pack samples
+
+def _resample_np(
+    audio_bytes: bytes,
+    from_rate: int,
+    to_rate: int,
+    sample_width: int
+) -> bytes:
+    """Linear interpolation resampling with np.interp (same output as the loop)."""
     if sample_width == 2:
-        return struct.pack(f'{len(resampled)}h', *resampled)
+        dtype = np.int16
+    elif sample_width == 1:
+        # 8-bit PCM is unsigned, so interpolate the raw 0-255 values
+        dtype = np.uint8
     else:
-        return bytes(resampled)
+        raise ValueError(f"Unsupported sample width: {sample_width}")
+
+    samples = np.frombuffer(audio_bytes, dtype=dtype, count=len(audio_bytes) // sample_width)
+    ratio = to_rate / from_rate
+    new_length = int(len(samples) * ratio)
+    if new_length == 0:
+        return b""
+
+    positions = np.arange(new_length) / ratio
+    resampled = np.interp(positions, np.arange(len(samples)), samples)
+    # Saturate in place before narrowing so out-of-range values can never
+    # wrap around; astype then truncates toward zero like int() in the loop
+    limits = np.iinfo(dtype)
+    np.clip(resampled, limits.min, limits.max, out=resampled)
+    return resampled.astype(dtype).tobytes()
 
 
 def convert_for_whisper(
@@ -168,23 +322,25 @@ def convert_for_whisper(
     Returns:
         Tuple of (converted audio bytes, sample rate)
     """
+    target_rate = 16000
+
     # Convert to PCM16 if needed
     if source_format == "ulaw":
         pcm_bytes = ulaw_to_pcm16(audio_bytes)
     elif source_format == "alaw":
-        # A-law conversion (simplified - for proper implementation use audioop)
         pcm_bytes = alaw_to_pcm16(audio_bytes)
     elif source_format == "pcm16":
         pcm_bytes = audio_bytes
     elif source_format == "pcm8":
         # Convert 8-bit to 16-bit
-        samples = [(b - 128) * 256 for b in audio_bytes]
-        pcm_bytes = struct.pack(f'{len(samples)}h', *samples)
+        if NUMPY_AVAILABLE:
+            pcm_bytes = ((np.frombuffer(audio_bytes, dtype=np.uint8).astype(np.int16) - 128) << 8).tobytes()
+        else:
+            pcm_bytes = array('h', [(b - 128) * 256 for b in audio_bytes]).tobytes()
     else:
         raise ValueError(f"Unsupported source format: {source_format}")
 
     # Resample to 16kHz if needed
-    target_rate = 16000
     if source_rate != target_rate:
         pcm_bytes = resample(pcm_bytes, source_rate, target_rate, 2)
 
@@ -200,7 +356,9 @@ def convert_from_tts(
     """
     Convert TTS output to telephony format.
 
-    OpenAI TTS returns 24kHz PCM.
+    OpenAI TTS returns 24kHz PCM for "pcm"; compressed formats (opus, mp3,
+    aac, flac) are decoded and resampled by PyAV. 8kHz u-law from a TTS
+    engine that produces it is passed through unchanged.
 
     Args:
         audio_bytes: TTS audio data
@@ -211,11 +369,25 @@ def convert_from_tts(
     Returns:
         Converted audio bytes
     """
-    source_rate = 24000  # OpenAI TTS default
-
-    # Resample to target rate
-    if source_rate != target_rate:
-        audio_bytes = resample(audio_bytes, source_rate, target_rate, 2)
+    if source_format == "ulaw":
+        # G.711 is always 8 kHz; already in telephony format
+        if target_format == "ulaw" and target_rate == 8000:
+            return audio_bytes
+        audio_bytes = ulaw_to_pcm16(audio_bytes)
+        if target_rate != 8000:
+            audio_bytes = resample(audio_bytes, 8000, target_rate, 2)
+    elif source_format == "pcm":
+        source_rate = 24000  # OpenAI TTS default
+
+        # Resample to target rate
+        if source_rate != target_rate:
+            audio_bytes = resample(audio_bytes, source_rate, target_rate, 2)
+    elif source_format == "wav":
+        audio_bytes, source_rate, _, _ = wav_to_pcm(audio_bytes)
+        if source_rate != target_rate:
+            audio_bytes = resample(audio_bytes, source_rate, target_rate, 2)
+    else:
+        audio_bytes = decode_compressed(audio_bytes, target_rate)
 
     # Convert format
     if target_format == "ulaw":
@@ -226,7 +398,39 @@ def convert_from_tts(
         raise ValueError(f"Unsupported target format: {target_format}")
 
 
-def pcm_to_wav(
+def decode_compressed(audio_bytes: bytes, target_rate: int = 8000) -> bytes:
+    """
+    Decode compressed audio (Ogg Opus, MP3, AAC, FLAC) to 16-bit mono PCM.
+
+    Decoding and resampling both happen in FFmpeg via PyAV.
+
+    Args:
+        audio_bytes: Compressed audio file data
+        target_rate: Output sample rate
+
+    Returns:
+        16-bit mono PCM at target_rate
+    """
+    if not AV_AVAILABLE:
+        raise ValueError("Decoding compressed TTS audio requires PyAV (pip install av)")
+
+    resampler = av.AudioResampler(format="s16", layout="mono", rate=target_rate)
+    chunks = []
+    with av.open(BytesIO(audio_bytes)) as container:
+        for frame in container.decode(audio=0):
+            for out in resampler.resample(frame):
+                chunks.append(bytes(out.planes[0])[:out.samples * 2])
+    # Flush samples buffered in the resampler
+    for out in resampler.resample(None):
+        chunks.append(bytes(out.planes[0])[:out.samples * 2])
+    return b"".join(chunks)
+
+
+# Canonical 44-byte RIFF/WAVE header for uncompressed PCM
+_WAV_HEADER = struct.Struct('<4sI4s4sIHHIIHH4sI')
+
+
+def pcm_to_wav_fast(
     pcm_bytes: bytes,
     sample_rate: int = 16000,
     sample_width: int = 2,
@@ -235,6 +439,9 @@ def pcm_to_wav(
     """
     Convert raw PCM to WAV format.
 
+    Packs the 44-byte header directly instead of going through a
+    wave.Wave_write object; the output is identical.
+
     Args:
         pcm_bytes: Raw PCM audio data
         sample_rate: Sample rate in Hz
@@ -244,13 +451,19 @@ def pcm_to_wav(
     Returns:
         WAV file bytes
     """
-    buffer = BytesIO()
-    with wave.open(buffer, 'wb') as wav:
-        wav.setnchannels(channels)
-        wav.setsampwidth(sample_width)
-        wav.setframerate(sample_rate)
-        wav.writeframes(pcm_bytes)
-    return buffer.getvalue()
+    block_align = channels * sample_width
+    data_size = len(pcm_bytes)
+    header = _WAV_HEADER.pack(
+        b'RIFF', 36 + data_size, b'WAVE',
+        b'fmt ', 16, 1, channels, sample_rate,
+        sample_rate * block_align, block_align, sample_width * 8,
+        b'data', data_size,
+    )
+    return header + pcm_bytes
+
+
+# Kept for existing callers
+pcm_to_wav = pcm_to_wav_fast
 
 
 def wav_to_pcm(wav_bytes: bytes) -> Tuple[bytes, int, int, int]:
@@ -272,7 +485,7 @@ def wav_to_pcm(wav_bytes: bytes) -> Tuple[bytes, int, int, int]:
     return pcm_bytes, sample_rate, sample_width, channels
 
 
-# A-law tables (simplified)
+# A-law decode table (G.711: a set sign bit means a positive sample)
 ALAW_TO_LINEAR = []
 for i in range(256):
     sample = i ^ 0x55
@@ -283,12 +496,18 @@ for i in range(256):
         linear = ((mantissa << 4) + 0x108) << (exponent - 1)
     else:
         linear = (mantissa << 4) + 8
-    if sign:
+    if not sign:
         linear = -linear
     ALAW_TO_LINEAR.append(linear)
 
+ALAW_TO_LINEAR_NP = _frozen_int16_table(ALAW_TO_LINEAR) if NUMPY_AVAILABLE else None
+
 
 def alaw_to_pcm16(alaw_bytes: bytes) -> bytes:
     """Convert A-law to 16-bit PCM."""
-    samples = [ALAW_TO_LINEAR[b] for b in alaw_bytes]
-    return struct.pack(f'{len(samples)}h', *samples)
+    if AUDIOOP_AVAILABLE:
+        return audioop.alaw2lin(alaw_bytes, 2)
+    if NUMPY_AVAILABLE:
+        return ALAW_TO_LINEAR_NP[np.frombuffer(alaw_bytes, dtype=np.uint8)].tobytes()
+
+    return array('h', [ALAW_TO_LINEAR[b] for b in alaw_bytes]).tobytes()
@@ -0,0 +1,24 @@
+"""
+Shared HTTP client construction for the voice agent.
+"""
+import httpx
+
+# httpx only negotiates HTTP/2 when the h2 package is installed
+try:
+    import h2  # noqa: F401
+    HTTP2_AVAILABLE = True
+except ImportError:
+    HTTP2_AVAILABLE = False
+
+# Keep-alive pool sized for many concurrent calls to the same host
+POOL_LIMITS = httpx.Limits(max_keepalive_connections=20, max_connections=100)
+
+
+def create_http_client(**kwargs) -> httpx.AsyncClient:
+    """
+    Create a pooled keep-alive AsyncClient, using HTTP/2 when h2 is installed.
+
+    Args:
+        **kwargs: Extra httpx.AsyncClient arguments (e.g. timeout)
+    """
+    return httpx.AsyncClient(http2=HTTP2_AVAILABLE, limits=POOL_LIMITS, **kwargs)
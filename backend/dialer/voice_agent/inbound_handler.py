@@ -5,13 +5,32 @@ Integrates the VoiceAgentSession with the PJSUA2 SIP engine
 to handle inbound calls with AI-powered conversation.
 """
 import asyncio
+import fnmatch
+import inspect
 import logging
+import os
+import re
+import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from typing import Optional, Dict, Any, Callable
+from typing import Optional, Dict, Any, Callable, List, Tuple
 from dataclasses import dataclass
 
+import httpx
+from openai import AsyncOpenAI
+
+from dialer.voice_agent.http_client import create_http_client
+
 logger = logging.getLogger(__name__)
 
+# Directory for TTS audio cached across calls and restarts
+TTS_CACHE_DIR = os.getenv("TTS_CACHE_DIR", "/var/cache/dialer/tts")
+
+# How long inbound routes and agent configs are reused before re-reading
+# them from the database. Edits made through the API (a separate process)
+# take effect within this window.
+ROUTE_CACHE_TTL = 30.0
+
 
 @dataclass
 class InboundCallContext:
@@ -46,11 +65,52 @@ class VoiceAgentInboundHandler:
         self.db_session_factory = db_session_factory
         self.active_sessions: Dict[str, Any] = {}
         self._loop: Optional[asyncio.AbstractEventLoop] = None
+        # Shared by all sessions for CPU-bound audio conversion, so long
+        # utterances don't stall the event loop. audioop and NumPy release
+        # the GIL, so conversions on different calls run in parallel.
+        self._audio_pool = ThreadPoolExecutor(
+            max_workers=os.cpu_count() or 4,
+            thread_name_prefix="voice-audio"
+        )
+        # All active DID patterns compiled into one alternation, in priority
+        # order; rebuilt only when the set of active routes changes
+        self._route_key: Optional[Tuple] = None
+        self._route_regex: Optional[re.Pattern] = None
+        self._compiled_routes: List[Any] = []
+        # Compiled regex per distinct DID pattern
+        self._pattern_cache: Dict[str, re.Pattern] = {}
+        # (loaded_at, routes) and {agent_config_id: (loaded_at, config)}
+        self._route_cache: Optional[Tuple[float, List[Any]]] = None
+        self._agent_config_cache: Dict[Any, Tuple[float, Any]] = {}
+        # {agent_config_id: (updated_at, plugins)}; plugins are stateless,
+        # so one set of instances is shared by all calls on that agent
+        self._plugin_cache: Dict[Any, Tuple[Any, Tuple]] = {}
+        self._http_client: Optional[httpx.AsyncClient] = None
+        # {api_key: client}; keeps OpenAI connections alive across calls
+        self._openai_clients: Dict[str, AsyncOpenAI] = {}
+        self._tts_cache = self._create_tts_cache()
+        # Agent configs (id, updated_at) whose fixed phrases were prewarmed
+        self._prewarmed: set = set()
+        self._background_tasks: set = set()
 
     def set_event_loop(self, loop: asyncio.AbstractEventLoop):
         """Set the event loop for async operations."""
         self._loop = loop
 
+    async def shutdown(self):
+        """Release the audio thread pool, cached plugins and shared HTTP clients."""
+        self._audio_pool.shutdown(wait=False, cancel_futures=True)
+        for _, plugins in self._plugin_cache.values():
+            for plugin in plugins:
+                await plugin.aclose()
+        self._plugin_cache.clear()
+        if self._http_client is not None:
+            await self._http_client.aclose()
+            self._http_client = None
+        for client in self._openai_clients.values():
+            await client.close()
+        self._openai_clients.clear()
+
     async def handle_incoming_call(
         self,
         call_id: str,
@@ -89,15 +149,21 @@ class VoiceAgentInboundHandler:
                 return False
 
             # Get agent config
-            result = await db.execute(
-                select(VoiceAgentConfig).where(
-                    and_(
-                        VoiceAgentConfig.id == route.agent_config_id,
-                        VoiceAgentConfig.status == VoiceAgentStatus.ACTIVE
+            agent_config = self._cached(self._agent_config_cache.get(route.agent_config_id))
+            if agent_config is None:
+                result = await db.execute(
+                    select(VoiceAgentConfig).where(
+                        and_(
+                            VoiceAgentConfig.id == route.agent_config_id,
+                            VoiceAgentConfig.status == VoiceAgentStatus.ACTIVE
+                        )
                     )
                 )
-            )
-            agent_config = result.scalar_one_or_none()
+                agent_config = result.scalar_one_or_none()
+                if agent_config:
+                    self._agent_config_cache[route.agent_config_id] = (
+                        time.monotonic(), agent_config
+                    )
 
             if not agent_config:
                 logger.warning(f"Agent config {route.agent_config_id} not found or inactive")
@@ -135,20 +201,83 @@ class VoiceAgentInboundHandler:
         from sqlalchemy import select
         from app.models.voice_agent import InboundRoute
 
-        # Get all active routes ordered by priority
-        result = await db.execute(
-            select(InboundRoute)
-            .where(InboundRoute.is_active == True)
-            .order_by(InboundRoute.priority)
-        )
-        routes = result.scalars().all()
+        routes = self._cached(self._route_cache)
+        if routes is None:
+            # Get all active routes ordered by priority
+            result = await db.execute(
+                select(InboundRoute)
+                .where(InboundRoute.is_active == True)
+                .order_by(InboundRoute.priority)
+            )
+            routes = result.scalars().all()
+            self._route_cache = (time.monotonic(), routes)
 
-        for route in routes:
-            if self._matches_pattern(called_number, route.did_pattern):
-                return route
+        return self._match_route(routes, called_number)
 
+    @staticmethod
+    def _cached(entry: Optional[Tuple[float, Any]]) -> Any:
+        """Return the value of a (loaded_at, value) cache entry if still fresh."""
+        if entry is not None and time.monotonic() - entry[0] < ROUTE_CACHE_TTL:
+            return entry[1]
         return None
 
+    def _match_route(self, routes: List[Any], called_number: str):
+        """
+        Return the first route (in the given order) whose DID pattern
+        matches the called number, or None.
+        """
+        route_key = tuple((route.id, route.did_pattern) for route in routes)
+        if route_key != self._route_key:
+            self._compile_routes(routes)
+            self._route_key = route_key
+
+        if self._route_regex is None:
+            return None
+
+        # Alternation is tried left to right, so the first group that
+        # matches is the highest-priority route
+        match = self._route_regex.match(called_number)
+        if not match:
+            return None
+        return self._compiled_routes[int(match.lastgroup[1:])]
+
+    def _compile_routes(self, routes: List[Any]):
+        """Build the combined DID regex for the given routes."""
+        self._compiled_routes = list(routes)
+        if not routes:
+            self._route_regex = None
+            return
+        self._route_regex = re.compile("|".join(
+            f"(?P<r{i}>{self._pattern_regex(route.did_pattern).pattern})"
+            for i, route in enumerate(routes)
+        ))
+
+    def _pattern_regex(self, pattern: str) -> re.Pattern:
+        """Get the compiled regex for a DID pattern, compiling it once."""
+        regex = self._pattern_cache.get(pattern)
+        if regex is None:
+            regex = self._pattern_cache[pattern] = re.compile(fnmatch.translate(pattern))
+        return regex
+
+    def invalidate_routes(self):
+        """Drop cached and compiled routes (call after inbound routes are changed)."""
+        self._route_cache = None
+        self._route_key = None
+        self._route_regex = None
+        self._compiled_routes = []
+
+    def invalidate_agent_config(self, agent_config_id: Optional[str] = None):
+        """
+        Drop cached agent configs.
+
+        Args:
+            agent_config_id: Config to drop, or None to drop all
+        """
+        if agent_config_id is None:
+            self._agent_config_cache.clear()
+        else:
+            self._agent_config_cache.pop(agent_config_id, None)
+
     def _matches_pattern(self, number: str, pattern: str) -> bool:
         """
         Check if a phone number matches a DID pattern.
@@ -159,8 +288,7 @@ class VoiceAgentInboundHandler:
         - "*" matches any number
         - "+18001234567" matches exactly
         """
-        import fnmatch
-        return fnmatch.fnmatch(number, pattern)
+        return self._pattern_regex(pattern).match(number) is not None
 
     async def _run_voice_agent_session(
         self,
@@ -194,8 +322,8 @@ class VoiceAgentInboundHandler:
                 hangup_callback()
                 return
 
-            # Build plugins from config
-            plugins = await self._build_plugins(agent_config.plugins_config or [])
+            # Build plugins from config (shared across calls)
+            plugins = await self._get_plugins(agent_config)
 
             # Create voice agent config
             va_config = VAConfig(
@@ -217,9 +345,29 @@ class VoiceAgentInboundHandler:
                 vad_min_speech_duration=agent_config.vad_min_speech_duration,
                 llm_temperature=agent_config.llm_temperature,
                 llm_max_tokens=agent_config.llm_max_tokens,
-                plugins=plugins
+                plugins=plugins,
+                # Opted into per agent with a {"type": "batch_invoke"} entry
+                batch_tools=any(
+                    config.get("type") == "batch_invoke"
+                    for config in agent_config.plugins_config or []
+                ),
+                tts_cache=self._tts_cache
             )
 
+            # Synthesize the fixed phrases for later calls on this agent
+            prewarm_key = (agent_config.id, agent_config.updated_at)
+            if prewarm_key not in self._prewarmed:
+                self._prewarmed.add(prewarm_key)
+                task = asyncio.create_task(
+                    VoiceAgentSession.prewarm(
+                        va_config,
+                        self._get_openai_client(api_key),
+                        audio_executor=self._audio_pool
+                    )
+                )
+                self._background_tasks.add(task)
+                task.add_done_callback(self._background_tasks.discard)
+
             # Create audio callbacks for SIP call
             audio_queue = asyncio.Queue()
 
@@ -235,17 +383,26 @@ class VoiceAgentInboundHandler:
                     logger.error(f"Error playing audio: {e}")
 
             async def get_audio() -> Optional[bytes]:
-                """Get audio from the caller via SIP."""
+                """
+                Get audio from the caller via SIP.
+
+                Frames that are already queued are returned without
+                suspending. Otherwise this waits on the queue itself; the
+                session's capture task is cancelled when the session ends,
+                so no extra timer is armed here per frame.
+                """
                 try:
-                    return await asyncio.wait_for(audio_queue.get(), timeout=0.1)
-                except asyncio.TimeoutError:
-                    return None
+                    return audio_queue.get_nowait()
+                except asyncio.QueueEmpty:
+                    return await audio_queue.get()
 
             # Create session
             session = VoiceAgentSession(
                 config=va_config,
                 play_audio_callback=play_audio,
                 get_audio_callback=get_audio,
+                audio_executor=self._audio_pool,
+                openai_client=self._get_openai_client(api_key),
                 context={
                     "caller_number": context.caller_number,
                     "called_number": context.called_number,
@@ -284,6 +441,43 @@ class VoiceAgentInboundHandler:
         import os
         return os.getenv("OPENAI_API_KEY")
 
+    async def _get_plugins(self, agent_config: Any) -> list:
+        """Get plugin instances for an agent, reusing them until the config changes."""
+        cached = self._plugin_cache.get(agent_config.id)
+        if cached is not None and cached[0] == agent_config.updated_at:
+            return list(cached[1])
+
+        plugins = await self._build_plugins(agent_config.plugins_config or [])
+        self._plugin_cache[agent_config.id] = (agent_config.updated_at, tuple(plugins))
+        return plugins
+
+    def _get_http_client(self) -> httpx.AsyncClient:
+        """Get the HTTP client shared by plugins that accept one."""
+        if self._http_client is None:
+            self._http_client = create_http_client()
+        return self._http_client
+
+    @staticmethod
+    def _create_tts_cache() -> Optional[Any]:
+        """Create the disk TTS cache shared by all sessions."""
+        from dialer.voice_agent.synthesizer import DiskTTSCache
+
+        try:
+            return DiskTTSCache(TTS_CACHE_DIR)
+        except OSError as e:
+            logger.warning(f"TTS disk cache unavailable ({TTS_CACHE_DIR}): {e}")
+            return None
+
+    def _get_openai_client(self, api_key: str) -> AsyncOpenAI:
+        """Get the pooled OpenAI client for an API key."""
+        client = self._openai_clients.get(api_key)
+        if client is None:
+            client = self._openai_clients[api_key] = AsyncOpenAI(
+                api_key=api_key,
+                http_client=create_http_client()
+            )
+        return client
+
     async def _build_plugins(self, plugins_config: list) -> list:
         """Build plugin instances from config."""
         from dialer.voice_agent.plugins import (
@@ -308,6 +502,8 @@ class VoiceAgentInboundHandler:
             if plugin_type in plugin_classes:
                 plugin_cls = plugin_classes[plugin_type]
                 plugin_args = config.get("config", {})
+                if "client" in inspect.signature(plugin_cls).parameters:
+                    plugin_args = {"client": self._get_http_client(), **plugin_args}
                 try:
                     plugin = plugin_cls(**plugin_args)
                     plugins.append(plugin)
@@ -382,3 +578,11 @@ def init_inbound_handler(db_session_factory: Callable) -> VoiceAgentInboundHandl
     global _inbound_handler
     _inbound_handler = VoiceAgentInboundHandler(db_session_factory)
     return _inbound_handler
+
+
+async def shutdown_inbound_handler():
+    """Shut down the global inbound handler, if one was initialized."""
+    global _inbound_handler
+    if _inbound_handler is not None:
+        await _inbound_handler.shutdown()
+        _inbound_handler = None
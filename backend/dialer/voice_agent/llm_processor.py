@@ -3,16 +3,38 @@ OpenAI GPT conversation processor with function calling support.
 """
 import asyncio
 import json
-from typing import List, Dict, Any, Optional, Callable, Awaitable
+from typing import List, Dict, Any, Optional, Callable, Awaitable, AsyncIterator
 from dataclasses import dataclass
 import logging
 
-from openai import OpenAI
+from openai import AsyncOpenAI
 
 logger = logging.getLogger(__name__)
 
+# orjson is a faster drop-in for tool argument/result JSON; optional
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+    orjson = None
 
-@dataclass
+
+def _json_loads(data: str) -> Any:
+    """Parse JSON, using orjson when available."""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _json_dumps(obj: Any) -> str:
+    """Serialize to a JSON string, using orjson when available."""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(obj).decode()
+    return json.dumps(obj)
+
+
+@dataclass(slots=True, frozen=True)
 class PluginResult:
     """Result from a plugin execution."""
     plugin_name: str
@@ -31,7 +53,12 @@ class ConversationProcessor:
         model: str = "gpt-4o-mini",
         max_tokens: int = 150,
         temperature: float = 0.7,
-        plugins: Optional[List["ExternalPlugin"]] = None
+        plugins: Optional[List["ExternalPlugin"]] = None,
+        max_history_turns: int = 12,
+        summary_threshold: int = 20,
+        summary_model: str = "gpt-4o-mini",
+        batch_tools: bool = False,
+        client: Optional[AsyncOpenAI] = None
     ):
         """
         Initialize conversation processor.
@@ -43,17 +70,51 @@ class ConversationProcessor:
             max_tokens: Maximum tokens in response
             temperature: Response randomness (0-2)
             plugins: List of external plugins for function calling
+            max_history_turns: Messages kept verbatim once history is summarized
+            summary_threshold: History length (messages) that triggers summarization
+            summary_model: Model used to summarize older messages
+            batch_tools: Also offer a batch_invoke tool that runs several
+                plugins in one call (only added when there are 2+ plugins)
+            client: Optional shared OpenAI client (created from api_key if omitted)
         """
-        self.client = OpenAI(api_key=api_key)
+        self.client = client or AsyncOpenAI(api_key=api_key)
         self.system_prompt = system_prompt
         self.model = model
         self.max_tokens = max_tokens
         self.temperature = temperature
-        self.plugins = plugins or []
+        self.plugins = list(plugins or [])
+        if batch_tools and len(self.plugins) > 1:
+            self.plugins.append(BatchPlugin(self))
+        self._plugin_map: Dict[str, "ExternalPlugin"] = {
+            plugin.name: plugin for plugin in self.plugins
+        }
+
+        # Tool definitions are fixed for the session, so build them once
+        self._tools: Optional[List[Dict]] = [
+            plugin.to_openai_tool() for plugin in self.plugins
+        ] or None
 
         # Conversation history
         self.conversation_history: List[Dict[str, str]] = []
 
+        # User and assistant messages, kept alongside the history so the
+        # transcript doesn't have to be filtered out of it on every read
+        self._transcript: List[Dict[str, str]] = []
+
+        # Older messages are folded into a running summary so the prompt
+        # stays bounded on long calls; the transcript still has the originals
+        self.max_history_turns = max_history_turns
+        self.summary_threshold = summary_threshold
+        self.summary_model = summary_model
+        self._summary: Optional[str] = None
+        self._summary_task: Optional[asyncio.Task] = None
+
+        # System message for the last context seen; the context rarely
+        # changes within a call, and an identical prefix each turn also
+        # lets OpenAI's prompt cache hit
+        self._system_key: Optional[tuple] = None
+        self._system_message: Optional[Dict[str, str]] = None
+
         # Token tracking
         self._total_input_tokens = 0
         self._total_output_tokens = 0
@@ -101,24 +162,17 @@ class ConversationProcessor:
         self._pending_action = None
 
         # Add user message to history
-        self.conversation_history.append({
-            "role": "user",
-            "content": user_input
-        })
+        self._add_message("user", user_input)
 
         try:
             # Build messages
             messages = self._build_messages(context)
 
             # Prepare tools from plugins
-            tools = self._build_tools() if self.plugins else None
+            tools = self._build_tools()
 
             # Call GPT API
-            response = await asyncio.to_thread(
-                self._call_gpt_api,
-                messages,
-                tools
-            )
+            response = await self._call_gpt_api(messages, tools)
 
             # Track tokens
             if response.usage:
@@ -134,10 +188,8 @@ class ConversationProcessor:
 
             # Regular response
             assistant_response = message.content or ""
-            self.conversation_history.append({
-                "role": "assistant",
-                "content": assistant_response
-            })
+            self._add_message("assistant", assistant_response)
+            self._maybe_summarize()
 
             return assistant_response
 
@@ -145,27 +197,221 @@ class ConversationProcessor:
             logger.error(f"GPT processing error: {e}")
             return "I'm sorry, I'm having trouble processing your request. Could you please try again?"
 
+    async def process_stream(
+        self,
+        user_input: str,
+        context: Optional[Dict[str, Any]] = None
+    ) -> AsyncIterator[str]:
+        """
+        Process user input and stream the response as it is generated.
+
+        Same as process(), but yields text deltas as they arrive so the
+        caller can start speaking before the full reply is ready. Tool calls
+        are buffered until complete, executed, and the follow-up response
+        is streamed in turn.
+
+        Args:
+            user_input: User's speech transcription
+            context: Optional context (caller info, etc.)
+
+        Yields:
+            Fragments of the assistant's response text
+        """
+        if not user_input or not user_input.strip():
+            return
+
+        self._pending_action = None
+
+        # Add user message to history
+        self._add_message("user", user_input)
+
+        parts: List[str] = []
+        yielded = False
+        try:
+            tool_calls: Dict[int, Dict[str, Any]] = {}
+            async for text in self._stream_completion(
+                self._build_messages(context), self._build_tools(), tool_calls
+            ):
+                parts.append(text)
+                # Text that accompanies a tool call isn't the final answer
+                if not tool_calls:
+                    yielded = True
+                    yield text
+
+            if tool_calls:
+                await self._run_tool_calls(
+                    "".join(parts),
+                    [tool_calls[index] for index in sorted(tool_calls)],
+                    context
+                )
+
+                if self._pending_action:
+                    # The call is ending, so the plugin's message is the reply
+                    parts = [self._pending_action.get("message", "")]
+                    yielded = True
+                    yield parts[0]
+                else:
+                    # Stream the follow-up response with the tool results
+                    parts = []
+                    async for text in self._stream_completion(
+                        self._build_messages(context), None, {}
+                    ):
+                        parts.append(text)
+                        yielded = True
+                        yield text
+
+            self._add_message("assistant", "".join(parts))
+            self._maybe_summarize()
+
+        except Exception as e:
+            logger.error(f"GPT streaming error: {e}")
+            if not yielded:
+                yield "I'm sorry, I'm having trouble processing your request. Could you please try again?"
+
+    async def _stream_completion(
+        self,
+        messages: List[Dict],
+        tools: Optional[List[Dict]],
+        tool_calls: Dict[int, Dict[str, Any]]
+    ) -> AsyncIterator[str]:
+        """
+        Stream a chat completion.
+
+        Args:
+            messages: Messages to send
+            tools: Tools array, or None
+            tool_calls: Filled in with the tool calls in the response,
+                keyed by index, as they are assembled from the deltas
+
+        Yields:
+            Text deltas of the response
+        """
+        stream = await self._call_gpt_api(messages, tools, stream=True)
+        async for chunk in stream:
+            # With include_usage the final chunk has usage and no choices
+            if chunk.usage:
+                self._total_input_tokens += chunk.usage.prompt_tokens
+                self._total_output_tokens += chunk.usage.completion_tokens
+            if not chunk.choices:
+                continue
+
+            delta = chunk.choices[0].delta
+            for tc in delta.tool_calls or ():
+                entry = tool_calls.setdefault(tc.index, {
+                    "id": "",
+                    "type": "function",
+                    "function": {"name": "", "arguments": ""}
+                })
+                if tc.id:
+                    entry["id"] = tc.id
+                if tc.function:
+                    if tc.function.name:
+                        entry["function"]["name"] += tc.function.name
+                    if tc.function.arguments:
+                        entry["function"]["arguments"] += tc.function.arguments
+
+            if delta.content:
+                yield delta.content
+
     def _build_messages(self, context: Optional[Dict] = None) -> List[Dict]:
         """Build messages array with system prompt and context."""
-        system_content = self.system_prompt
+        system_key = tuple(context.items()) if context else ()
+        if self._system_message is None or system_key != self._system_key:
+            system_content = self.system_prompt
+
+            # Add context to system prompt if provided
+            if context:
+                context_str = "\n\nCurrent context:\n"
+                for key, value in context.items():
+                    context_str += f"- {key}: {value}\n"
+                system_content += context_str
+
+            self._system_message = {"role": "system", "content": system_content}
+            self._system_key = system_key
+
+        if self._summary:
+            return [
+                self._system_message,
+                {"role": "system", "content": f"Summary of the conversation so far: {self._summary}"},
+                *self.conversation_history
+            ]
+        return [self._system_message, *self.conversation_history]
+
+    def _maybe_summarize(self):
+        """Start summarizing older messages if the history is too long."""
+        history = self.conversation_history
+        if len(history) <= self.summary_threshold:
+            return
+        if self._summary_task and not self._summary_task.done():
+            return
+
+        # Cut at a user message so assistant tool calls stay paired with
+        # their tool results
+        cut = len(history) - self.max_history_turns
+        while cut < len(history) and history[cut]["role"] != "user":
+            cut += 1
+        if cut <= 0 or cut >= len(history):
+            return
+
+        self._summary_task = asyncio.create_task(self._summarize(history[:cut]))
+
+    async def _summarize(self, old_messages: List[Dict[str, str]]):
+        """
+        Fold old messages into the running summary.
+
+        Runs in the background so the turn isn't delayed; the messages are
+        only dropped from the history once the summary is available.
+        """
+        lines = [f"Previous summary: {self._summary}"] if self._summary else []
+        for msg in old_messages:
+            if msg["role"] in ("user", "assistant") and msg.get("content"):
+                lines.append(f"{msg['role']}: {msg['content']}")
+
+        try:
+            response = await self._call_summary_api("\n".join(lines))
+        except Exception as e:
+            logger.warning(f"Conversation summary failed: {e}")
+            return
 
-        # Add context to system prompt if provided
-        if context:
-            context_str = "\n\nCurrent context:\n"
-            for key, value in context.items():
-                context_str += f"- {key}: {value}\n"
-            system_content += context_str
+        if response.usage:
+            self._total_input_tokens += response.usage.prompt_tokens
+            self._total_output_tokens += response.usage.completion_tokens
 
-        messages = [{"role": "system", "content": system_content}]
-        messages.extend(self.conversation_history)
-        return messages
+        # Skip if the history was reset while the summary was running
+        count = len(old_messages)
+        if self.conversation_history[:count] != old_messages:
+            return
+
+        self._summary = response.choices[0].message.content or self._summary
+        del self.conversation_history[:count]
+
+    async def _call_summary_api(self, text: str):
+        """Call GPT to summarize earlier conversation."""
+        return await self.client.chat.completions.create(
+            model=self.summary_model,
+            messages=[
+                {
+                    "role": "system",
+                    "content": "Summarize this phone conversation in a few sentences. "
+                               "Keep names, account details, requests and anything promised."
+                },
+                {"role": "user", "content": text}
+            ],
+            max_tokens=100,
+            temperature=0
+        )
 
-    def _build_tools(self) -> List[Dict]:
-        """Build tools array from plugins."""
-        return [plugin.to_openai_tool() for plugin in self.plugins]
+    def _build_tools(self) -> Optional[List[Dict]]:
+        """Get the tools array for the plugins (None if there are none)."""
+        return self._tools
 
-    def _call_gpt_api(self, messages: List[Dict], tools: Optional[List[Dict]]):
-        """Make synchronous call to GPT API."""
+    async def _call_gpt_api(
+        self,
+        messages: List[Dict],
+        tools: Optional[List[Dict]],
+        stream: bool = False
+    ):
+        """Call the GPT chat completions API (returns a chunk stream if stream=True)."""
         kwargs = {
             "model": self.model,
             "messages": messages,
@@ -175,8 +421,11 @@ class ConversationProcessor:
         if tools:
             kwargs["tools"] = tools
             kwargs["tool_choice"] = "auto"
+        if stream:
+            kwargs["stream"] = True
+            kwargs["stream_options"] = {"include_usage": True}
 
-        return self.client.chat.completions.create(**kwargs)
+        return await self.client.chat.completions.create(**kwargs)
 
     async def _handle_tool_calls(
         self,
@@ -193,11 +442,9 @@ class ConversationProcessor:
         Returns:
             Final response after processing tool calls
         """
-        # Add assistant message with tool calls to history
-        self.conversation_history.append({
-            "role": "assistant",
-            "content": message.content or "",
-            "tool_calls": [
+        await self._run_tool_calls(
+            message.content or "",
+            [
                 {
                     "id": tc.id,
                     "type": "function",
@@ -207,49 +454,89 @@ class ConversationProcessor:
                     }
                 }
                 for tc in message.tool_calls
-            ]
-        })
-
-        # Process each tool call
-        for tool_call in message.tool_calls:
-            function_name = tool_call.function.name
-            function_args = json.loads(tool_call.function.arguments)
-
-            logger.info(f"Executing tool: {function_name} with args: {function_args}")
-
-            # Find and execute the plugin
-            result = await self._execute_plugin(function_name, function_args, context)
-
-            # Check for special actions
-            if result.data.get("action") in ["transfer", "hangup"]:
-                self._pending_action = result.data
+            ],
+            context
+        )
 
-            # Add tool result to history
-            self.conversation_history.append({
-                "role": "tool",
-                "tool_call_id": tool_call.id,
-                "content": json.dumps(result.data if result.success else {"error": result.error})
-            })
+        # Transfer/hangup ends the call, so skip the follow-up round-trip
+        # and reply with the plugin's message
+        if self._pending_action:
+            final_response = self._pending_action.get("message", "")
+            self._add_message("assistant", final_response)
+            return final_response
 
         # Get final response from GPT with tool results
         messages = self._build_messages(context)
-        response = await asyncio.to_thread(
-            self._call_gpt_api,
-            messages,
-            None  # No tools on follow-up
-        )
+        response = await self._call_gpt_api(messages, None)  # No tools on follow-up
 
         if response.usage:
             self._total_input_tokens += response.usage.prompt_tokens
             self._total_output_tokens += response.usage.completion_tokens
 
         final_response = response.choices[0].message.content or ""
+        self._add_message("assistant", final_response)
+        self._maybe_summarize()
+
+        return final_response
+
+    async def _run_tool_calls(
+        self,
+        content: str,
+        tool_calls: List[Dict[str, Any]],
+        context: Optional[Dict]
+    ):
+        """
+        Execute tool calls and record them and their results in the history.
+
+        Args:
+            content: Text content of the assistant message
+            tool_calls: Tool calls in OpenAI message format
+            context: Conversation context
+        """
+        # Add assistant message with tool calls to history
         self.conversation_history.append({
             "role": "assistant",
-            "content": final_response
+            "content": content,
+            "tool_calls": tool_calls
         })
 
-        return final_response
+        # Parse all arguments up front so malformed JSON fails before any
+        # plugin runs
+        calls = [
+            (tool_call, tool_call["function"]["name"], _json_loads(tool_call["function"]["arguments"]))
+            for tool_call in tool_calls
+        ]
+
+        for _, function_name, function_args in calls:
+            logger.info("Executing tool: %s with args: %s", function_name, function_args)
+
+        # Plugins are I/O-bound, so run them concurrently
+        results = await asyncio.gather(
+            *(self._execute_plugin(name, args, context) for _, name, args in calls),
+            return_exceptions=True
+        )
+
+        # Record results in the original order so tool_call_ids line up
+        for (tool_call, function_name, _), result in zip(calls, results):
+            if isinstance(result, BaseException):
+                logger.error(f"Plugin {function_name} error: {result}")
+                result = PluginResult(
+                    plugin_name=function_name,
+                    success=False,
+                    data={},
+                    error=str(result)
+                )
+
+            # Check for special actions
+            if result.data.get("action") in ["transfer", "hangup"]:
+                self._pending_action = result.data
+
+            # Add tool result to history
+            self.conversation_history.append({
+                "role": "tool",
+                "tool_call_id": tool_call["id"],
+                "content": _json_dumps(result.data if result.success else {"error": result.error})
+            })
 
     async def _execute_plugin(
         self,
@@ -258,40 +545,48 @@ class ConversationProcessor:
         context: Optional[Dict]
     ) -> PluginResult:
         """Execute a plugin by name."""
-        for plugin in self.plugins:
-            if plugin.name == plugin_name:
-                try:
-                    result = await plugin.execute(args, context or {})
-                    return PluginResult(
-                        plugin_name=plugin_name,
-                        success=True,
-                        data=result
-                    )
-                except Exception as e:
-                    logger.error(f"Plugin {plugin_name} error: {e}")
-                    return PluginResult(
-                        plugin_name=plugin_name,
-                        success=False,
-                        data={},
-                        error=str(e)
-                    )
-
-        return PluginResult(
-            plugin_name=plugin_name,
-            success=False,
-            data={},
-            error=f"Plugin {plugin_name} not found"
-        )
+        plugin = self._plugin_map.get(plugin_name)
+        if plugin is None:
+            return PluginResult(
+                plugin_name=plugin_name,
+                success=False,
+                data={},
+                error=f"Plugin {plugin_name} not found"
+            )
+
+        try:
+            result = await plugin.execute(args, context or {})
+            return PluginResult(
+                plugin_name=plugin_name,
+                success=True,
+                data=result
+            )
+        except Exception as e:
+            logger.error(f"Plugin {plugin_name} error: {e}")
+            return PluginResult(
+                plugin_name=plugin_name,
+                success=False,
+                data={},
+                error=str(e)
+            )
+
+    def _add_message(self, role: str, content: str):
+        """Add a user or assistant message to the history and transcript."""
+        message = {"role": role, "content": content}
+        self.conversation_history.append(message)
+        self._transcript.append(message)
 
     def get_transcript(self) -> List[Dict[str, str]]:
         """Get conversation transcript (user and assistant messages only)."""
-        return [
-            msg for msg in self.conversation_history
-            if msg["role"] in ("user", "assistant") and "tool_calls" not in msg
-        ]
+        return list(self._transcript)
 
     def reset(self):
         """Reset conversation state."""
+        if self._summary_task and not self._summary_task.done():
+            self._summary_task.cancel()
+        self._summary_task = None
+        self._summary = None
+        self._transcript = []
         self.conversation_history = []
         self._total_input_tokens = 0
         self._total_output_tokens = 0
@@ -300,3 +595,4 @@ class ConversationProcessor:
 
 # Import ExternalPlugin base class for type hints
 from dialer.voice_agent.plugins.base import ExternalPlugin
+from dialer.voice_agent.plugins.batch import BatchPlugin
@@ -11,6 +11,7 @@ from dialer.voice_agent.plugins.transfer_call import (
     HangupCallPlugin,
     EscalatePlugin
 )
+from dialer.voice_agent.plugins.batch import BatchPlugin
 
 __all__ = [
     "ExternalPlugin",
@@ -20,4 +21,5 @@ __all__ = [
     "TransferCallPlugin",
     "HangupCallPlugin",
     "EscalatePlugin",
+    "BatchPlugin",
 ]
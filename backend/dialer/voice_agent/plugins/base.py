@@ -2,11 +2,20 @@
 Base class for external API plugins.
 """
 from abc import ABC, abstractmethod
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, List, Optional, Tuple
 from dataclasses import dataclass
 
+# Python types and error wording for the checked parameter types
+_TYPE_CHECKS = {
+    "string": (str, "a string"),
+    "integer": (int, "an integer"),
+    "number": ((int, float), "a number"),
+    "boolean": (bool, "a boolean"),
+    "array": (list, "an array"),
+}
 
-@dataclass
+
+@dataclass(slots=True)
 class PluginParameter:
     """Definition of a plugin parameter."""
     name: str
@@ -14,6 +23,7 @@ class PluginParameter:
     description: str
     required: bool = True
     enum: Optional[List[str]] = None  # For restricted values
+    items: Optional[Dict[str, Any]] = None  # Element schema for arrays
 
 
 class ExternalPlugin(ABC):
@@ -42,6 +52,23 @@ class ExternalPlugin(ABC):
     description: str = "Base plugin"
     parameters: List[PluginParameter] = []
 
+    # Validation rules derived from `parameters`, one tuple per parameter:
+    # (name, required, python type or None, type description, enum set, enum list)
+    _param_specs: Tuple[tuple, ...] = ()
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        cls._param_specs = tuple(
+            (
+                param.name,
+                param.required,
+                *_TYPE_CHECKS.get(param.type, (None, None)),
+                frozenset(param.enum) if param.enum else None,
+                param.enum,
+            )
+            for param in cls.parameters
+        )
+
     @abstractmethod
     async def execute(
         self,
@@ -60,13 +87,27 @@ class ExternalPlugin(ABC):
         """
         pass
 
+    async def aclose(self):
+        """Release resources held by the plugin (override if needed)."""
+        pass
+
     def to_openai_tool(self) -> Dict[str, Any]:
         """
         Convert to OpenAI function calling format.
 
+        The definition is built on first use and reused afterwards, since
+        plugin metadata does not change.
+
         Returns:
             Tool definition for OpenAI API
         """
+        tool = self.__dict__.get("_openai_tool")
+        if tool is None:
+            tool = self._openai_tool = self._build_openai_tool()
+        return tool
+
+    def _build_openai_tool(self) -> Dict[str, Any]:
+        """Build the OpenAI tool definition from the plugin metadata."""
         properties = {}
         required = []
 
@@ -77,6 +118,8 @@ class ExternalPlugin(ABC):
             }
             if param.enum:
                 prop_def["enum"] = param.enum
+            if param.items:
+                prop_def["items"] = param.items
 
             properties[param.name] = prop_def
 
@@ -106,27 +149,25 @@ class ExternalPlugin(ABC):
         Returns:
             True if valid, raises ValueError otherwise
         """
-        for param in self.parameters:
-            if param.required and param.name not in params:
-                raise ValueError(f"Missing required parameter: {param.name}")
-
-            if param.name in params:
-                value = params[param.name]
-
-                # Type validation
-                if param.type == "string" and not isinstance(value, str):
-                    raise ValueError(f"Parameter {param.name} must be a string")
-                elif param.type == "integer" and not isinstance(value, int):
-                    raise ValueError(f"Parameter {param.name} must be an integer")
-                elif param.type == "number" and not isinstance(value, (int, float)):
-                    raise ValueError(f"Parameter {param.name} must be a number")
-                elif param.type == "boolean" and not isinstance(value, bool):
-                    raise ValueError(f"Parameter {param.name} must be a boolean")
-
-                # Enum validation
-                if param.enum and value not in param.enum:
-                    raise ValueError(
-                        f"Parameter {param.name} must be one of: {param.enum}"
-                    )
+        for name, required, expected, type_desc, enum_set, enum in self._param_specs:
+            if name not in params:
+                if required:
+                    raise ValueError(f"Missing required parameter: {name}")
+                continue
+
+            value = params[name]
+
+            # Type validation
+            if expected is not None and not isinstance(value, expected):
+                raise ValueError(f"Parameter {name} must be {type_desc}")
+
+            # Enum validation
+            if enum_set is not None:
+                try:
+                    allowed = value in enum_set
+                except TypeError:  # unhashable value
+                    allowed = False
+                if not allowed:
+                    raise ValueError(f"Parameter {name} must be one of: {enum}")
 
         return True
@@ -0,0 +1,112 @@
+"""
+Batch plugin - runs several tool calls from a single model request.
+"""
+import asyncio
+from typing import Dict, Any, List
+import logging
+
+from dialer.voice_agent.plugins.base import ExternalPlugin, PluginParameter
+
+logger = logging.getLogger(__name__)
+
+
+class BatchPlugin(ExternalPlugin):
+    """
+    Invoke several other plugins concurrently in one tool call.
+
+    Lets the model request independent lookups/actions together instead
+    of one per round-trip. Registered per conversation by
+    ConversationProcessor, which it uses to dispatch the sub-invocations.
+    """
+
+    name = "batch_invoke"
+    description = (
+        "Run several independent tools at once. Use this instead of separate "
+        "tool calls when more than one tool is needed and they don't depend "
+        "on each other's results"
+    )
+    parameters = [
+        PluginParameter(
+            name="invocations",
+            type="array",
+            description="Tools to run, each with its tool name and arguments",
+            required=True,
+            items={
+                "type": "object",
+                "properties": {
+                    "tool_name": {
+                        "type": "string",
+                        "description": "Name of the tool to run"
+                    },
+                    "arguments": {
+                        "type": "object",
+                        "description": "Arguments for the tool"
+                    }
+                },
+                "required": ["tool_name", "arguments"]
+            }
+        )
+    ]
+
+    def __init__(self, processor: "ConversationProcessor"):
+        """
+        Initialize batch plugin.
+
+        Args:
+            processor: Conversation processor that executes the sub-invocations
+        """
+        self._processor = processor
+
+    async def execute(
+        self,
+        params: Dict[str, Any],
+        context: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        """
+        Run the requested tools concurrently.
+
+        Args:
+            params: {"invocations": [{"tool_name": ..., "arguments": {...}}, ...]}
+            context: Conversation context
+
+        Returns:
+            Results in invocation order; if one of the tools requested a
+            transfer or hangup, its action fields are included at the top level
+        """
+        invocations: List[Dict[str, Any]] = params.get("invocations") or []
+
+        names = [inv.get("tool_name", "") for inv in invocations]
+        results = await asyncio.gather(
+            *(
+                self._run(name, inv.get("arguments") or {}, context)
+                for name, inv in zip(names, invocations)
+            ),
+            return_exceptions=True
+        )
+
+        response: Dict[str, Any] = {"results": []}
+        action = None
+        for name, result in zip(names, results):
+            if isinstance(result, BaseException):
+                logger.error(f"Batched plugin {name} error: {result}")
+                response["results"].append({"tool_name": name, "error": str(result)})
+                continue
+
+            if result.success:
+                response["results"].append({"tool_name": name, "result": result.data})
+                if action is None and result.data.get("action") in ("transfer", "hangup"):
+                    action = result.data
+            else:
+                response["results"].append({"tool_name": name, "error": result.error})
+
+        # Surface the action so the processor still sees the transfer/hangup
+        if action is not None:
+            response.update(action)
+
+        return response
+
+    async def _run(self, tool_name: str, args: Dict[str, Any], context: Dict[str, Any]):
+        """Execute one sub-invocation through the processor."""
+        if tool_name == self.name:
+            raise ValueError("batch_invoke cannot be nested")
+        return await self._processor._execute_plugin(tool_name, args, context)
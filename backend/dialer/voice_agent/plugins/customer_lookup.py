@@ -1,10 +1,14 @@
 """
 Customer lookup plugin - fetches customer data from external API.
 """
-from typing import Dict, Any, Optional
+import asyncio
+import time
+from collections import OrderedDict
+from typing import Dict, Any, Optional, Tuple
 import httpx
 import logging
 
+from dialer.voice_agent.http_client import create_http_client
 from dialer.voice_agent.plugins.base import ExternalPlugin, PluginParameter
 
 logger = logging.getLogger(__name__)
@@ -33,7 +37,10 @@ class CustomerLookupPlugin(ExternalPlugin):
         self,
         api_endpoint: str,
         api_key: Optional[str] = None,
-        timeout: float = 10.0
+        timeout: float = 10.0,
+        client: Optional[httpx.AsyncClient] = None,
+        cache_ttl: float = 60.0,
+        cache_size: int = 1024
     ):
         """
         Initialize customer lookup plugin.
@@ -42,10 +49,38 @@ class CustomerLookupPlugin(ExternalPlugin):
             api_endpoint: Base URL for customer API
             api_key: Optional API key for authentication
             timeout: Request timeout in seconds
+            client: Optional shared HTTP client; if omitted the plugin
+                creates its own on first use and keeps it for later lookups
+            cache_ttl: Seconds a successful lookup is reused (0 disables)
+            cache_size: Maximum number of cached phone numbers
         """
         self.api_endpoint = api_endpoint.rstrip('/')
         self.api_key = api_key
         self.timeout = timeout
+        self.client = client
+        self._owns_client = False
+        self._headers = {"Authorization": f"Bearer {api_key}"} if api_key else {}
+
+        # phone -> (stored_at, response), oldest first; errors are not cached
+        self.cache_ttl = cache_ttl
+        self.cache_size = cache_size
+        self._cache: "OrderedDict[str, Tuple[float, Dict[str, Any]]]" = OrderedDict()
+        # Lookups in progress, so concurrent requests for a number share one
+        self._inflight: Dict[str, asyncio.Future] = {}
+
+    def _get_client(self) -> httpx.AsyncClient:
+        """Get the HTTP client, creating a pooled keep-alive client if needed."""
+        if self.client is None:
+            self.client = create_http_client(timeout=self.timeout)
+            self._owns_client = True
+        return self.client
+
+    async def aclose(self):
+        """Close the HTTP client if this plugin created it."""
+        if self._owns_client and self.client is not None:
+            await self.client.aclose()
+            self.client = None
+            self._owns_client = False
 
     async def execute(
         self,
@@ -68,34 +103,63 @@ class CustomerLookupPlugin(ExternalPlugin):
         if not phone_number:
             return {"error": "Phone number is required"}
 
+        if self.cache_ttl > 0:
+            cached = self._cache.get(phone_number)
+            if cached is not None:
+                if time.monotonic() - cached[0] < self.cache_ttl:
+                    return cached[1]
+                del self._cache[phone_number]
+
+        inflight = self._inflight.get(phone_number)
+        if inflight is not None:
+            return await asyncio.shield(inflight)
+
+        future = asyncio.get_running_loop().create_future()
+        self._inflight[phone_number] = future
+        try:
+            # _fetch handles its own errors, so only cancellation escapes
+            result = await self._fetch(phone_number)
+        except BaseException:
+            future.cancel()
+            raise
+        else:
+            future.set_result(result)
+        finally:
+            del self._inflight[phone_number]
+
+        if self.cache_ttl > 0 and "error" not in result:
+            self._cache[phone_number] = (time.monotonic(), result)
+            if len(self._cache) > self.cache_size:
+                self._cache.popitem(last=False)
+
+        return result
+
+    async def _fetch(self, phone_number: str) -> Dict[str, Any]:
+        """Query the customer API for a phone number."""
         try:
-            headers = {}
-            if self.api_key:
-                headers["Authorization"] = f"Bearer {self.api_key}"
-
-            async with httpx.AsyncClient(timeout=self.timeout) as client:
-                response = await client.get(
-                    f"{self.api_endpoint}/customers",
-                    params={"phone": phone_number},
-                    headers=headers
-                )
-
-                if response.status_code == 200:
-                    data = response.json()
-                    return {
-                        "found": True,
-                        "customer": data
-                    }
-                elif response.status_code == 404:
-                    return {
-                        "found": False,
-                        "message": "Customer not found"
-                    }
-                else:
-                    logger.error(f"Customer API error: {response.status_code}")
-                    return {
-                        "error": "Unable to fetch customer information"
-                    }
+            response = await self._get_client().get(
+                f"{self.api_endpoint}/customers",
+                params={"phone": phone_number},
+                headers=self._headers,
+                timeout=self.timeout
+            )
+
+            if response.status_code == 200:
+                data = response.json()
+                return {
+                    "found": True,
+                    "customer": data
+                }
+            elif response.status_code == 404:
+                return {
+                    "found": False,
+                    "message": "Customer not found"
+                }
+            else:
+                logger.error(f"Customer API error: {response.status_code}")
+                return {
+                    "error": "Unable to fetch customer information"
+                }
 
         except httpx.TimeoutException:
             logger.error("Customer API timeout")
@@ -142,6 +206,22 @@ class MockCustomerLookupPlugin(ExternalPlugin):
         }
     }
 
+    # Responses are built once and shared; callers only serialize them
+    _HIT_RESPONSES = {
+        phone: {"found": True, "customer": customer}
+        for phone, customer in MOCK_CUSTOMERS.items()
+    }
+    _DEFAULT_RESPONSE = {
+        "found": True,
+        "customer": {
+            "name": "Valued Customer",
+            "account_number": "GUEST",
+            "status": "active",
+            "balance": 0.00,
+            "membership_tier": "standard"
+        }
+    }
+
     async def execute(
         self,
         params: Dict[str, Any],
@@ -154,21 +234,5 @@ class MockCustomerLookupPlugin(ExternalPlugin):
         if not phone and context.get("caller_number"):
             phone = context["caller_number"]
 
-        # Look up in mock database
-        if phone in self.MOCK_CUSTOMERS:
-            return {
-                "found": True,
-                "customer": self.MOCK_CUSTOMERS[phone]
-            }
-
-        # Generate generic response for unknown numbers
-        return {
-            "found": True,
-            "customer": {
-                "name": "Valued Customer",
-                "account_number": "GUEST",
-                "status": "active",
-                "balance": 0.00,
-                "membership_tier": "standard"
-            }
-        }
+        # Look up in mock database, with a generic response for unknown numbers
+        return self._HIT_RESPONSES.get(phone, self._DEFAULT_RESPONSE)
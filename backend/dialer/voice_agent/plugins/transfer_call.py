@@ -1,7 +1,8 @@
 """
 Call transfer plugin - transfers calls to human agents.
 """
-from typing import Dict, Any, Optional, List
+from types import MappingProxyType
+from typing import Dict, Any, Mapping, Optional, List
 import logging
 
 from dialer.voice_agent.plugins.base import ExternalPlugin, PluginParameter
@@ -44,7 +45,7 @@ class TransferCallPlugin(ExternalPlugin):
 
     def __init__(
         self,
-        department_extensions: Optional[Dict[str, str]] = None
+        department_extensions: Optional[Mapping[str, str]] = None
     ):
         """
         Initialize transfer plugin.
@@ -52,12 +53,14 @@ class TransferCallPlugin(ExternalPlugin):
         Args:
             department_extensions: Mapping of department names to extensions
         """
-        self.department_extensions = department_extensions or {
+        # Read-only copy, so the default below can't go stale
+        self.department_extensions = MappingProxyType(dict(department_extensions or {
             "sales": "2001",
             "support": "2002",
             "billing": "2003",
             "general": "2000"
-        }
+        }))
+        self._default_extension = self.department_extensions.get("general", "2000")
 
     async def execute(
         self,
@@ -79,14 +82,11 @@ class TransferCallPlugin(ExternalPlugin):
         priority = params.get("priority", "normal")
 
         # Get extension for department
-        extension = self.department_extensions.get(
-            department,
-            self.department_extensions.get("general", "2000")
-        )
+        extension = self.department_extensions.get(department, self._default_extension)
 
         logger.info(
-            f"Transfer requested: {department} (ext: {extension}), "
-            f"reason: {reason}, priority: {priority}"
+            "Transfer requested: %s (ext: %s), reason: %s, priority: %s",
+            department, extension, reason, priority
         )
 
         return {
@@ -132,7 +132,7 @@ class HangupCallPlugin(ExternalPlugin):
         """
         reason = params.get("reason", "completed")
 
-        logger.info(f"Hangup requested: {reason}")
+        logger.info("Hangup requested: %s", reason)
 
         return {
             "action": "hangup",
@@ -177,7 +177,7 @@ class EscalatePlugin(ExternalPlugin):
         issue_type = params.get("issue_type", "other")
         summary = params.get("summary", "")
 
-        logger.info(f"Escalation requested: {issue_type} - {summary}")
+        logger.info("Escalation requested: %s - %s", issue_type, summary)
 
         return {
             "action": "transfer",
@@ -2,21 +2,114 @@
 Voice Agent Session - Main orchestrator for AI voice conversations.
 """
 import asyncio
+import re
+import time
+from concurrent.futures import Executor
 from datetime import datetime
-from typing import Optional, Dict, Any, List, Callable, Awaitable
+from functools import partial
+from typing import Optional, Dict, Any, List, NamedTuple, Tuple, Callable, Awaitable, AsyncIterator
 from dataclasses import dataclass, field
 import logging
 
+from openai import AsyncOpenAI
+
 from dialer.voice_agent.vad import SimpleVAD
-from dialer.voice_agent.transcriber import WhisperTranscriber
+from dialer.voice_agent.transcriber import (
+    WhisperTranscriber,
+    LocalWhisperTranscriber,
+    FASTER_WHISPER_AVAILABLE
+)
 from dialer.voice_agent.llm_processor import ConversationProcessor
-from dialer.voice_agent.synthesizer import TTSSynthesizer, InMemoryTTSCache
-from dialer.voice_agent.audio_converter import convert_for_whisper, convert_from_tts
+from dialer.voice_agent.synthesizer import TTSSynthesizer, InMemoryTTSCache, CacheService
+from dialer.voice_agent.audio_converter import (
+    convert_for_whisper,
+    convert_from_tts,
+    AV_AVAILABLE,
+    NUMPY_AVAILABLE,
+    ULAW_TO_LINEAR_NP,
+    ALAW_TO_LINEAR_NP
+)
+
+if NUMPY_AVAILABLE:
+    import numpy as np
 
 logger = logging.getLogger(__name__)
 
+# End of a sentence in streamed LLM output. Requires following whitespace,
+# so "3." in "3.50" isn't split before the rest of the number arrives
+_SENTENCE_END = re.compile(r'[.!?]+\s+')
+
+# G.711 byte -> sample / 32768, for computing VAD energy straight from
+# the telephony audio (SimpleVAD itself expects 16-bit PCM)
+_ENERGY_TABLES = {
+    "ulaw": (ULAW_TO_LINEAR_NP / 32768.0).astype(np.float32),
+    "alaw": (ALAW_TO_LINEAR_NP / 32768.0).astype(np.float32),
+} if NUMPY_AVAILABLE else {}
+
+# G.711 encoding of a zero sample; a chunk of only this byte is digital silence
+_SILENCE_BYTES = {"ulaw": b"\xff", "alaw": b"\xd5"}
+
+
+def _telephony_cache_key(tts: TTSSynthesizer, config: "VoiceAgentConfig", text: str) -> str:
+    """Cache key for text synthesized and converted to the session's output format."""
+    return f"{tts.get_cache_key(text)}-{config.output_format}{config.output_sample_rate}"
+
+
+async def _synthesize_telephony(
+    tts: TTSSynthesizer,
+    cache: Optional[CacheService],
+    config: "VoiceAgentConfig",
+    text: str,
+    executor: Optional[Executor] = None,
+    cache_key: Optional[str] = None
+) -> bytes:
+    """
+    Synthesize text and convert it to the telephony format.
+
+    The converted audio is what gets cached, so a cache hit is ready to
+    play with no decoding or resampling.
+    """
+    if cache is not None:
+        if cache_key is None:
+            cache_key = _telephony_cache_key(tts, config, text)
+        cached = await cache.get(cache_key)
+        if cached:
+            return cached
+
+    audio_bytes = await tts.synthesize(text)
+    if not audio_bytes:
+        return b""
+
+    # Convert for telephony (off the event loop), unless TTS already
+    # produced 8kHz u-law
+    if not (config.tts_format == config.output_format == "ulaw" and config.output_sample_rate == 8000):
+        audio_bytes = await asyncio.get_running_loop().run_in_executor(
+            executor,
+            partial(
+                convert_from_tts,
+                audio_bytes,
+                source_format=config.tts_format,
+                target_format=config.output_format,
+                target_rate=config.output_sample_rate
+            )
+        )
 
-@dataclass
+    if cache is not None and audio_bytes:
+        await cache.set(cache_key, audio_bytes)
+    return audio_bytes
+
+
+# Fixed phrases spoken by the session itself
+MAX_TURNS_MESSAGE = "I apologize, but we've reached the conversation limit. Let me transfer you to an agent."
+MAX_DURATION_MESSAGE = "I need to wrap up our call now. Is there anything else I can quickly help with?"
+ERROR_MESSAGE = "I'm sorry, I encountered an error. Please try again or speak with an agent."
+
+# Telephony-ready audio for fixed phrases, filled by VoiceAgentSession.prewarm()
+# and keyed by (tts model, voice, output format, output rate, text)
+_PREWARMED: Dict[Tuple[str, str, str, int, str], bytes] = {}
+
+
+@dataclass(slots=True)
 class VoiceAgentConfig:
     """Configuration for voice agent session."""
     # OpenAI settings
@@ -24,8 +117,17 @@ class VoiceAgentConfig:
     llm_model: str = "gpt-4o-mini"
     tts_voice: str = "nova"
     tts_model: str = "tts-1"
+    # Opus is ~8x smaller than raw PCM to download and cache, but needs
+    # PyAV to decode
+    tts_format: str = "opus" if AV_AVAILABLE else "pcm"
     whisper_model: str = "whisper-1"
 
+    # Speech-to-text backend: "openai" (Whisper API) or "local" (faster-whisper)
+    whisper_backend: str = "openai"
+    local_whisper_model: str = "small.en"
+    local_whisper_device: str = "cuda"
+    local_whisper_compute_type: str = "int8_float16"
+
     # System prompt
     system_prompt: str = "You are a helpful AI assistant handling phone calls."
     greeting_message: str = "Hello, thank you for calling. How can I help you today?"
@@ -49,6 +151,8 @@ class VoiceAgentConfig:
 
     # Plugins
     plugins: List["ExternalPlugin"] = field(default_factory=list)
+    # Also offer the batch_invoke tool (runs several plugins in one call)
+    batch_tools: bool = False
 
     # Audio settings
     input_format: str = "ulaw"
@@ -56,8 +160,11 @@ class VoiceAgentConfig:
     output_format: str = "ulaw"
     output_sample_rate: int = 8000
 
+    # TTS cache shared across sessions (per-session in-memory cache if None)
+    tts_cache: Optional[CacheService] = None
 
-@dataclass
+
+@dataclass(slots=True)
 class SessionStats:
     """Statistics for a voice agent session."""
     started_at: datetime = field(default_factory=datetime.utcnow)
@@ -68,13 +175,27 @@ class SessionStats:
     llm_output_tokens: int = 0
     tts_characters: int = 0
 
+    # Prices in USD per unit
+    _WHISPER_PER_SECOND = 0.006 / 60
+    _LLM_INPUT_PER_TOKEN = 0.00015 / 1000
+    _LLM_OUTPUT_PER_TOKEN = 0.0006 / 1000
+    _TTS_PER_CHARACTER = 0.015 / 1000
+
     def calculate_cost(self) -> float:
         """Calculate estimated cost."""
-        whisper_cost = self.whisper_seconds / 60 * 0.006
-        llm_input_cost = self.llm_input_tokens / 1000 * 0.00015
-        llm_output_cost = self.llm_output_tokens / 1000 * 0.0006
-        tts_cost = self.tts_characters / 1000 * 0.015
-        return whisper_cost + llm_input_cost + llm_output_cost + tts_cost
+        return (
+            self.whisper_seconds * self._WHISPER_PER_SECOND
+            + self.llm_input_tokens * self._LLM_INPUT_PER_TOKEN
+            + self.llm_output_tokens * self._LLM_OUTPUT_PER_TOKEN
+            + self.tts_characters * self._TTS_PER_CHARACTER
+        )
+
+
+class Turn(NamedTuple):
+    """A single conversation turn in the session transcript."""
+    role: str
+    content: str
+    timestamp: int  # time.time_ns()
 
 
 class VoiceAgentSession:
@@ -95,7 +216,9 @@ class VoiceAgentSession:
         config: VoiceAgentConfig,
         play_audio_callback: Callable[[bytes], Awaitable[None]],
         get_audio_callback: Callable[[], Awaitable[Optional[bytes]]],
-        context: Optional[Dict[str, Any]] = None
+        context: Optional[Dict[str, Any]] = None,
+        audio_executor: Optional[Executor] = None,
+        openai_client: Optional[AsyncOpenAI] = None
     ):
         """
         Initialize voice agent session.
@@ -105,11 +228,20 @@ class VoiceAgentSession:
             play_audio_callback: Async callback to play audio to caller
             get_audio_callback: Async callback to get audio from caller
             context: Optional context (caller info, etc.)
+            audio_executor: Executor for audio format conversion
+                (defaults to the event loop's default executor)
+            openai_client: Shared OpenAI client; if omitted the session
+                creates one for its components and closes it when it ends
         """
         self.config = config
         self.play_audio = play_audio_callback
         self.get_audio = get_audio_callback
         self.context = context or {}
+        self.audio_executor = audio_executor
+
+        # One client (and connection pool) for Whisper, GPT and TTS
+        self._owns_client = openai_client is None
+        self.openai_client = openai_client or AsyncOpenAI(api_key=config.openai_api_key)
 
         # Initialize components
         self.vad = SimpleVAD(
@@ -119,10 +251,23 @@ class VoiceAgentSession:
             sample_rate=config.input_sample_rate
         )
 
-        self.transcriber = WhisperTranscriber(
-            api_key=config.openai_api_key,
-            model=config.whisper_model
-        )
+        use_local_whisper = config.whisper_backend == "local"
+        if use_local_whisper and not FASTER_WHISPER_AVAILABLE:
+            logger.warning("faster-whisper not installed, using the Whisper API")
+            use_local_whisper = False
+
+        if use_local_whisper:
+            self.transcriber = LocalWhisperTranscriber(
+                model=config.local_whisper_model,
+                device=config.local_whisper_device,
+                compute_type=config.local_whisper_compute_type
+            )
+        else:
+            self.transcriber = WhisperTranscriber(
+                api_key=config.openai_api_key,
+                model=config.whisper_model,
+                client=self.openai_client
+            )
 
         self.llm = ConversationProcessor(
             api_key=config.openai_api_key,
@@ -130,21 +275,135 @@ class VoiceAgentSession:
             model=config.llm_model,
             max_tokens=config.llm_max_tokens,
             temperature=config.llm_temperature,
-            plugins=config.plugins
+            plugins=config.plugins,
+            batch_tools=config.batch_tools,
+            client=self.openai_client
         )
 
+        # Caches converted telephony audio, so TTS itself is uncached
+        self.audio_cache = config.tts_cache or InMemoryTTSCache()
         self.tts = TTSSynthesizer(
             api_key=config.openai_api_key,
             voice=config.tts_voice,
             model=config.tts_model,
-            cache_service=InMemoryTTSCache()
+            output_format=config.tts_format,
+            client=self.openai_client
         )
 
+        # Cache keys for the fixed phrases, so they aren't rehashed each time
+        self._phrase_keys: Dict[str, str] = {
+            text: _telephony_cache_key(self.tts, config, text)
+            for text in (
+                config.greeting_message,
+                config.fallback_message,
+                config.goodbye_message,
+                config.transfer_message,
+                MAX_TURNS_MESSAGE,
+                MAX_DURATION_MESSAGE,
+                ERROR_MESSAGE,
+            )
+            if text
+        }
+
         # Session state
         self.running = False
         self.stats = SessionStats()
-        self.transcript: List[Dict[str, Any]] = []
+        self.transcript: List[Turn] = []
         self._pending_action: Optional[Dict] = None
+        self._loop_start = 0.0
+
+        # Audio capture runs in its own task for the whole session; each
+        # completed utterance is queued with its transcription already running
+        self._capture_task: Optional[asyncio.Task] = None
+        self._utterances: asyncio.Queue = asyncio.Queue(maxsize=2)
+        self._energy_table = _ENERGY_TABLES.get(config.input_format)
+        self._silence_byte = _SILENCE_BYTES.get(config.input_format, b"")
+        self._silence_chunk = b""
+
+    @classmethod
+    async def prewarm(
+        cls,
+        config: VoiceAgentConfig,
+        openai_client: Optional[AsyncOpenAI] = None,
+        audio_executor: Optional[Executor] = None
+    ) -> int:
+        """
+        Synthesize the fixed phrases for a configuration ahead of calls.
+
+        The converted telephony audio is kept in memory for the process,
+        so sessions speak these phrases without a TTS request or audio
+        conversion. A local Whisper model, if configured, is loaded too.
+
+        Args:
+            config: Voice agent configuration
+            openai_client: Shared OpenAI client (one is created if omitted)
+            audio_executor: Executor for audio format conversion
+                (defaults to the event loop's default executor)
+
+        Returns:
+            Number of phrases newly prewarmed
+        """
+        client = openai_client or AsyncOpenAI(api_key=config.openai_api_key)
+        tts = TTSSynthesizer(
+            api_key=config.openai_api_key,
+            voice=config.tts_voice,
+            model=config.tts_model,
+            output_format=config.tts_format,
+            client=client
+        )
+        phrases = (
+            config.greeting_message,
+            config.fallback_message,
+            config.goodbye_message,
+            config.transfer_message,
+            MAX_TURNS_MESSAGE,
+            MAX_DURATION_MESSAGE,
+            ERROR_MESSAGE,
+        )
+
+        count = 0
+        try:
+            # Load the local speech-to-text model now rather than stalling
+            # the first call that needs it
+            if config.whisper_backend == "local" and FASTER_WHISPER_AVAILABLE:
+                try:
+                    await LocalWhisperTranscriber(
+                        model=config.local_whisper_model,
+                        device=config.local_whisper_device,
+                        compute_type=config.local_whisper_compute_type
+                    ).load()
+                except Exception as e:
+                    logger.warning(f"Prewarm failed to load local Whisper model: {e}")
+
+            for text in phrases:
+                key = cls._prewarm_key(config, text)
+                if not text or key in _PREWARMED:
+                    continue
+                try:
+                    audio = await _synthesize_telephony(
+                        tts, config.tts_cache, config, text, audio_executor
+                    )
+                except Exception as e:
+                    logger.warning(f"Prewarm failed for {text[:50]!r}: {e}")
+                    continue
+                if audio:
+                    _PREWARMED[key] = audio
+                    count += 1
+        finally:
+            if openai_client is None:
+                await client.close()
+
+        return count
+
+    @staticmethod
+    def _prewarm_key(config: VoiceAgentConfig, text: str) -> Tuple[str, str, str, int, str]:
+        return (
+            config.tts_model,
+            config.tts_voice,
+            config.output_format,
+            config.output_sample_rate,
+            text
+        )
 
     async def start(self) -> Dict[str, Any]:
         """
@@ -155,9 +414,13 @@ class VoiceAgentSession:
         """
         self.running = True
         self.stats.started_at = datetime.utcnow()
+        loop = asyncio.get_running_loop()
+        self._loop_start = loop.time()
 
         logger.info(f"Voice agent session started: {self.context}")
 
+        self._capture_task = asyncio.create_task(self._capture())
+
         try:
             # Play greeting
             await self._speak(self.config.greeting_message)
@@ -167,14 +430,13 @@ class VoiceAgentSession:
                 # Check limits
                 if self.stats.turn_count >= self.config.max_turns:
                     logger.info("Max turns reached")
-                    await self._speak("I apologize, but we've reached the conversation limit. Let me transfer you to an agent.")
+                    await self._speak(MAX_TURNS_MESSAGE)
                     self._pending_action = {"action": "transfer", "reason": "max_turns"}
                     break
 
-                elapsed = (datetime.utcnow() - self.stats.started_at).total_seconds()
-                if elapsed >= self.config.max_call_duration_seconds:
+                if loop.time() - self._loop_start >= self.config.max_call_duration_seconds:
                     logger.info("Max duration reached")
-                    await self._speak("I need to wrap up our call now. Is there anything else I can quickly help with?")
+                    await self._speak(MAX_DURATION_MESSAGE)
                     break
 
                 # Get user speech
@@ -191,8 +453,8 @@ class VoiceAgentSession:
                 self._log_turn("user", user_text)
                 self.stats.turn_count += 1
 
-                # Process with LLM
-                response_text = await self.llm.process(user_text, self.context)
+                # Process with LLM, speaking the reply as it streams in
+                response_text = await self._speak_stream(self._reply_stream(user_text))
 
                 # Check for actions
                 if self.llm.pending_action:
@@ -207,17 +469,16 @@ class VoiceAgentSession:
                         await self._speak(self.config.goodbye_message)
                         break
 
-                # Speak response
+                # Log response (already spoken)
                 if response_text:
                     self._log_turn("assistant", response_text)
-                    await self._speak(response_text)
 
         except asyncio.CancelledError:
             logger.info("Voice agent session cancelled")
         except Exception as e:
             logger.error(f"Voice agent session error: {e}")
             try:
-                await self._speak("I'm sorry, I encountered an error. Please try again or speak with an agent.")
+                await self._speak(ERROR_MESSAGE)
             except:
                 pass
 
@@ -232,96 +493,188 @@ class VoiceAgentSession:
 
     async def _listen(self) -> Optional[str]:
         """
-        Listen for and transcribe user speech.
+        Wait for and transcribe user speech.
 
         Returns:
             Transcribed text or None if timeout
         """
-        start_time = asyncio.get_event_loop().time()
-        self.vad.reset()
+        # Wait on the capture task too, so a capture failure ends the
+        # session instead of leaving every listen to time out
+        getter = asyncio.ensure_future(self._utterances.get())
+        done, _ = await asyncio.wait(
+            (getter, self._capture_task),
+            timeout=self.config.silence_timeout_seconds,
+            return_when=asyncio.FIRST_COMPLETED
+        )
 
-        while self.running:
-            # Check timeout
-            elapsed = asyncio.get_event_loop().time() - start_time
-            if elapsed >= self.config.silence_timeout_seconds:
-                # Check if we have any speech buffered
-                audio = self.vad.force_end()
-                if audio:
-                    return await self._transcribe(audio)
-                return None
+        if getter in done:
+            return await getter.result()
+        getter.cancel()
 
-            # Get audio chunk
-            try:
-                audio_chunk = await asyncio.wait_for(
-                    self.get_audio(),
-                    timeout=0.1
-                )
-            except asyncio.TimeoutError:
-                continue
+        if self._capture_task.done():
+            # Re-raises the capture error (a capture that stopped cleanly
+            # means the session is stopping)
+            self._capture_task.result()
+
+        # Timeout; check if we have any speech buffered
+        audio = self.vad.force_end()
+        if audio:
+            return await self._transcribe(audio)
+        return None
 
+    async def _capture(self):
+        """
+        Feed caller audio through VAD for the whole session.
+
+        Runs alongside the conversation loop, so audio keeps being collected
+        while an utterance is transcribed and answered. Transcription starts
+        as soon as an utterance ends; _listen() picks up the results in order.
+        """
+        while self.running:
+            audio_chunk = await self.get_audio()
             if audio_chunk is None:
                 continue
 
-            # Process with VAD
-            complete_utterance = self.vad.process_chunk(audio_chunk)
+            # VAD buffers the raw chunk; for G.711 input the energy is
+            # computed here from the decoded samples
+            energy = self._chunk_energy(audio_chunk) if self._energy_table is not None else None
+            complete_utterance = self.vad.process_chunk(audio_chunk, energy)
             if complete_utterance:
-                return await self._transcribe(complete_utterance)
+                await self._utterances.put(
+                    asyncio.create_task(self._transcribe(complete_utterance))
+                )
 
-        return None
+    def _chunk_energy(self, audio_chunk: bytes) -> float:
+        """Normalized RMS energy of a G.711 chunk (one table gather and dot product)."""
+        # Digital silence is caught by a single memcmp against a cached chunk
+        if len(audio_chunk) != len(self._silence_chunk):
+            self._silence_chunk = self._silence_byte * len(audio_chunk)
+        if audio_chunk == self._silence_chunk:
+            return 0.0
+
+        samples = self._energy_table[np.frombuffer(audio_chunk, dtype=np.uint8)]
+        return float(np.sqrt(np.dot(samples, samples) / len(samples)))
 
     async def _transcribe(self, audio_bytes: bytes) -> str:
         """Transcribe audio to text."""
-        # Convert audio format for Whisper
-        pcm_bytes, sample_rate = convert_for_whisper(
-            audio_bytes,
-            source_format=self.config.input_format,
-            source_rate=self.config.input_sample_rate
+        # Convert audio format for Whisper (off the event loop)
+        pcm_bytes, sample_rate = await asyncio.get_running_loop().run_in_executor(
+            self.audio_executor,
+            partial(
+                convert_for_whisper,
+                audio_bytes,
+                source_format=self.config.input_format,
+                source_rate=self.config.input_sample_rate
+            )
         )
 
-        # Transcribe
-        text = await self.transcriber.transcribe(
+        return await self.transcriber.transcribe(
             pcm_bytes,
             sample_rate=sample_rate
         )
 
-        # Update stats
-        self.stats.whisper_seconds = self.transcriber.total_seconds_transcribed
-
-        return text
-
     async def _speak(self, text: str):
         """Synthesize and play speech."""
         if not text:
             return
 
-        # Synthesize
-        audio_bytes = await self.tts.synthesize(text)
-
-        if audio_bytes:
-            # Convert for telephony
-            telephony_audio = convert_from_tts(
-                audio_bytes,
-                target_format=self.config.output_format,
-                target_rate=self.config.output_sample_rate
-            )
+        # Fixed phrases are synthesized once per process by prewarm()
+        prewarmed = _PREWARMED.get(self._prewarm_key(self.config, text))
+        if prewarmed is not None:
+            await self.play_audio(prewarmed)
+            return
 
-            # Play
+        telephony_audio = await self._synthesize(text, self._phrase_keys.get(text))
+        if telephony_audio:
             await self.play_audio(telephony_audio)
 
-        # Update stats
-        self.stats.tts_characters = self.tts.total_characters_synthesized
+    async def _synthesize(self, text: str, cache_key: Optional[str] = None) -> bytes:
+        """Synthesize text and convert it to the telephony format."""
+        return await _synthesize_telephony(
+            self.tts, self.audio_cache, self.config, text, self.audio_executor, cache_key
+        )
+
+    async def _reply_stream(self, user_text: str) -> AsyncIterator[str]:
+        """
+        Stream the LLM reply to the user.
+
+        Drops text once a transfer/hangup is pending, since the configured
+        transfer/goodbye message is spoken instead. The stream is still
+        consumed to the end so the processor records the reply.
+        """
+        async for text in self.llm.process_stream(user_text, self.context):
+            if not self.llm.pending_action:
+                yield text
+
+    async def _speak_stream(self, text_iter: AsyncIterator[str]) -> str:
+        """
+        Speak streamed text sentence by sentence.
+
+        Each complete sentence is sent to TTS as soon as it arrives, while
+        the text keeps streaming; the audio is played back in order as each
+        synthesis finishes, so playback starts before the text is complete.
+
+        Args:
+            text_iter: Async iterator of text fragments
+
+        Returns:
+            The full text that was spoken
+        """
+        queue: asyncio.Queue = asyncio.Queue()
+        tasks: List[asyncio.Task] = []
+        parts: List[str] = []
+
+        def enqueue(sentence: str):
+            if sentence.strip():
+                task = asyncio.create_task(self._synthesize(sentence))
+                tasks.append(task)
+                queue.put_nowait(task)
+
+        async def produce():
+            buffer = ""
+            try:
+                async for text in text_iter:
+                    parts.append(text)
+                    buffer += text
+                    # Flush every complete sentence in the buffer
+                    end = 0
+                    for match in _SENTENCE_END.finditer(buffer):
+                        enqueue(buffer[end:match.end()])
+                        end = match.end()
+                    buffer = buffer[end:]
+                enqueue(buffer)
+            finally:
+                queue.put_nowait(None)
+
+        async def play():
+            while (task := await queue.get()) is not None:
+                telephony_audio = await task
+                if telephony_audio:
+                    await self.play_audio(telephony_audio)
+
+        producer = asyncio.create_task(produce())
+        try:
+            await play()
+            await producer
+        finally:
+            producer.cancel()
+            for task in tasks:
+                task.cancel()
+
+        return "".join(parts)
 
     def _log_turn(self, role: str, content: str):
         """Log a conversation turn."""
-        self.transcript.append({
-            "role": role,
-            "content": content,
-            "timestamp": datetime.utcnow().isoformat()
-        })
+        self.transcript.append(Turn(role, content, time.time_ns()))
 
     async def _end_session(self):
         """Clean up session."""
         self.running = False
+
+        if self._capture_task is not None:
+            self._capture_task.cancel()
+        while not self._utterances.empty():
+            self._utterances.get_nowait().cancel()
         self.stats.ended_at = datetime.utcnow()
 
         # Update final stats from components
@@ -330,6 +683,9 @@ class VoiceAgentSession:
         self.stats.llm_output_tokens = self.llm.total_output_tokens
         self.stats.tts_characters = self.tts.total_characters_synthesized
 
+        if self._owns_client:
+            await self.openai_client.close()
+
         logger.info(
             f"Voice agent session ended: turns={self.stats.turn_count}, "
             f"cost=${self.stats.calculate_cost():.4f}"
@@ -338,7 +694,10 @@ class VoiceAgentSession:
     def _get_result(self) -> Dict[str, Any]:
         """Get session result."""
         return {
-            "transcript": self.transcript,
+            "transcript": [
+                {"role": role, "content": content, "timestamp": datetime.utcfromtimestamp(ts / 1e9).isoformat()}
+                for role, content, ts in self.transcript
+            ],
             "stats": {
                 "started_at": self.stats.started_at.isoformat(),
                 "ended_at": self.stats.ended_at.isoformat() if self.stats.ended_at else None,
@@ -3,13 +3,21 @@ OpenAI TTS synthesis wrapper with caching support.
 """
 import asyncio
 import hashlib
-from typing import Optional, Protocol
+import os
+import re
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import Optional, Protocol, Tuple, Union
 import logging
 
-from openai import OpenAI
+from openai import AsyncOpenAI
 
 logger = logging.getLogger(__name__)
 
+# Markup tags stripped from SSML before synthesis
+_SSML_TAGS = re.compile(r'<[^>]+>')
+
 
 class CacheService(Protocol):
     """Protocol for TTS cache service."""
@@ -38,7 +46,8 @@ class TTSSynthesizer:
         voice: str = "nova",
         model: str = "tts-1",
         cache_service: Optional[CacheService] = None,
-        output_format: str = "pcm"
+        output_format: str = "pcm",
+        client: Optional[AsyncOpenAI] = None
     ):
         """
         Initialize TTS synthesizer.
@@ -49,13 +58,14 @@ class TTSSynthesizer:
             model: TTS model (tts-1 or tts-1-hd)
             cache_service: Optional cache service for caching audio
             output_format: Output format (pcm, mp3, opus, aac, flac)
+            client: Optional shared OpenAI client (created from api_key if omitted)
         """
         if voice not in self.VOICES:
             raise ValueError(f"Invalid voice: {voice}. Must be one of {self.VOICES}")
         if model not in self.MODELS:
             raise ValueError(f"Invalid model: {model}. Must be one of {self.MODELS}")
 
-        self.client = OpenAI(api_key=api_key)
+        self.client = client or AsyncOpenAI(api_key=api_key)
         self.voice = voice
         self.model = model
         self.cache = cache_service
@@ -67,12 +77,14 @@ class TTSSynthesizer:
         """Get total characters synthesized for cost tracking."""
         return self._total_characters
 
-    async def synthesize(self, text: str) -> bytes:
+    async def synthesize(self, text: str, cache_key: Optional[str] = None) -> bytes:
         """
         Convert text to speech audio.
 
         Args:
             text: Text to synthesize
+            cache_key: Precomputed cache key for the text (see get_cache_key);
+                computed here if omitted
 
         Returns:
             Audio bytes in the specified format
@@ -84,8 +96,9 @@ class TTSSynthesizer:
 
         try:
             # Check cache first
-            cache_key = self._get_cache_key(text)
             if self.cache:
+                if cache_key is None:
+                    cache_key = self._get_cache_key(text)
                 cached = await self.cache.get(cache_key)
                 if cached:
                     logger.debug(f"TTS cache hit for: {text[:50]}...")
@@ -95,10 +108,7 @@ class TTSSynthesizer:
             self._total_characters += len(text)
 
             # Call TTS API
-            audio_bytes = await asyncio.to_thread(
-                self._call_tts_api,
-                text
-            )
+            audio_bytes = await self._call_tts_api(text)
 
             # Cache the result
             if self.cache and audio_bytes:
@@ -110,9 +120,9 @@ class TTSSynthesizer:
             logger.error(f"TTS synthesis error: {e}")
             return b""
 
-    def _call_tts_api(self, text: str) -> bytes:
-        """Make synchronous call to TTS API."""
-        response = self.client.audio.speech.create(
+    async def _call_tts_api(self, text: str) -> bytes:
+        """Call the TTS API."""
+        response = await self.client.audio.speech.create(
             model=self.model,
             voice=self.voice,
             input=text,
@@ -120,6 +130,10 @@ class TTSSynthesizer:
         )
         return response.content
 
+    def get_cache_key(self, text: str) -> str:
+        """Cache key synthesize() uses for text, for callers to precompute."""
+        return self._get_cache_key(text.strip())
+
     def _get_cache_key(self, text: str) -> str:
         """
         Generate cache key from text and voice settings.
@@ -128,10 +142,10 @@ class TTSSynthesizer:
             text: Text to synthesize
 
         Returns:
-            SHA256 hash as cache key
+            128-bit BLAKE2b hex digest as cache key
         """
         key_data = f"{self.model}:{self.voice}:{self.output_format}:{text}"
-        return hashlib.sha256(key_data.encode()).hexdigest()
+        return hashlib.blake2b(key_data.encode(), digest_size=16).hexdigest()
 
     async def synthesize_with_ssml(self, ssml: str) -> bytes:
         """
@@ -145,9 +159,7 @@ class TTSSynthesizer:
             Audio bytes
         """
         # OpenAI doesn't support SSML, extract plain text
-        import re
-        plain_text = re.sub(r'<[^>]+>', '', ssml)
-        return await self.synthesize(plain_text)
+        return await self.synthesize(_SSML_TAGS.sub('', ssml))
 
     def reset_stats(self):
         """Reset synthesis statistics."""
@@ -155,7 +167,7 @@ class TTSSynthesizer:
 
 
 class InMemoryTTSCache:
-    """Simple in-memory cache for TTS audio."""
+    """Simple in-memory LRU cache for TTS audio."""
 
     def __init__(self, max_size: int = 100):
         """
@@ -164,17 +176,142 @@ class InMemoryTTSCache:
         Args:
             max_size: Maximum number of entries to cache
         """
-        self._cache: dict = {}
+        self._cache: "OrderedDict[str, bytes]" = OrderedDict()
         self._max_size = max_size
 
     async def get(self, key: str) -> Optional[bytes]:
         """Get cached audio bytes."""
-        return self._cache.get(key)
+        data = self._cache.get(key)
+        if data is not None:
+            self._cache.move_to_end(key)
+        return data
 
     async def set(self, key: str, data: bytes) -> None:
         """Cache audio bytes."""
-        # Simple LRU-like behavior: remove oldest if at capacity
-        if len(self._cache) >= self._max_size:
-            oldest_key = next(iter(self._cache))
-            del self._cache[oldest_key]
+        if key in self._cache:
+            self._cache.move_to_end(key)
+        elif len(self._cache) >= self._max_size:
+            # Evict the least recently used entry
+            self._cache.popitem(last=False)
         self._cache[key] = data
+
+
+class DiskTTSCache:
+    """
+    Size-bounded LRU cache for TTS audio on disk.
+
+    Survives restarts and can be shared by all sessions (and worker
+    processes) on a host, so fixed phrases like the greeting are only
+    synthesized once. Entries are stored as <path>/<key[:2]>/<key>.bin;
+    the index is rebuilt from the files on startup, and entries written
+    by other processes are picked up on lookup. Each process enforces
+    max_bytes over the entries it knows about, so with several processes
+    the directory can grow beyond it until they evict.
+    """
+
+    def __init__(
+        self,
+        path: Union[str, Path],
+        max_bytes: int = 100 * 1024 * 1024,
+        ttl: float = 86400.0
+    ):
+        """
+        Initialize cache.
+
+        Args:
+            path: Cache directory (created if missing)
+            max_bytes: Maximum total size of cached audio
+            ttl: Seconds an entry is served before it is re-synthesized
+        """
+        self.path = Path(path)
+        self.path.mkdir(parents=True, exist_ok=True)
+        self._max_bytes = max_bytes
+        self._ttl = ttl
+
+        # key -> (created, size), least recently used first
+        self._index: "OrderedDict[str, Tuple[float, int]]" = OrderedDict()
+        self._total_bytes = 0
+
+        entries = []
+        for file in self.path.glob("*/*.bin"):
+            try:
+                stat = file.stat()
+            except OSError:
+                continue
+            entries.append((stat.st_mtime, file.stem, stat.st_size))
+        for created, key, size in sorted(entries):
+            self._index[key] = (created, size)
+            self._total_bytes += size
+
+    def _file(self, key: str) -> Path:
+        return self.path / key[:2] / f"{key}.bin"
+
+    async def get(self, key: str) -> Optional[bytes]:
+        """Get cached audio bytes."""
+        entry = self._index.get(key)
+        if entry is None:
+            # Not indexed here, but another process may have written it
+            try:
+                stat = await asyncio.to_thread(self._file(key).stat)
+            except OSError:
+                return None
+            self._forget(key)
+            entry = self._index[key] = (stat.st_mtime, stat.st_size)
+            self._total_bytes += stat.st_size
+
+        if time.time() - entry[0] > self._ttl:
+            self._forget(key)
+            await asyncio.to_thread(self._unlink, [key])
+            return None
+
+        try:
+            data = await asyncio.to_thread(self._file(key).read_bytes)
+        except OSError:
+            # Removed behind our back (e.g. evicted by another worker)
+            self._forget(key)
+            return None
+
+        if key in self._index:
+            self._index.move_to_end(key)
+        return data
+
+    async def set(self, key: str, data: bytes) -> None:
+        """Cache audio bytes."""
+        try:
+            await asyncio.to_thread(self._write, key, data)
+        except OSError as e:
+            logger.warning(f"TTS disk cache write failed: {e}")
+            return
+
+        self._forget(key)
+        self._index[key] = (time.time(), len(data))
+        self._total_bytes += len(data)
+
+        # Evict least recently used entries until under the size limit
+        evicted = []
+        while self._total_bytes > self._max_bytes and len(self._index) > 1:
+            old_key, (_, size) = self._index.popitem(last=False)
+            self._total_bytes -= size
+            evicted.append(old_key)
+        if evicted:
+            await asyncio.to_thread(self._unlink, evicted)
+
+    def _write(self, key: str, data: bytes):
+        """Write an entry atomically, so readers never see a partial file."""
+        file = self._file(key)
+        file.parent.mkdir(exist_ok=True)
+        tmp = file.with_name(f"{file.name}.{os.getpid()}.tmp")
+        tmp.write_bytes(data)
+        os.replace(tmp, file)
+
+    def _forget(self, key: str):
+        entry = self._index.pop(key, None)
+        if entry is not None:
+            self._total_bytes -= entry[1]
+
+    def _unlink(self, keys):
+        for key in keys:
+            try:
+                self._file(key).unlink()
+            except OSError:
+                pass
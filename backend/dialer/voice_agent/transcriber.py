@@ -2,16 +2,33 @@
 OpenAI Whisper transcription wrapper.
 """
 import asyncio
-import wave
-import struct
-from io import BytesIO
-from typing import Optional
+import threading
+import weakref
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Optional, Dict, List, Tuple
 import logging
 
-from openai import OpenAI
+from openai import AsyncOpenAI
+
+from dialer.voice_agent.audio_converter import pcm_to_wav_fast, resample
 
 logger = logging.getLogger(__name__)
 
+# Utterances shorter than this are VAD false positives; Whisper returns
+# nothing (or hallucinated text) for them, so they are never sent
+MIN_AUDIO_SECONDS = 0.1
+
+# faster-whisper (CTranslate2) for local transcription; optional
+try:
+    import numpy as np
+    from faster_whisper import WhisperModel
+    from faster_whisper.audio import pad_or_trim
+    from faster_whisper.tokenizer import Tokenizer
+    FASTER_WHISPER_AVAILABLE = True
+except ImportError:
+    FASTER_WHISPER_AVAILABLE = False
+    WhisperModel = None
+
 
 class WhisperTranscriber:
     """Transcribe audio using OpenAI Whisper API."""
@@ -20,7 +37,8 @@ class WhisperTranscriber:
         self,
         api_key: str,
         model: str = "whisper-1",
-        language: str = "en"
+        language: str = "en",
+        client: Optional[AsyncOpenAI] = None
     ):
         """
         Initialize Whisper transcriber.
@@ -29,8 +47,9 @@ class WhisperTranscriber:
             api_key: OpenAI API key
             model: Whisper model to use
             language: Language code for transcription
+            client: Optional shared OpenAI client (created from api_key if omitted)
         """
-        self.client = OpenAI(api_key=api_key)
+        self.client = client or AsyncOpenAI(api_key=api_key)
         self.model = model
         self.language = language
         self._total_seconds = 0.0
@@ -59,36 +78,35 @@ class WhisperTranscriber:
         Returns:
             Transcribed text
         """
-        if not audio_bytes:
+        duration_seconds = len(audio_bytes) / (sample_rate * sample_width * channels)
+        if duration_seconds < MIN_AUDIO_SECONDS:
             return ""
 
         try:
             # Convert to WAV format for Whisper API
-            wav_buffer = self._pcm_to_wav(
+            wav_bytes = self._pcm_to_wav(
                 audio_bytes, sample_rate, sample_width, channels
             )
 
             # Track duration for cost calculation
-            duration_seconds = len(audio_bytes) / (sample_rate * sample_width * channels)
             self._total_seconds += duration_seconds
 
-            # Call Whisper API in thread pool
-            response = await asyncio.to_thread(
-                self._call_whisper_api,
-                wav_buffer
-            )
+            # Call Whisper API
+            response = await self._call_whisper_api(wav_bytes)
 
-            return response.text.strip()
+            # response_format="text" returns a plain string
+            text = response if isinstance(response, str) else response.text
+            return text.strip()
 
         except Exception as e:
             logger.error(f"Whisper transcription error: {e}")
             return ""
 
-    def _call_whisper_api(self, wav_buffer: BytesIO) -> object:
-        """Make synchronous call to Whisper API."""
-        return self.client.audio.transcriptions.create(
+    async def _call_whisper_api(self, wav_bytes: bytes) -> object:
+        """Call the Whisper API."""
+        return await self.client.audio.transcriptions.create(
             model=self.model,
-            file=("audio.wav", wav_buffer, "audio/wav"),
+            file=("audio.wav", wav_bytes, "audio/wav"),
             language=self.language,
             response_format="text"
         )
@@ -99,7 +117,7 @@ class WhisperTranscriber:
         sample_rate: int,
         sample_width: int,
         channels: int
-    ) -> BytesIO:
+    ) -> bytes:
         """
         Convert raw PCM audio to WAV format.
 
@@ -110,17 +128,271 @@ class WhisperTranscriber:
             channels: Number of audio channels
 
         Returns:
-            BytesIO containing WAV data
+            WAV file bytes (the SDK uploads bytes directly, no file object needed)
         """
-        buffer = BytesIO()
-        with wave.open(buffer, 'wb') as wav:
-            wav.setnchannels(channels)
-            wav.setsampwidth(sample_width)
-            wav.setframerate(sample_rate)
-            wav.writeframes(pcm_bytes)
-        buffer.seek(0)
-        return buffer
+        return pcm_to_wav_fast(pcm_bytes, sample_rate, sample_width, channels)
 
     def reset_stats(self):
         """Reset transcription statistics."""
         self._total_seconds = 0.0
+
+
+class _LocalWhisperBatcher:
+    """
+    Batches transcription requests from all sessions on one event loop
+    onto a local model.
+
+    Requests arriving within `batch_window` seconds of each other are
+    encoded and decoded together in a single CTranslate2 call, so
+    concurrent calls share the model instead of queueing behind each other.
+    """
+
+    # Whisper's encoder window: 30 s of 16 kHz audio
+    SAMPLE_RATE = 16000
+    MAX_SAMPLES = 30 * SAMPLE_RATE
+
+    def __init__(
+        self,
+        model: "WhisperModel",
+        language: str,
+        max_batch_size: int = 8,
+        batch_window: float = 0.02,
+        beam_size: int = 1
+    ):
+        self.model = model
+        self.language = language
+        self.max_batch_size = max_batch_size
+        self.batch_window = batch_window
+        self.beam_size = beam_size
+
+        tokenizer_language = language if model.model.is_multilingual else "en"
+        self._tokenizer = Tokenizer(
+            model.hf_tokenizer,
+            model.model.is_multilingual,
+            task="transcribe",
+            language=tokenizer_language
+        )
+        self._prompt = model.get_prompt(self._tokenizer, [], without_timestamps=True)
+
+        self._queue: Optional[asyncio.Queue] = None
+        self._worker: Optional[asyncio.Task] = None
+        # The model runs one batch at a time
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="local-whisper")
+
+    async def transcribe(self, audio: "np.ndarray") -> str:
+        """Queue audio (float32, 16 kHz mono) and wait for its transcription."""
+        if self._worker is None or self._worker.done():
+            self._queue = asyncio.Queue()
+            self._worker = asyncio.create_task(self._run())
+
+        future = asyncio.get_running_loop().create_future()
+        await self._queue.put((audio, future))
+        return await future
+
+    async def _run(self):
+        """Collect requests into batches and transcribe them."""
+        loop = asyncio.get_running_loop()
+        while True:
+            batch = [await self._queue.get()]
+            deadline = loop.time() + self.batch_window
+            while len(batch) < self.max_batch_size:
+                timeout = deadline - loop.time()
+                if timeout <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(self._queue.get(), timeout))
+                except asyncio.TimeoutError:
+                    break
+
+            # Drop requests whose callers have gone away
+            batch = [(audio, future) for audio, future in batch if not future.done()]
+            if not batch:
+                continue
+
+            try:
+                texts = await loop.run_in_executor(
+                    self._executor,
+                    self._transcribe_batch,
+                    [audio for audio, _ in batch]
+                )
+            except Exception as e:
+                for _, future in batch:
+                    if not future.done():
+                        future.set_exception(e)
+                continue
+
+            for (_, future), text in zip(batch, texts):
+                if not future.done():
+                    future.set_result(text)
+
+    def _transcribe_batch(self, audios: List["np.ndarray"]) -> List[str]:
+        """Transcribe a batch of utterances (runs in the model thread)."""
+        texts: List[Optional[str]] = [None] * len(audios)
+
+        # Utterances that fit in one encoder window are batched together
+        short = [i for i, audio in enumerate(audios) if len(audio) <= self.MAX_SAMPLES]
+        if short:
+            features = np.stack([
+                pad_or_trim(self.model.feature_extractor(audios[i])) for i in short
+            ])
+            encoder_output = self.model.encode(features)
+            results = self.model.model.generate(
+                encoder_output,
+                [list(self._prompt) for _ in short],
+                beam_size=self.beam_size,
+                max_length=self.model.max_length
+            )
+            for i, result in zip(short, results):
+                texts[i] = self._tokenizer.decode(result.sequences_ids[0]).strip()
+
+        # Longer ones go through the regular (sequential) pipeline
+        for i, audio in enumerate(audios):
+            if texts[i] is None:
+                segments, _ = self.model.transcribe(
+                    audio,
+                    language=self.language,
+                    beam_size=self.beam_size
+                )
+                texts[i] = "".join(segment.text for segment in segments).strip()
+
+        return texts
+
+
+# Local models are loaded once per process, in a background thread (loading
+# onto a GPU takes seconds), keyed by (model, device, compute type). The
+# futures are thread-safe, so callers on any event loop can await them.
+_LOCAL_MODELS: Dict[Tuple[str, str, str], "Future[WhisperModel]"] = {}
+_LOCAL_MODELS_LOCK = threading.Lock()
+_MODEL_LOADER = ThreadPoolExecutor(max_workers=1, thread_name_prefix="local-whisper-load")
+
+# Batchers hold an asyncio queue and worker task, so they are per event
+# loop: loop -> (model, device, compute type, language) -> batcher
+_LOCAL_BATCHERS: "weakref.WeakKeyDictionary" = weakref.WeakKeyDictionary()
+
+
+def _load_local_model(model_size: str, device: str, compute_type: str) -> "Future[WhisperModel]":
+    """Start loading a local model (once per process) and return its future."""
+    key = (model_size, device, compute_type)
+    with _LOCAL_MODELS_LOCK:
+        future = _LOCAL_MODELS.get(key)
+        if future is None or (future.done() and future.exception() is not None):
+            logger.info(f"Loading local Whisper model {model_size} on {device} ({compute_type})")
+            future = _LOCAL_MODELS[key] = _MODEL_LOADER.submit(
+                WhisperModel, model_size, device=device, compute_type=compute_type
+            )
+    return future
+
+
+async def _get_local_batcher(
+    model_size: str,
+    device: str,
+    compute_type: str,
+    language: str
+) -> _LocalWhisperBatcher:
+    """Get this event loop's batcher for a local model, loading the model off the loop."""
+    batchers = _LOCAL_BATCHERS.setdefault(asyncio.get_running_loop(), {})
+    key = (model_size, device, compute_type, language)
+    batcher = batchers.get(key)
+    if batcher is None:
+        model = await asyncio.wrap_future(_load_local_model(model_size, device, compute_type))
+        # Another request may have created it while the model loaded
+        batcher = batchers.get(key)
+        if batcher is None:
+            batcher = batchers[key] = _LocalWhisperBatcher(model, language)
+    return batcher
+
+
+class LocalWhisperTranscriber:
+    """
+    Transcribe audio with a local faster-whisper model.
+
+    Same interface as WhisperTranscriber. All instances with the same
+    model settings share one loaded model, and concurrent requests are
+    batched onto it.
+    """
+
+    def __init__(
+        self,
+        model: str = "small.en",
+        language: str = "en",
+        device: str = "cuda",
+        compute_type: str = "int8_float16"
+    ):
+        """
+        Initialize local Whisper transcriber.
+
+        Args:
+            model: faster-whisper model size or path
+            language: Language code for transcription
+            device: Device to run on (cuda, cpu, auto)
+            compute_type: CTranslate2 compute type
+        """
+        if not FASTER_WHISPER_AVAILABLE:
+            raise RuntimeError("faster-whisper is not installed")
+
+        self.model = model
+        self.language = language
+        self.device = device
+        self.compute_type = compute_type
+        self._total_audio_seconds = 0.0
+
+    @property
+    def total_seconds_transcribed(self) -> float:
+        """Billed seconds for cost tracking (local transcription is free)."""
+        return 0.0
+
+    @property
+    def total_audio_seconds(self) -> float:
+        """Get total audio seconds transcribed."""
+        return self._total_audio_seconds
+
+    async def load(self):
+        """Load the model ahead of the first transcription (e.g. at prewarm)."""
+        await _get_local_batcher(self.model, self.device, self.compute_type, self.language)
+
+    async def transcribe(
+        self,
+        audio_bytes: bytes,
+        sample_rate: int = 16000,
+        sample_width: int = 2,
+        channels: int = 1
+    ) -> str:
+        """
+        Transcribe audio bytes to text.
+
+        Args:
+            audio_bytes: Raw 16-bit PCM audio data
+            sample_rate: Audio sample rate (default 16000 Hz)
+            sample_width: Bytes per sample (must be 2)
+            channels: Number of audio channels (default 1 for mono)
+
+        Returns:
+            Transcribed text
+        """
+        if len(audio_bytes) < sample_rate * sample_width * channels * MIN_AUDIO_SECONDS:
+            return ""
+
+        try:
+            if sample_width != 2:
+                raise ValueError("Local transcription requires 16-bit PCM")
+
+            if sample_rate != _LocalWhisperBatcher.SAMPLE_RATE:
+                audio_bytes = resample(audio_bytes, sample_rate, _LocalWhisperBatcher.SAMPLE_RATE)
+
+            # PCM straight to float32, no WAV packaging needed
+            audio = np.frombuffer(audio_bytes, dtype=np.int16).astype(np.float32) / 32768.0
+            if channels > 1:
+                audio = audio.reshape(-1, channels).mean(axis=1)
+
+            self._total_audio_seconds += len(audio) / _LocalWhisperBatcher.SAMPLE_RATE
+
+            batcher = await _get_local_batcher(self.model, self.device, self.compute_type, self.language)
+            return await batcher.transcribe(audio)
+
+        except Exception as e:
+            logger.error(f"Local Whisper transcription error: {e}")
+            return ""
+
+    def reset_stats(self):
+        """Reset transcription statistics."""
+        self._total_audio_seconds = 0.0
@@ -2,12 +2,32 @@
 Simple Voice Activity Detection (VAD) for speech boundary detection.
 """
 import time
-import struct
-from typing import Optional, List
+import warnings
+from array import array
+from typing import List, Optional
 import logging
 
 logger = logging.getLogger(__name__)
 
+# audioop.rms is a C loop over the samples. audioop is deprecated and
+# removed in Python 3.13, where the audioop-lts package provides it.
+try:
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore", DeprecationWarning)
+        import audioop
+    AUDIOOP_AVAILABLE = True
+except ImportError:
+    AUDIOOP_AVAILABLE = False
+    audioop = None
+
+# NumPy is optional; without it energy is computed in pure Python
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+    np = None
+
 
 class SimpleVAD:
     """
@@ -24,7 +44,8 @@ class SimpleVAD:
         min_speech_duration: float = 0.3,
         max_speech_duration: float = 30.0,
         sample_rate: int = 16000,
-        sample_width: int = 2
+        sample_width: int = 2,
+        energy_stride: int = 1
     ):
         """
         Initialize VAD.
@@ -36,6 +57,9 @@ class SimpleVAD:
             max_speech_duration: Maximum speech duration before forced return
             sample_rate: Audio sample rate in Hz
             sample_width: Bytes per sample (2 for 16-bit)
+            energy_stride: Compute energy from every Nth sample only (1 = exact).
+                Cheaper on the NumPy path, but a tone at a multiple of
+                sample_rate / energy_stride aliases to a constant
         """
         self.energy_threshold = energy_threshold
         self.silence_duration = silence_duration
@@ -43,19 +67,25 @@ class SimpleVAD:
         self.max_speech_duration = max_speech_duration
         self.sample_rate = sample_rate
         self.sample_width = sample_width
+        self.energy_stride = energy_stride
+        self._inv_norm = 1.0 / 32768.0
+        self._silence_chunk = b""
 
         # State
-        self._buffer: List[bytes] = []
+        self._buffer = bytearray()
         self._speech_start: Optional[float] = None
         self._silence_start: Optional[float] = None
         self._is_speaking = False
 
-    def process_chunk(self, audio_chunk: bytes) -> Optional[bytes]:
+    def process_chunk(self, audio_chunk: bytes, energy: Optional[float] = None) -> Optional[bytes]:
         """
         Process an audio chunk and detect speech boundaries.
 
         Args:
-            audio_chunk: Raw PCM audio data
+            audio_chunk: Raw audio data (buffered as-is)
+            energy: Normalized RMS energy of the chunk, if the caller has
+                already computed it (e.g. for G.711 audio); otherwise the
+                chunk is treated as 16-bit PCM
 
         Returns:
             Complete utterance bytes if speech ended, None otherwise
@@ -63,9 +93,54 @@ class SimpleVAD:
         if not audio_chunk:
             return None
 
-        current_time = time.time()
-        energy = self._calculate_energy(audio_chunk)
+        if energy is None:
+            energy = self._calculate_energy(audio_chunk)
+        return self._update(audio_chunk, energy, time.monotonic())
+
+    def process_chunks(self, audio_chunks: List[bytes]) -> List[bytes]:
+        """
+        Process several queued audio chunks at once.
+
+        Energy for equally sized chunks is computed in one vectorized
+        operation. The batch is a backlog that has arrived by now, so the
+        last chunk is timed at the current time and earlier chunks are
+        backdated by the duration of the audio after them.
 
+        Args:
+            audio_chunks: Raw 16-bit PCM chunks, oldest first
+
+        Returns:
+            Complete utterances that ended within the batch (may be empty)
+        """
+        audio_chunks = [chunk for chunk in audio_chunks if chunk]
+        if not audio_chunks:
+            return []
+
+        chunk_size = len(audio_chunks[0])
+        if (
+            NUMPY_AVAILABLE
+            and chunk_size >= self.sample_width
+            and chunk_size % self.sample_width == 0
+            and all(len(chunk) == chunk_size for chunk in audio_chunks)
+        ):
+            frames = np.frombuffer(b''.join(audio_chunks), dtype='<i2').reshape(len(audio_chunks), -1)
+            frames = frames[:, ::self.energy_stride].astype(np.float32)
+            energies = (np.sqrt(np.einsum('ij,ij->i', frames, frames) / frames.shape[1]) * self._inv_norm).tolist()
+        else:
+            energies = [self._calculate_energy(chunk) for chunk in audio_chunks]
+
+        bytes_per_second = self.sample_rate * self.sample_width
+        current_time = time.monotonic() - sum(map(len, audio_chunks)) / bytes_per_second
+        utterances = []
+        for chunk, energy in zip(audio_chunks, energies):
+            current_time += len(chunk) / bytes_per_second
+            utterance = self._update(chunk, energy, current_time)
+            if utterance:
+                utterances.append(utterance)
+        return utterances
+
+    def _update(self, audio_chunk: bytes, energy: float, current_time: float) -> Optional[bytes]:
+        """Advance the speech/silence state machine by one chunk."""
         # Speech detected
         if energy > self.energy_threshold:
             if self._speech_start is None:
@@ -74,7 +149,7 @@ class SimpleVAD:
 
             self._silence_start = None
             self._is_speaking = True
-            self._buffer.append(audio_chunk)
+            self._buffer.extend(audio_chunk)
 
             # Check max duration
             if current_time - self._speech_start > self.max_speech_duration:
@@ -85,7 +160,7 @@ class SimpleVAD:
         else:
             if self._is_speaking:
                 # Include some trailing silence
-                self._buffer.append(audio_chunk)
+                self._buffer.extend(audio_chunk)
 
                 if self._silence_start is None:
                     self._silence_start = current_time
@@ -115,26 +190,41 @@ class SimpleVAD:
         if len(audio_chunk) < self.sample_width:
             return 0.0
 
-        # Unpack 16-bit samples
-        num_samples = len(audio_chunk) // self.sample_width
-        samples = struct.unpack(f'{num_samples}h', audio_chunk[:num_samples * self.sample_width])
+        # Digital silence (all-zero samples) is caught by a single memcmp
+        # against a cached zero chunk; speech differs in the first bytes
+        if len(audio_chunk) != len(self._silence_chunk):
+            self._silence_chunk = bytes(len(audio_chunk))
+        if audio_chunk == self._silence_chunk:
+            return 0.0
 
-        # Calculate RMS
-        sum_squares = sum(s * s for s in samples)
-        rms = (sum_squares / num_samples) ** 0.5
+        num_samples = len(audio_chunk) // self.sample_width
+        stride = self.energy_stride
+
+        # audioop can't stride without a copy that costs more than it saves
+        if AUDIOOP_AVAILABLE and stride == 1:
+            rms = audioop.rms(audio_chunk[:num_samples * self.sample_width], self.sample_width)
+        elif NUMPY_AVAILABLE:
+            # Sum of squares as a single float32 dot product
+            samples = np.frombuffer(audio_chunk, dtype='<i2', count=num_samples)[::stride].astype(np.float32)
+            rms = float(np.sqrt(np.dot(samples, samples) / samples.size))
+        else:
+            # 16-bit samples without building a struct format per chunk
+            samples = array('h', audio_chunk[:num_samples * self.sample_width])[::stride]
+            sum_squares = sum(s * s for s in samples)
+            rms = (sum_squares / len(samples)) ** 0.5
 
         # Normalize to 0-1 range (32768 is max for 16-bit)
-        return rms / 32768.0
+        return rms * self._inv_norm
 
     def _flush_buffer(self) -> bytes:
         """Flush and return buffered audio."""
-        utterance = b''.join(self._buffer)
+        utterance = bytes(self._buffer)
         self._reset()
         return utterance
 
     def _reset(self):
         """Reset VAD state."""
-        self._buffer = []
+        self._buffer.clear()
         self._speech_start = None
         self._silence_start = None
         self._is_speaking = False
@@ -153,7 +243,7 @@ class SimpleVAD:
         """Get current speech duration in seconds."""
         if self._speech_start is None:
             return 0.0
-        return time.time() - self._speech_start
+        return time.monotonic() - self._speech_start
 
     def force_end(self) -> Optional[bytes]:
         """
@@ -196,6 +286,7 @@ class WebRTCVAD:
             sample_rate: Audio sample rate (8000, 16000, 32000, or 48000)
         """
         self.frame_duration_ms = frame_duration_ms
+        self._frame_dt = frame_duration_ms * 1e-3
         self.silence_duration = silence_duration
         self.min_speech_duration = min_speech_duration
         self.sample_rate = sample_rate
@@ -217,11 +308,11 @@ class WebRTCVAD:
             self._use_webrtc = False
 
         # State
-        self._buffer: List[bytes] = []
+        self._buffer = bytearray()
         self._speech_start: Optional[float] = None
         self._silence_start: Optional[float] = None
         self._is_speaking = False
-        self._frame_buffer = b''
+        self._frame_buffer = bytearray()
 
     def process_chunk(self, audio_chunk: bytes) -> Optional[bytes]:
         """Process audio chunk and detect speech boundaries."""
@@ -229,43 +320,65 @@ class WebRTCVAD:
             return self._fallback.process_chunk(audio_chunk)
 
         # Buffer audio until we have enough for a frame
-        self._frame_buffer += audio_chunk
-        current_time = time.time()
-
-        while len(self._frame_buffer) >= self.frame_size:
-            frame = self._frame_buffer[:self.frame_size]
-            self._frame_buffer = self._frame_buffer[self.frame_size:]
-
-            is_speech = self.vad.is_speech(frame, self.sample_rate)
-
-            if is_speech:
-                if self._speech_start is None:
-                    self._speech_start = current_time
-                self._silence_start = None
-                self._is_speaking = True
-                self._buffer.append(frame)
-            else:
-                if self._is_speaking:
-                    self._buffer.append(frame)
-                    if self._silence_start is None:
-                        self._silence_start = current_time
-                    elif current_time - self._silence_start > self.silence_duration:
-                        speech_duration = current_time - self._speech_start if self._speech_start else 0
-                        if speech_duration >= self.min_speech_duration:
-                            return self._flush_buffer()
-                        self._reset()
+        self._frame_buffer.extend(audio_chunk)
+        current_time = time.monotonic()
+
+        # Frames are read through a view at an offset; the consumed prefix
+        # is dropped once per chunk instead of re-slicing the buffer per frame
+        offset = 0
+
+        # Hoisted out of the per-frame loop
+        is_speech_fn = self.vad.is_speech
+        sample_rate = self.sample_rate
+        frame_size = self.frame_size
+        frame_dt = self._frame_dt
+        buffer = self._buffer
+        frame = None
+
+        try:
+            with memoryview(self._frame_buffer) as view:
+                while len(view) - offset >= frame_size:
+                    # webrtcvad reads frames through the buffer protocol,
+                    # so the view slice is passed without copying it
+                    frame = view[offset:offset + frame_size]
+                    offset += frame_size
+
+                    is_speech = is_speech_fn(frame, sample_rate)
+                    # Frames in one packet are timed by their position, not the clock
+                    current_time += frame_dt
+
+                    if is_speech:
+                        if self._speech_start is None:
+                            self._speech_start = current_time
+                        self._silence_start = None
+                        self._is_speaking = True
+                        buffer += frame
+                    else:
+                        if self._is_speaking:
+                            buffer += frame
+                            if self._silence_start is None:
+                                self._silence_start = current_time
+                            elif current_time - self._silence_start > self.silence_duration:
+                                speech_duration = current_time - self._speech_start if self._speech_start else 0
+                                if speech_duration >= self.min_speech_duration:
+                                    return self._flush_buffer()
+                                self._reset()
+        finally:
+            # Drop the last frame view so the buffer can be resized
+            frame = None
+            del self._frame_buffer[:offset]
 
         return None
 
     def _flush_buffer(self) -> bytes:
         """Flush and return buffered audio."""
-        utterance = b''.join(self._buffer)
+        utterance = bytes(self._buffer)
         self._reset()
         return utterance
 
     def _reset(self):
         """Reset state."""
-        self._buffer = []
+        self._buffer.clear()
         self._speech_start = None
         self._silence_start = None
         self._is_speaking = False
@@ -273,7 +386,7 @@ class WebRTCVAD:
     def reset(self):
         """Public reset."""
         self._reset()
-        self._frame_buffer = b''
+        self._frame_buffer.clear()
         if not self._use_webrtc:
             self._fallback.reset()
 
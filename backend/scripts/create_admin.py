@@ -10,6 +10,7 @@ import os
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from sqlalchemy import select
+from sqlalchemy.dialects.postgresql import insert
 from app.db.session import async_session_maker
 from app.models.user import User, UserRole, Organization
 from app.core.security import get_password_hash
@@ -18,64 +19,60 @@ from app.core.security import get_password_hash
 async def create_admin_user():
     """Create a test admin user."""
     async with async_session_maker() as session:
-        # Check if admin already exists
+        # Create default organization first (no-op if it already exists)
         result = await session.execute(
-            select(User).where(User.email == "admin@example.com")
-        )
-        existing_user = result.scalar_one_or_none()
-
-        if existing_user:
-            print("Admin user already exists!")
-            print(f"  Email: {existing_user.email}")
-            print(f"  Role: {existing_user.role.value}")
-            print(f"  Is Superuser: {existing_user.is_superuser}")
-            return
-
-        # Create default organization first
-        result = await session.execute(
-            select(Organization).where(Organization.slug == "default")
-        )
-        org = result.scalar_one_or_none()
-
-        if not org:
-            org = Organization(
+            insert(Organization)
+            .values(
                 name="Default Organization",
                 slug="default",
                 is_active=True,
                 max_concurrent_calls=10,
                 timezone="UTC"
             )
-            session.add(org)
-            await session.flush()
+            .on_conflict_do_nothing(index_elements=["slug"])
+            .returning(Organization.id)
+        )
+        org_id = result.scalar_one_or_none()
+
+        if org_id is None:
+            result = await session.execute(
+                select(Organization.id).where(Organization.slug == "default")
+            )
+            org_id = result.scalar_one()
+        else:
             print("Created default organization")
 
-        # Create admin user - use string value for role since DB uses VARCHAR not ENUM
-        hashed_pwd = get_password_hash("admin123")
+        # Create admin user; the email conflict check replaces a separate lookup
+        result = await session.execute(
+            insert(User)
+            .values(
+                email="admin@example.com",
+                hashed_password=get_password_hash("admin123"),
+                first_name="Admin",
+                last_name="User",
+                is_active=True,
+                is_superuser=True,
+                role=UserRole.ADMIN.value,
+                organization_id=org_id
+            )
+            .on_conflict_do_nothing(index_elements=["email"])
+            .returning(User.id)
+        )
 
-        # Insert directly via raw SQL to avoid enum type issues
-        from sqlalchemy import text
-        import uuid
+        if result.scalar_one_or_none() is None:
+            # Leave the database untouched, as before
+            await session.rollback()
 
-        user_id = str(uuid.uuid4())
-        await session.execute(
-            text("""
-                INSERT INTO users (id, email, hashed_password, first_name, last_name,
-                                   is_active, is_superuser, role, organization_id)
-                VALUES (:id, :email, :hashed_password, :first_name, :last_name,
-                        :is_active, :is_superuser, :role, :organization_id)
-            """),
-            {
-                "id": user_id,
-                "email": "admin@example.com",
-                "hashed_password": hashed_pwd,
-                "first_name": "Admin",
-                "last_name": "User",
-                "is_active": True,
-                "is_superuser": True,
-                "role": "admin",
-                "organization_id": str(org.id)
-            }
-        )
+            result = await session.execute(
+                select(User).where(User.email == "admin@example.com")
+            )
+            existing_user = result.scalar_one()
+
+            print("Admin user already exists!")
+            print(f"  Email: {existing_user.email}")
+            print(f"  Role: {existing_user.role}")
+            print(f"  Is Superuser: {existing_user.is_superuser}")
+            return
 
         await session.commit()
 
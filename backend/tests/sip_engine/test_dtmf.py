@@ -0,0 +1,86 @@
+"""Tests for DTMF delivery from SIPCall to MediaHandler."""
+import asyncio
+from types import SimpleNamespace
+
+from dialer.sip_engine.media_handler import MediaHandler
+from dialer.sip_engine.pjsua_client import SIPCall, _DTMF_QUEUE_SIZE
+
+
+def make_call() -> SIPCall:
+    engine = SimpleNamespace(_loop=asyncio.get_running_loop())
+    return SIPCall(SimpleNamespace(engine=engine), "call-test")
+
+
+async def press(call: SIPCall, digits: str):
+    """Deliver digits the way the PJSIP thread does and let the loop run them."""
+    for digit in digits:
+        call.on_dtmf_digit(digit)
+    await asyncio.sleep(0)
+
+
+async def test_digits_not_queued_without_consumer():
+    call = make_call()
+    await press(call, "123")
+
+    assert call._dtmf_queue is None
+    assert call.info.dtmf_buffer == ["1", "2", "3"]
+
+
+async def test_queue_drops_oldest_digits():
+    call = make_call()
+    call.clear_dtmf()
+    await press(call, "0123456789" * 4)
+
+    digits = await call.drain_dtmf(timeout=0.1)
+
+    assert len(digits) == _DTMF_QUEUE_SIZE
+    assert "".join(digits) == ("0123456789" * 4)[-_DTMF_QUEUE_SIZE:]
+
+
+async def test_drain_times_out_without_digits():
+    call = make_call()
+    assert await call.drain_dtmf(timeout=0.01) == []
+
+
+async def test_collect_dtmf_ignores_earlier_digits():
+    call = make_call()
+    media = MediaHandler(call)
+    call.clear_dtmf()
+    await press(call, "9")
+
+    collect = asyncio.create_task(media.collect_dtmf(max_digits=4, timeout=2.0))
+    await asyncio.sleep(0)
+    await press(call, "12#")
+    result = await collect
+
+    assert result.digits == "12"
+    assert result.terminated_by == "#"
+    assert not result.timed_out
+
+
+async def test_collect_dtmf_max_digits():
+    call = make_call()
+    media = MediaHandler(call)
+
+    collect = asyncio.create_task(media.collect_dtmf(max_digits=2, timeout=2.0))
+    await asyncio.sleep(0)
+    await press(call, "456")
+    result = await collect
+
+    assert result.digits == "45"
+    assert result.max_reached
+
+
+async def test_collect_dtmf_inter_digit_timeout():
+    call = make_call()
+    media = MediaHandler(call)
+
+    collect = asyncio.create_task(
+        media.collect_dtmf(max_digits=4, timeout=2.0, inter_digit_timeout=0.05)
+    )
+    await asyncio.sleep(0)
+    await press(call, "7")
+    result = await collect
+
+    assert result.digits == "7"
+    assert result.timed_out
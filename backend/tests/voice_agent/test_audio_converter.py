@@ -0,0 +1,100 @@
+"""Tests for the G.711 codec paths in audio_converter."""
+import numpy as np
+import pytest
+
+from dialer.voice_agent import audio_converter as ac
+
+# Every 16-bit sample value, and every G.711 byte
+ALL_PCM = np.arange(-32768, 32768, dtype=np.int16).tobytes()
+ALL_CODES = bytes(range(256))
+
+ULAW_TABLE = np.array(ac.ULAW_TO_LINEAR, dtype=np.int16).tobytes()
+ALAW_TABLE = np.array(ac.ALAW_TO_LINEAR, dtype=np.int16).tobytes()
+
+needs_ext = pytest.mark.skipif(not ac.G711_EXT_AVAILABLE, reason="_g711_cffi not built")
+needs_audioop = pytest.mark.skipif(not ac.AUDIOOP_AVAILABLE, reason="audioop not available")
+
+
+@pytest.fixture(scope="module")
+def reference_ulaw() -> bytes:
+    """u-law encoding of ALL_PCM from the scalar reference encoder."""
+    return bytes(ac.linear_to_ulaw(int(s)) for s in np.frombuffer(ALL_PCM, dtype=np.int16))
+
+
+def ulaw_encoders():
+    encoders = [pytest.param(ac._pcm16_to_ulaw_np, id="numpy")]
+    if ac.G711_EXT_AVAILABLE:
+        encoders.append(pytest.param(ac._pcm16_to_ulaw_ext, id="ext"))
+    return encoders
+
+
+def ulaw_decoders():
+    decoders = [
+        pytest.param(lambda data: ac.ULAW_TO_LINEAR_NP[np.frombuffer(data, dtype=np.uint8)].tobytes(), id="lut"),
+        pytest.param(ac.ulaw_to_pcm16, id="dispatch"),
+    ]
+    if ac.G711_EXT_AVAILABLE:
+        decoders.append(pytest.param(ac._ulaw_to_pcm16_ext, id="ext"))
+    if ac.AUDIOOP_AVAILABLE:
+        decoders.append(pytest.param(lambda data: ac.audioop.ulaw2lin(data, 2), id="audioop"))
+    return decoders
+
+
+@pytest.mark.parametrize("decode", ulaw_decoders())
+def test_ulaw_decode_matches_table(decode):
+    assert decode(ALL_CODES) == ULAW_TABLE
+
+
+@pytest.mark.parametrize("encode", ulaw_encoders())
+def test_ulaw_encode_matches_reference(encode, reference_ulaw):
+    assert encode(ALL_PCM) == reference_ulaw
+
+
+@pytest.mark.parametrize("encode", ulaw_encoders() + [pytest.param(ac.pcm16_to_ulaw, id="dispatch")])
+def test_ulaw_round_trip(encode):
+    # Decoded values are exactly representable, so re-encoding them is
+    # lossless (both zero codes decode to 0, which encodes as 0xFF)
+    reencoded = encode(ULAW_TABLE)
+    assert ac.ulaw_to_pcm16(reencoded) == ULAW_TABLE
+
+
+@needs_audioop
+def test_audioop_ulaw_encode_within_one_step(reference_ulaw):
+    """
+    audioop rounds some negative inputs to the neighbouring code.
+
+    Where it differs from the tables (381 of 65536 inputs, all negative),
+    both codes must decode to adjacent quantization levels around the input.
+    """
+    samples = np.frombuffer(ALL_PCM, dtype=np.int16)
+    ours = np.frombuffer(reference_ulaw, dtype=np.uint8)
+    theirs = np.frombuffer(ac.audioop.lin2ulaw(ALL_PCM, 2), dtype=np.uint8)
+
+    differs = ours != theirs
+    assert differs.sum() == 381
+    assert (samples[differs] < 0).all()
+
+    levels = np.sort(np.unique(ac.ULAW_TO_LINEAR_NP))
+    ours_rank = np.searchsorted(levels, ac.ULAW_TO_LINEAR_NP[ours[differs]])
+    theirs_rank = np.searchsorted(levels, ac.ULAW_TO_LINEAR_NP[theirs[differs]])
+    assert (np.abs(ours_rank - theirs_rank) == 1).all()
+
+
+@needs_ext
+@pytest.mark.parametrize("n", [0, 1, 15, 16, 17, 31, 32, 33, 160, 257])
+def test_ext_decode_tail_lengths(n):
+    data = (ALL_CODES * 2)[:n]
+    assert ac._ulaw_to_pcm16_ext(data) == (ULAW_TABLE * 2)[:n * 2]
+
+
+@needs_ext
+def test_ext_encode_odd_byte_count():
+    # A trailing half sample is ignored, as with the other encoders
+    assert ac._pcm16_to_ulaw_ext(ALL_PCM[:5]) == ac._pcm16_to_ulaw_np(ALL_PCM[:4])
+
+
+@needs_audioop
+def test_alaw_table_matches_audioop():
+    expected = ac.audioop.alaw2lin(ALL_CODES, 2)
+    assert ALAW_TABLE == expected
+    assert ac.alaw_to_pcm16(ALL_CODES) == expected
@@ -0,0 +1,113 @@
+"""Tests for the customer lookup plugin."""
+import asyncio
+
+import httpx
+
+from dialer.voice_agent.plugins import customer_lookup
+from dialer.voice_agent.plugins.customer_lookup import CustomerLookupPlugin
+
+
+class FakeCRM:
+    """httpx transport for the customer API that counts requests."""
+
+    def __init__(self, status_code: int = 200, delay: float = 0.05):
+        self.status_code = status_code
+        self.delay = delay
+        self.requests = []
+
+    async def __call__(self, request: httpx.Request) -> httpx.Response:
+        self.requests.append(request)
+        await asyncio.sleep(self.delay)
+        phone = request.url.params["phone"]
+        return httpx.Response(self.status_code, json={"phone": phone, "name": "Jane Doe"})
+
+
+def make_plugin(crm: FakeCRM, **kwargs) -> CustomerLookupPlugin:
+    client = httpx.AsyncClient(transport=httpx.MockTransport(crm))
+    return CustomerLookupPlugin("https://crm.example.com/api/", api_key="secret", client=client, **kwargs)
+
+
+async def test_concurrent_lookups_share_one_request():
+    crm = FakeCRM()
+    plugin = make_plugin(crm)
+
+    results = await asyncio.gather(*(
+        plugin.execute({"phone_number": "+15551234567"}, {}) for _ in range(5)
+    ))
+
+    assert len(crm.requests) == 1
+    assert all(result == results[0] for result in results)
+    assert results[0]["customer"]["name"] == "Jane Doe"
+    assert plugin._inflight == {}
+
+    request = crm.requests[0]
+    assert request.url.path == "/api/customers"
+    assert request.headers["Authorization"] == "Bearer secret"
+
+
+async def test_different_numbers_are_not_coalesced():
+    crm = FakeCRM()
+    plugin = make_plugin(crm)
+
+    first, second = await asyncio.gather(
+        plugin.execute({"phone_number": "+15551234567"}, {}),
+        plugin.execute({"phone_number": "+15559876543"}, {}),
+    )
+
+    assert len(crm.requests) == 2
+    assert first["customer"]["phone"] == "+15551234567"
+    assert second["customer"]["phone"] == "+15559876543"
+
+
+async def test_results_cached_until_ttl(monkeypatch):
+    now = 1000.0
+    monkeypatch.setattr(customer_lookup.time, "monotonic", lambda: now)
+    crm = FakeCRM(delay=0)
+    plugin = make_plugin(crm, cache_ttl=60.0)
+
+    await plugin.execute({"phone_number": "+15551234567"}, {})
+    await plugin.execute({"phone_number": "+15551234567"}, {})
+    assert len(crm.requests) == 1
+
+    now += 61.0
+    await plugin.execute({"phone_number": "+15551234567"}, {})
+    assert len(crm.requests) == 2
+
+
+async def test_errors_are_shared_but_not_cached():
+    crm = FakeCRM(status_code=500)
+    plugin = make_plugin(crm)
+
+    results = await asyncio.gather(*(
+        plugin.execute({"phone_number": "+15551234567"}, {}) for _ in range(3)
+    ))
+    assert len(crm.requests) == 1
+    assert all("error" in result for result in results)
+
+    await plugin.execute({"phone_number": "+15551234567"}, {})
+    assert len(crm.requests) == 2
+
+
+async def test_cancelled_lookup_clears_inflight():
+    crm = FakeCRM(delay=1.0)
+    plugin = make_plugin(crm)
+
+    task = asyncio.create_task(plugin.execute({"phone_number": "+15551234567"}, {}))
+    await asyncio.sleep(0.01)
+    task.cancel()
+    await asyncio.gather(task, return_exceptions=True)
+
+    assert plugin._inflight == {}
+    crm.delay = 0
+    result = await plugin.execute({"phone_number": "+15551234567"}, {})
+    assert result["found"] is True
+
+
+async def test_cache_size_bounded():
+    crm = FakeCRM(delay=0)
+    plugin = make_plugin(crm, cache_size=2)
+
+    for phone in ("+15550000001", "+15550000002", "+15550000003"):
+        await plugin.execute({"phone_number": phone}, {})
+
+    assert list(plugin._cache) == ["+15550000002", "+15550000003"]
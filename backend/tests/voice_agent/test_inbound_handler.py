@@ -0,0 +1,130 @@
+"""Tests for the voice agent inbound call handler."""
+from types import SimpleNamespace
+
+import pytest
+
+from dialer.voice_agent import inbound_handler
+from dialer.voice_agent.inbound_handler import (
+    VoiceAgentInboundHandler,
+    get_inbound_handler,
+    init_inbound_handler,
+    shutdown_inbound_handler,
+)
+
+
+@pytest.fixture
+def handler(tmp_path, monkeypatch):
+    monkeypatch.setattr(inbound_handler, "TTS_CACHE_DIR", str(tmp_path))
+    handler = init_inbound_handler(db_session_factory=None)
+    yield handler
+    inbound_handler._inbound_handler = None
+
+
+async def test_shutdown_releases_pool_and_clients(handler):
+    http_client = handler._get_http_client()
+    openai_client = handler._get_openai_client("sk-test")
+
+    await shutdown_inbound_handler()
+
+    assert get_inbound_handler() is None
+    with pytest.raises(RuntimeError):
+        handler._audio_pool.submit(int)
+    assert http_client.is_closed
+    assert openai_client.is_closed()
+
+
+async def test_shutdown_without_handler():
+    assert get_inbound_handler() is None
+    await shutdown_inbound_handler()
+
+
+def route(route_id: str, did_pattern: str):
+    return SimpleNamespace(id=route_id, did_pattern=did_pattern)
+
+
+def test_match_route_uses_priority_order(handler):
+    routes = [
+        route("exact", "+15551234567"),
+        route("prefix", "+1555*"),
+        route("catch-all", "*"),
+    ]
+
+    assert handler._match_route(routes, "+15551234567").id == "exact"
+    assert handler._match_route(routes, "+15559999999").id == "prefix"
+    assert handler._match_route(routes, "+442071234567").id == "catch-all"
+
+
+def test_match_route_no_match(handler):
+    routes = [route("prefix", "+1555*"), route("exact", "+18001234567")]
+
+    assert handler._match_route(routes, "+1800123456") is None
+    assert handler._match_route(routes, "+180012345678") is None
+    assert handler._match_route([], "+15551234567") is None
+
+
+def test_match_route_treats_pattern_literally_except_wildcards(handler):
+    routes = [route("plus", "+1.55*")]
+
+    assert handler._match_route(routes, "+1.5550000").id == "plus"
+    assert handler._match_route(routes, "+1x5550000") is None
+
+
+def test_match_route_recompiles_when_routes_change(handler):
+    assert handler._match_route([route("a", "+1555*")], "+15550000").id == "a"
+    regex = handler._route_regex
+
+    # Same routes: the combined regex is reused
+    handler._match_route([route("a", "+1555*")], "+15550000")
+    assert handler._route_regex is regex
+
+    # Changed pattern or order: rebuilt
+    assert handler._match_route([route("a", "+1666*")], "+15550000") is None
+    routes = [route("b", "*"), route("a", "+1555*")]
+    assert handler._match_route(routes, "+15550000").id == "b"
+
+
+def test_cached_entries_expire(monkeypatch):
+    now = 1000.0
+    monkeypatch.setattr(inbound_handler.time, "monotonic", lambda: now)
+    entry = (now, "value")
+
+    assert VoiceAgentInboundHandler._cached(None) is None
+    assert VoiceAgentInboundHandler._cached(entry) == "value"
+
+    now += inbound_handler.ROUTE_CACHE_TTL - 0.1
+    assert VoiceAgentInboundHandler._cached(entry) == "value"
+    now += 0.2
+    assert VoiceAgentInboundHandler._cached(entry) is None
+
+
+class FakeDB:
+    """Async DB session returning a fixed list of rows and counting queries."""
+
+    def __init__(self, rows):
+        self.rows = rows
+        self.queries = 0
+
+    async def execute(self, statement):
+        self.queries += 1
+        return SimpleNamespace(scalars=lambda: SimpleNamespace(all=lambda: list(self.rows)))
+
+
+async def test_routes_are_reloaded_after_ttl(handler, monkeypatch):
+    pytest.importorskip("sqlalchemy")
+    now = 1000.0
+    monkeypatch.setattr(inbound_handler.time, "monotonic", lambda: now)
+    db = FakeDB([route("a", "+1555*")])
+
+    assert (await handler._find_matching_route(db, "+15550000")).id == "a"
+    assert (await handler._find_matching_route(db, "+15550000")).id == "a"
+    assert db.queries == 1
+
+    # Route edits made through the API show up once the TTL passes
+    db.rows = [route("b", "*")]
+    now += inbound_handler.ROUTE_CACHE_TTL + 1
+    assert (await handler._find_matching_route(db, "+15550000")).id == "b"
+    assert db.queries == 2
+
+    handler.invalidate_routes()
+    await handler._find_matching_route(db, "+15550000")
+    assert db.queries == 3
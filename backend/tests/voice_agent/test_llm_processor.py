@@ -0,0 +1,185 @@
+"""Tests for the conversation processor."""
+import asyncio
+import json
+import time
+from types import SimpleNamespace
+
+import pytest
+
+from dialer.voice_agent.llm_processor import ConversationProcessor
+from dialer.voice_agent.plugins import (
+    ExternalPlugin,
+    HangupCallPlugin,
+    MockCustomerLookupPlugin,
+    PluginParameter,
+)
+
+
+def make_processor(**kwargs) -> ConversationProcessor:
+    kwargs.setdefault("client", object())
+    return ConversationProcessor(
+        api_key="test",
+        system_prompt="You are a test agent.",
+        **kwargs
+    )
+
+
+def tool_names(processor: ConversationProcessor) -> list:
+    return [tool["function"]["name"] for tool in processor._tools or []]
+
+
+def test_batch_tool_is_opt_in():
+    plugins = [MockCustomerLookupPlugin(), HangupCallPlugin()]
+
+    assert "batch_invoke" not in tool_names(make_processor(plugins=plugins))
+    assert "batch_invoke" in tool_names(make_processor(plugins=plugins, batch_tools=True))
+
+
+def test_batch_tool_needs_two_plugins():
+    processor = make_processor(plugins=[HangupCallPlugin()], batch_tools=True)
+    assert tool_names(processor) == ["end_call"]
+
+
+class SlowEchoPlugin(ExternalPlugin):
+    name = "echo"
+    description = "Echo the text back after a delay"
+    parameters = [PluginParameter("text", "string", "Text to echo")]
+
+    async def execute(self, params, context):
+        await asyncio.sleep(0.1)
+        return {"text": params["text"]}
+
+
+class FailingPlugin(ExternalPlugin):
+    name = "fail"
+    description = "Always fails"
+    parameters = []
+
+    async def execute(self, params, context):
+        raise RuntimeError("backend down")
+
+
+def tool_call(call_id: str, name: str, args: dict) -> dict:
+    return {
+        "id": call_id,
+        "type": "function",
+        "function": {"name": name, "arguments": json.dumps(args)}
+    }
+
+
+def completion(content: str):
+    return SimpleNamespace(
+        choices=[SimpleNamespace(message=SimpleNamespace(content=content, tool_calls=None))],
+        usage=SimpleNamespace(prompt_tokens=10, completion_tokens=5)
+    )
+
+
+class FakeClient:
+    """Stands in for AsyncOpenAI; every completion returns the next reply."""
+
+    def __init__(self, replies, delay: float = 0.0):
+        self.replies = list(replies)
+        self.delay = delay
+        self.requests = []
+        self.chat = SimpleNamespace(completions=SimpleNamespace(create=self.create))
+
+    async def create(self, **kwargs):
+        self.requests.append(kwargs)
+        if self.delay:
+            await asyncio.sleep(self.delay)
+        return completion(self.replies.pop(0))
+
+
+async def test_run_tool_calls_runs_plugins_concurrently_in_order():
+    processor = make_processor(plugins=[SlowEchoPlugin(), FailingPlugin()])
+    calls = [
+        tool_call("call-1", "echo", {"text": "one"}),
+        tool_call("call-2", "fail", {}),
+        tool_call("call-3", "echo", {"text": "three"}),
+        tool_call("call-4", "missing", {}),
+    ]
+
+    started = time.monotonic()
+    await processor._run_tool_calls("", calls, None)
+    elapsed = time.monotonic() - started
+
+    # Two 0.1 s echoes overlapped
+    assert elapsed < 0.18
+
+    history = processor.conversation_history
+    assert history[0]["tool_calls"] == calls
+    results = history[1:]
+    assert [msg["tool_call_id"] for msg in results] == ["call-1", "call-2", "call-3", "call-4"]
+    assert json.loads(results[0]["content"]) == {"text": "one"}
+    assert json.loads(results[1]["content"]) == {"error": "backend down"}
+    assert json.loads(results[2]["content"]) == {"text": "three"}
+    assert json.loads(results[3]["content"]) == {"error": "Plugin missing not found"}
+    assert processor.pending_action is None
+
+
+async def test_run_tool_calls_sets_pending_action():
+    processor = make_processor(plugins=[SlowEchoPlugin(), HangupCallPlugin()])
+
+    await processor._run_tool_calls(
+        "",
+        [tool_call("call-1", "echo", {"text": "bye"}), tool_call("call-2", "end_call", {})],
+        None
+    )
+
+    assert processor.pending_action["action"] == "hangup"
+
+
+async def test_run_tool_calls_rejects_malformed_arguments_before_running():
+    processor = make_processor(plugins=[SlowEchoPlugin()])
+    processor._plugin_map["echo"].execute = None  # would fail if called
+    calls = [
+        tool_call("call-1", "echo", {"text": "ok"}),
+        {"id": "call-2", "type": "function", "function": {"name": "echo", "arguments": "{not json"}},
+    ]
+
+    with pytest.raises(ValueError):
+        await processor._run_tool_calls("", calls, None)
+
+    # Only the assistant message was recorded; no tool results
+    assert len(processor.conversation_history) == 1
+
+
+async def test_long_history_is_summarized():
+    client = FakeClient([f"reply {i}" for i in range(5)] + ["the summary", "reply 5"])
+    processor = make_processor(client=client, max_history_turns=4, summary_threshold=8)
+
+    for i in range(5):
+        assert await processor.process(f"question {i}") == f"reply {i}"
+    await processor._summary_task
+
+    # Folded up to the user message that starts the last 4+ messages
+    history = processor.conversation_history
+    assert processor._summary == "the summary"
+    assert history[0] == {"role": "user", "content": "question 3"}
+    assert len(history) == 4
+    summary_request = client.requests[-1]["messages"][-1]["content"]
+    assert "user: question 0" in summary_request
+    assert "assistant: reply 2" in summary_request
+
+    # The summary is sent ahead of the remaining history; the transcript
+    # still has every message
+    await processor.process("question 5")
+    sent = client.requests[-1]["messages"]
+    assert sent[1]["content"] == "Summary of the conversation so far: the summary"
+    assert sent[2] == {"role": "user", "content": "question 3"}
+    assert len(processor.get_transcript()) == 12
+
+
+async def test_summary_dropped_after_reset():
+    client = FakeClient([f"reply {i}" for i in range(5)] + ["stale summary"], delay=0.01)
+    processor = make_processor(client=client, max_history_turns=4, summary_threshold=8)
+
+    for i in range(5):
+        await processor.process(f"question {i}")
+    task = processor._summary_task
+    processor.reset()
+
+    with pytest.raises(asyncio.CancelledError):
+        await task
+    assert processor._summary is None
+    assert processor.conversation_history == []
@@ -0,0 +1,78 @@
+"""Tests for the voice agent session loop."""
+import asyncio
+import json
+from datetime import datetime
+
+from dialer.voice_agent.session import (
+    VoiceAgentConfig,
+    VoiceAgentSession,
+    ERROR_MESSAGE,
+)
+
+
+def make_session(get_audio, **config):
+    async def play_audio(audio: bytes):
+        pass
+
+    session = VoiceAgentSession(
+        VoiceAgentConfig(openai_api_key="test", tts_format="pcm", **config),
+        play_audio_callback=play_audio,
+        get_audio_callback=get_audio,
+        openai_client=object()
+    )
+
+    spoken = []
+
+    async def speak(text: str):
+        spoken.append(text)
+
+    session._speak = speak
+    return session, spoken
+
+
+async def test_capture_failure_ends_session():
+    async def get_audio():
+        raise RuntimeError("RTP stream closed")
+
+    # A timeout far longer than the test: the session must not wait it out
+    session, spoken = make_session(
+        get_audio,
+        silence_timeout_seconds=60.0,
+        max_call_duration_seconds=600
+    )
+
+    result = await asyncio.wait_for(session.start(), timeout=2.0)
+
+    assert session.running is False
+    assert session._capture_task.done()
+    assert spoken[-1] == ERROR_MESSAGE
+    assert result["stats"]["turn_count"] == 0
+
+
+async def test_stop_ends_session():
+    async def get_audio():
+        await asyncio.sleep(0.01)
+        return None
+
+    session, spoken = make_session(get_audio, silence_timeout_seconds=60.0)
+
+    task = asyncio.create_task(session.start())
+    await asyncio.sleep(0.05)
+    await session.stop()
+    await asyncio.wait_for(task, timeout=2.0)
+
+    assert ERROR_MESSAGE not in spoken
+
+
+async def test_result_is_json_serializable():
+    async def get_audio():
+        raise RuntimeError("RTP stream closed")
+
+    session, _ = make_session(get_audio, silence_timeout_seconds=60.0)
+    session._log_turn("user", "hello")
+    result = await asyncio.wait_for(session.start(), timeout=2.0)
+
+    decoded = json.loads(json.dumps(result))
+    assert datetime.fromisoformat(decoded["stats"]["started_at"])
+    assert datetime.fromisoformat(decoded["stats"]["ended_at"])
+    assert datetime.fromisoformat(decoded["transcript"][0]["timestamp"])
@@ -0,0 +1,89 @@
+"""Tests for the TTS caches."""
+import os
+import time
+
+from dialer.voice_agent.synthesizer import DiskTTSCache
+
+
+def key(n: int) -> str:
+    return f"{n:02x}" + "ab" * 15
+
+
+async def test_get_returns_what_was_set(tmp_path):
+    cache = DiskTTSCache(tmp_path)
+    await cache.set(key(1), b"audio")
+
+    assert await cache.get(key(1)) == b"audio"
+    assert await cache.get(key(2)) is None
+    assert (tmp_path / key(1)[:2] / f"{key(1)}.bin").read_bytes() == b"audio"
+
+
+async def test_evicts_least_recently_used(tmp_path):
+    cache = DiskTTSCache(tmp_path, max_bytes=30)
+    for n in range(3):
+        await cache.set(key(n), bytes(10))
+    # Touch the oldest entry so the second one is now least recently used
+    assert await cache.get(key(0)) is not None
+
+    await cache.set(key(3), bytes(10))
+
+    assert await cache.get(key(1)) is None
+    assert not cache._file(key(1)).exists()
+    for n in (0, 2, 3):
+        assert await cache.get(key(n)) == bytes(10)
+    assert cache._total_bytes == 30
+
+
+async def test_keeps_single_entry_larger_than_limit(tmp_path):
+    cache = DiskTTSCache(tmp_path, max_bytes=10)
+    await cache.set(key(1), bytes(5))
+    await cache.set(key(2), bytes(50))
+
+    assert await cache.get(key(1)) is None
+    assert await cache.get(key(2)) == bytes(50)
+
+
+async def test_expired_entries_are_removed(tmp_path):
+    cache = DiskTTSCache(tmp_path, ttl=60.0)
+    await cache.set(key(1), b"audio")
+    created, size = cache._index[key(1)]
+    cache._index[key(1)] = (created - 61.0, size)
+
+    assert await cache.get(key(1)) is None
+    assert not cache._file(key(1)).exists()
+    assert cache._total_bytes == 0
+
+
+async def test_index_rebuilt_on_startup_oldest_first(tmp_path):
+    first = DiskTTSCache(tmp_path, max_bytes=30)
+    for n in range(3):
+        await first.set(key(n), bytes(10))
+        # Distinct mtimes so startup order is deterministic
+        stamp = time.time() - 100 + n
+        os.utime(first._file(key(n)), (stamp, stamp))
+
+    second = DiskTTSCache(tmp_path, max_bytes=30)
+    assert list(second._index) == [key(0), key(1), key(2)]
+    assert second._total_bytes == 30
+
+    await second.set(key(3), bytes(10))
+    assert not second._file(key(0)).exists()
+
+
+async def test_picks_up_entries_from_other_processes(tmp_path):
+    ours = DiskTTSCache(tmp_path)
+    theirs = DiskTTSCache(tmp_path)
+    await theirs.set(key(1), b"shared")
+
+    assert await ours.get(key(1)) == b"shared"
+    assert ours._total_bytes == len(b"shared")
+
+
+async def test_entry_removed_by_other_process(tmp_path):
+    ours = DiskTTSCache(tmp_path)
+    await ours.set(key(1), b"audio")
+    ours._file(key(1)).unlink()
+
+    assert await ours.get(key(1)) is None
+    assert key(1) not in ours._index
+    assert ours._total_bytes == 0
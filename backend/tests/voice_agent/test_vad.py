@@ -0,0 +1,53 @@
+"""Tests for the energy-based VAD."""
+import time
+
+import numpy as np
+import pytest
+
+from dialer.voice_agent.vad import SimpleVAD
+
+SAMPLE_RATE = 8000
+CHUNK_SAMPLES = 160  # 20 ms
+
+
+def tone_chunk(amplitude: int) -> bytes:
+    t = np.arange(CHUNK_SAMPLES) / SAMPLE_RATE
+    return (amplitude * np.sin(2 * np.pi * 440 * t)).astype('<i2').tobytes()
+
+
+SPEECH = tone_chunk(8000)
+SILENCE = bytes(CHUNK_SAMPLES * 2)
+
+
+def make_vad(**kwargs) -> SimpleVAD:
+    return SimpleVAD(sample_rate=SAMPLE_RATE, **kwargs)
+
+
+def test_batch_timestamps_not_in_future():
+    vad = make_vad()
+    vad.process_chunks([SPEECH] * 50)  # 1 s of speech
+
+    assert vad._speech_start <= time.monotonic()
+    assert vad.speech_duration == pytest.approx(1.0, abs=0.1)
+
+
+def test_batch_detects_utterance_end():
+    vad = make_vad(silence_duration=0.3, min_speech_duration=0.2)
+    chunks = [SILENCE] * 5 + [SPEECH] * 25 + [SILENCE] * 25
+
+    utterances = vad.process_chunks(chunks)
+
+    assert len(utterances) == 1
+    assert utterances[0].startswith(SPEECH * 25)
+    assert not vad.is_speaking
+
+
+def test_batch_then_live_chunk_keeps_silence_timing():
+    vad = make_vad(silence_duration=0.3, min_speech_duration=0.2)
+    # Speech followed by 0.2 s of silence from the backlog ...
+    assert vad.process_chunks([SPEECH] * 25 + [SILENCE] * 10) == []
+    # ... so one more live silent chunk ends the utterance only once
+    # 0.3 s of silence have passed since the backlog's silence began
+    assert vad.process_chunk(SILENCE) is None
+    time.sleep(0.15)
+    assert vad.process_chunk(SILENCE) is not None
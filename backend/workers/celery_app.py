@@ -8,6 +8,22 @@ from celery.schedules import crontab
 # Get Redis URL from environment
 REDIS_URL = os.getenv("REDIS_URL", "redis://localhost:6379/0")
 
+# Optional dedicated queue for the campaign housekeeping tasks. Unset, they
+# stay on the default queue; set it only where a worker consumes it
+# (celery worker -Q <name>), or campaign scheduling silently stops
+PERIODIC_QUEUE = os.getenv("CELERY_PERIODIC_QUEUE", "")
+
+
+def _periodic_routes() -> dict:
+    """Route the housekeeping tasks to PERIODIC_QUEUE, if one is configured."""
+    if not PERIODIC_QUEUE:
+        return {}
+    return {
+        f"workers.tasks.campaign_tasks.{name}": {"queue": PERIODIC_QUEUE}
+        for name in ("check_scheduled_campaigns", "check_campaign_end_times", "cleanup_stale_calls")
+    }
+
+
 # Create Celery app
 app = Celery(
     "autodialer",
@@ -32,6 +48,17 @@ app.conf.update(
     worker_prefetch_multiplier=1,
     task_acks_late=True,
     task_reject_on_worker_lost=True,
+    # Keep retrying the broker at startup (the default is changing in Celery 6)
+    broker_connection_retry_on_startup=True,
+    # The campaign housekeeping tasks only wait on (sync) database I/O, so
+    # they can run on their own queue, served by a thread-pool worker
+    # (celery-periodic in docker-compose) instead of tying up prefork
+    # processes. gevent isn't used: the email tasks run asyncio/asyncpg.
+    task_routes=_periodic_routes(),
+    # Keep the beat schedule in Redis instead of a local celerybeat-schedule
+    # file; RedBeat's lock also makes it safe to run more than one beat
+    beat_scheduler="redbeat.RedBeatScheduler",
+    redbeat_redis_url=REDIS_URL,
     # Beat schedule for periodic tasks
     beat_schedule={
         "check-scheduled-campaigns": {